@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+affected.py
+
+Run validation, lint, prompt tests and index checks for only the prompts a
+change touches.
+
+Changed paths come from a git diff (--base REF compares the merge base with
+HEAD, --staged uses the index for pre-commit, and by default the working
+tree, staged or not, is compared with HEAD) or are passed explicitly.
+Each path under prompts/<category>/<slug>/ marks that prompt directory as
+affected, whichever sibling changed (.md, .json, test.sh, test.toml);
+deleted and renamed prompts are affected on both sides so their index
+entries are checked for removal. Changes to shared inputs (the schema, the
+validators, index builders or this script) invalidate everything and fall
+back to the full-tree checks.
+
+Steps (all by default, or pick with --steps):
+  validate  schema + .md pairing for affected specs
+  lint      scripts/lint_prompts.py rules on affected specs
+  test      scripts/prompt_tests.py suites of affected prompts
+  index     compare (or with --write-index, splice) the affected entries of
+            prompts/index.json and tools/index.json; an edit to an index
+            file itself checks that whole index
+
+Usage:
+  python scripts/affected.py --base origin/main
+  python scripts/affected.py --staged --write-index
+  python scripts/affected.py --list --base origin/main
+  python scripts/affected.py prompts/writing/blog-outline/blog-outline.md
+"""
+import argparse
+import json
+import os
+import pathlib
+import subprocess
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import build_prompts_index
+import build_tools_index
+import catalog
+import lint_prompts
+import prompt_tests
+import schema_validate_prompts
+import token_estimate
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+STEPS = ("validate", "lint", "test", "index")
+
+# Shared inputs: a change to any of these can change every prompt's result.
+GLOBAL_INPUTS = (
+    "scripts/prompt.schema.json",
+    "scripts/schema_compiler.py",
+    "scripts/schema_validate_prompts.py",
+    "scripts/catalog.py",
+    "scripts/index_state.py",
+    "scripts/instrument.py",
+    "scripts/gitobjects.py",
+    "scripts/build_prompts_index.py",
+    "scripts/build_tools_index.py",
+    "scripts/token_estimate.py",
+    "scripts/prompt_tests.py",
+    "scripts/lint_prompts.py",
+    "scripts/lint_prompts.sh",
+    "scripts/affected.py",
+)
+INDEX_FILES = {
+    str(build_prompts_index.INDEX_PATH): "prompts",
+    str(build_tools_index.INDEX_PATH): "tools",
+}
+
+
+def git_changes(base: Optional[str] = None, staged: bool = False) -> List[str]:
+    """Paths added, modified, deleted or renamed (both sides) in the diff."""
+    cmd = ["git", "diff", "--name-status", "-M", "--no-color"]
+    if staged:
+        cmd.append("--cached")
+    elif base:
+        cmd.append(f"{base}...HEAD")
+    else:
+        # Working tree against HEAD: staged and unstaged edits alike.
+        cmd.append("HEAD")
+    out = subprocess.run(cmd, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise SystemExit(f"ERROR: {' '.join(cmd)} failed: {out.stderr.strip()}")
+    paths = []
+    for line in out.stdout.splitlines():
+        fields = line.split("\t")
+        paths.extend(fields[1:])
+    return paths
+
+
+class AffectedSet:
+    """Prompt directories touched by a set of changed paths."""
+
+    def __init__(self, paths: Iterable[str]):
+        self.paths = sorted(set(paths))
+        self.full = any(p in GLOBAL_INPUTS for p in self.paths)
+        self.indexes: Set[str] = {INDEX_FILES[p] for p in self.paths if p in INDEX_FILES}
+        self.dirs: Set[str] = set()
+        known = self._index_dirs()
+        for p in self.paths:
+            parts = pathlib.PurePosixPath(p).parts
+            if len(parts) < 3 or parts[0] != "prompts" or p in INDEX_FILES:
+                continue
+            parent = str(pathlib.PurePosixPath(p).parent)
+            # Files nested below a prompt folder belong to the nearest indexed folder.
+            while parent not in known and parent.count("/") > 2:
+                parent = str(pathlib.PurePosixPath(parent).parent)
+            self.dirs.add(parent)
+
+    @staticmethod
+    def _index_dirs() -> Set[str]:
+        dirs = set()
+        for index_path in (build_prompts_index.INDEX_PATH, build_tools_index.INDEX_PATH):
+            try:
+                entries = json.loads(index_path.read_text(encoding="utf-8")).get("prompts", [])
+            except (OSError, ValueError):
+                continue
+            dirs.update(str(pathlib.PurePosixPath(e["path"]).parent) for e in entries)
+        return dirs
+
+    def records(self) -> List[catalog.PromptRecord]:
+        """Parsed .md/.json pairs in the affected directories that still exist."""
+        out = []
+        for d in sorted(self.dirs, key=catalog._sort_key):
+            if not os.path.isdir(d):
+                continue
+            stems = sorted({os.path.splitext(n)[0] for n in os.listdir(d)
+                            if n.endswith((".md", ".json")) and n != catalog.INDEX_NAME})
+            out.extend(r for r in (catalog.load_record(d, s) for s in stems) if r is not None)
+        return out
+
+    def slugs(self) -> List[str]:
+        return sorted(pathlib.PurePosixPath(d).name for d in self.dirs)
+
+
+def run_validate(records: List[catalog.PromptRecord]) -> List[str]:
+    errors = []
+    for rec in records:
+        if rec.json_path is not None:
+            errors.extend(schema_validate_prompts.validate_file(str(rec.json_path))[1])
+    return errors
+
+
+def run_lint(records: List[catalog.PromptRecord]) -> List[str]:
+    specs = [str(r.json_path) for r in records if r.json_path is not None]
+    if not specs:
+        return []
+    return [i for issues, _fixed in lint_prompts.lint_paths(specs).values() for i in issues]
+
+
+def run_tests(dirs: Iterable[str]) -> List[str]:
+    suites = [d for d in sorted(dirs) if (pathlib.Path(d) / prompt_tests.ASSERTIONS_NAME).is_file()]
+    errors = []
+    for result in prompt_tests.run_all(suites):
+        if result.error:
+            errors.append(f"{result.path}: {result.error}")
+        errors.extend(f"{result.path}: {c.name}: {c.message}" for c in result.cases if not c.ok and not c.warn)
+    return errors
+
+
+def _fresh_entries(records: List[catalog.PromptRecord]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    prompts, tools = {}, {}
+    for rec in records:
+        if rec.spec is not None:
+            prompts[str(rec.json_path)] = build_prompts_index.entry_for(rec.json_path, rec.spec)
+        if rec.md_path is not None and "templates" not in pathlib.PurePath(rec.directory).parts:
+            tools[str(rec.md_path)] = build_tools_index.build_entry(rec.md_path, rec.md_text)
+    return {"prompts": prompts, "tools": tools}
+
+
+def run_index(affected: AffectedSet, records: List[catalog.PromptRecord], write: bool) -> List[str]:
+    """Check (or splice) the affected entries of both generated indexes."""
+    fresh = _fresh_entries(records)
+    errors = []
+    for name, index_path, builder in (("prompts", build_prompts_index.INDEX_PATH, "build_prompts_index.py"),
+                                      ("tools", build_tools_index.INDEX_PATH, "build_tools_index.py")):
+        if name in affected.indexes and not write:
+            # The index file itself was edited: only a full comparison is meaningful.
+            errors.extend(_full_index_drift(name))
+            continue
+        try:
+            committed = json.loads(index_path.read_text(encoding="utf-8")).get("prompts", [])
+        except (OSError, ValueError) as e:
+            errors.append(f"{index_path}: unreadable ({e}). Run: python scripts/{builder}")
+            continue
+        old = {e["path"]: e for e in committed if str(pathlib.PurePosixPath(e["path"]).parent) in affected.dirs}
+        new = fresh[name]
+        drift = sorted(p for p in old.keys() | new.keys() if old.get(p) != new.get(p))
+        if not drift:
+            continue
+        if write:
+            kept = [e for e in committed if e["path"] not in old]
+            entries = sorted(kept + list(new.values()), key=lambda e: catalog._sort_key(e["path"]))
+            (build_prompts_index if name == "prompts" else build_tools_index).write_index(entries)
+            print(f"Spliced {len(drift)} entr{'y' if len(drift) == 1 else 'ies'} into {index_path}")
+        else:
+            errors.append(f"{index_path}: drift for {', '.join(drift)}. Run: python scripts/{builder} and commit {index_path}")
+    token_estimate.MEMO.save()
+    return errors
+
+
+def _full_index_drift(name: str) -> List[str]:
+    cat = catalog.scan(catalog.PROMPTS_ROOT, skip_templates=(name == "tools"))
+    if name == "prompts":
+        entries = [build_prompts_index.entry_for(r.json_path, r.spec) for r in cat.specs() if r.spec is not None]
+        return catalog._index_drift(build_prompts_index.INDEX_PATH, entries, "build_prompts_index.py")
+    entries = [build_tools_index.build_entry(r.md_path, r.md_text) for r in cat.docs()]
+    return catalog._index_drift(build_tools_index.INDEX_PATH, entries, "build_tools_index.py")
+
+
+def run_full(steps: Tuple[str, ...], write_index: bool) -> int:
+    """Shared inputs changed: run every step over the whole tree."""
+    failed = 0
+    if "validate" in steps or "index" in steps:
+        failed |= catalog.check_all(write=write_index) != 0
+    if "lint" in steps:
+        failed |= lint_prompts.main([]) != 0
+    if "test" in steps:
+        failed |= prompt_tests.main([]) != 0
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate, lint, test and index only the prompts a change touches")
+    parser.add_argument("paths", nargs="*", help="Changed paths (default: git diff HEAD)")
+    parser.add_argument("--base", help="Diff the merge base with this ref against HEAD (e.g. origin/main)")
+    parser.add_argument("--staged", action="store_true", help="Use staged changes (pre-commit)")
+    parser.add_argument("--steps", default=",".join(STEPS), help=f"Comma-separated subset of {','.join(STEPS)}")
+    parser.add_argument("--write-index", action="store_true", help="Splice fresh entries into the indexes instead of checking")
+    parser.add_argument("--list", action="store_true", help="Print affected prompt directories and exit")
+    args = parser.parse_args(argv)
+
+    steps = tuple(s for s in args.steps.split(",") if s)
+    unknown = set(steps) - set(STEPS)
+    if unknown:
+        parser.error(f"unknown steps: {', '.join(sorted(unknown))}")
+    # Explicit paths are relative to the caller's cwd; git reports repo-relative ones.
+    explicit = [pathlib.Path(os.path.relpath(os.path.abspath(p), REPO_ROOT)).as_posix() for p in args.paths]
+    os.chdir(REPO_ROOT)
+    paths = explicit or git_changes(args.base, args.staged)
+    affected = AffectedSet(paths)
+
+    if args.list:
+        if affected.full:
+            print("ALL")
+        else:
+            for d in sorted(affected.dirs, key=catalog._sort_key):
+                print(d)
+        return 0
+    if affected.full:
+        print(f"Shared inputs changed ({', '.join(p for p in affected.paths if p in GLOBAL_INPUTS)}); checking every prompt.")
+        return run_full(steps, args.write_index)
+    if not affected.dirs and not affected.indexes:
+        print("No prompts affected.")
+        return 0
+
+    records = affected.records()
+    print(f"Affected: {', '.join(affected.slugs()) or '(index files only)'}")
+    failed = False
+    for step in steps:
+        if step == "validate":
+            errors = run_validate(records)
+        elif step == "lint":
+            errors = run_lint(records)
+        elif step == "test":
+            errors = run_tests(affected.dirs)
+        else:
+            errors = run_index(affected, records, args.write_index)
+        for e in errors:
+            print(f"  {e}", file=sys.stderr)
+        print(f"{'❌' if errors else '✅'} {step}: {len(errors)} issue(s)")
+        failed |= bool(errors)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+bench_catalog.py
+
+Benchmark harness for the hub tooling, with a synthetic catalog generator.
+
+`generate` writes a realistic catalog (prompts/<category>/<slug>/ with a
+schema-valid .json spec, a frontmatter .md doc and a test.sh) plus a copy of
+scripts/prompt.schema.json, so the real scripts can run against it unchanged.
+
+`run` generates one catalog per --sizes entry and times each pipeline stage
+as a fresh subprocess (cwd = the synthetic catalog), repeating --repeat
+times. Peak RSS comes from wait4() rusage of that child. Results are
+printed (or written with -o) as JSON for comparison across commits.
+
+Usage:
+  python scripts/bench_catalog.py generate --count 1000 --out /tmp/catalog
+  python scripts/bench_catalog.py run --sizes 100,1000,10000 --repeat 3 -o bench.json
+"""
+import argparse
+import json
+import os
+import pathlib
+import platform
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timezone
+from typing import Dict, List
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+SCRIPTS = REPO_ROOT / "scripts"
+TOOLS = REPO_ROOT / "tools"
+
+CATEGORIES = ["engineering", "product", "research", "writing", "meta", "audit", "software-architecture"]
+EFFORTS = ["minimal", "low", "medium", "high"]
+VERBOSITIES = ["low", "medium", "high"]
+VOCAB = (
+    "analyze architecture audit backlog baseline boundary cache compliance constraint context contract "
+    "coverage criteria decision dependency deployment design diff document evidence experiment feedback "
+    "finding gap governance guardrail hypothesis incident interface latency metric migration milestone "
+    "observability outcome pipeline policy priority quality refactor release requirement review risk "
+    "roadmap rollout schema security signal stakeholder strategy summary test threshold tradeoff "
+    "validation verification workflow"
+).split()
+GUARDRAILS = (
+    "# Rules & Guardrails\n- Do not reveal chain-of-thought; provide conclusions and brief rationale only.\n"
+    "- No fabrication; mark unknowns explicitly.\n- Prefer tables and terse bullets.\n"
+)
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(VOCAB) for _ in range(words)).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, sentences: int) -> str:
+    return " ".join(_sentence(rng, rng.randint(6, 16)) for _ in range(sentences))
+
+
+def generate(out: pathlib.Path, count: int, seed: int = 0) -> pathlib.Path:
+    """Write ``count`` synthetic prompts under out/prompts; returns out."""
+    rng = random.Random(seed)
+    (out / "scripts").mkdir(parents=True, exist_ok=True)
+    shutil.copy(SCRIPTS / "prompt.schema.json", out / "scripts" / "prompt.schema.json")
+    for i in range(count):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        slug = f"{rng.choice(VOCAB)}-{rng.choice(VOCAB)}-{i:06d}"
+        d = out / "prompts" / category / slug
+        d.mkdir(parents=True, exist_ok=True)
+        sections = "\n\n".join(f"# {rng.choice(VOCAB).title()}\n{_paragraph(rng, rng.randint(2, 6))}"
+                               for _ in range(rng.randint(3, 7)))
+        spec = {
+            "target_model": "gpt-5-thinking",
+            "parameters": {"reasoning_effort": rng.choice(EFFORTS), "verbosity": rng.choice(VERBOSITIES)},
+            "messages": [
+                {"role": "system", "content": f"# Role\nYou are a {rng.choice(VOCAB)} specialist.\n\n{GUARDRAILS}\n{sections}"},
+                {"role": "user", "content": f"{_paragraph(rng, 2)}\n\nInput: {{{{INPUT_{i % 5}}}}}\nContext: {{{{CONTEXT}}}}"},
+            ],
+            "version": f"1.{rng.randint(0, 9)}.{rng.randint(0, 20)}",
+            "assumptions": [_sentence(rng, 8) for _ in range(2)],
+        }
+        (d / f"{slug}.json").write_text(json.dumps(spec, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tags = sorted({category, *rng.sample(VOCAB, 3)})
+        md = (
+            f'---\ntitle: "{slug.replace("-", " ").title()}"\ntags: {json.dumps(tags)}\n'
+            f'author: "bench"\nlast_updated: "2025-01-{1 + i % 28:02d}"\n---\n\n'
+            f"# {slug} Prompt (About)\n\nSlug: {slug}  \nCategory: {category}\n\n"
+            f"## Purpose\n{_paragraph(rng, 3)}\n\n## Usage\n{_paragraph(rng, 4)}\n"
+        )
+        (d / f"{slug}.md").write_text(md, encoding="utf-8")
+        test = d / "test.sh"
+        test.write_text(f'#!/bin/bash\nset -e\njq empty "$(dirname "$0")/{slug}.json"\n', encoding="utf-8")
+        test.chmod(0o755)
+    return out
+
+
+def _stage_commands() -> Dict[str, List[str]]:
+    py = sys.executable
+    scan = f"import sys; sys.path.insert(0, {str(SCRIPTS)!r}); import catalog; catalog.scan()"
+    return {
+        "catalog_scan": [py, "-c", scan],
+        "build_tools_index": [py, str(SCRIPTS / "build_tools_index.py")],
+        "build_prompts_index": [py, str(SCRIPTS / "build_prompts_index.py")],
+        "build_prompts_index_incremental": [py, str(SCRIPTS / "build_prompts_index.py"), "--incremental"],
+        "schema_validate": [py, str(SCRIPTS / "schema_validate_prompts.py")],
+        "check_last_updated": [py, str(TOOLS / "check-last-updated.py")],
+    }
+
+
+def _git(cwd: pathlib.Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def stage_changes(out: pathlib.Path, fraction: float, seed: int = 0) -> int:
+    """Commit the catalog, then edit and stage bodies of a fraction of the docs."""
+    _git(out, "init", "-q")
+    _git(out, "add", "-A")
+    _git(out, "-c", "user.name=bench", "-c", "user.email=bench@example.invalid", "commit", "-qm", "baseline")
+    docs = sorted((out / "prompts").rglob("*.md"))
+    rng = random.Random(seed)
+    picked = rng.sample(docs, max(1, int(len(docs) * fraction))) if docs else []
+    today = date.today().isoformat()
+    for md in picked:
+        text = md.read_text(encoding="utf-8")
+        # Half bump last_updated (hook passes), half leave it stale (hook flags them).
+        if rng.random() < 0.5:
+            text = re.sub(r'^last_updated: ".*"$', f'last_updated: "{today}"', text, count=1, flags=re.MULTILINE)
+        md.write_text(text + f"\n{_sentence(rng, 10)}\n", encoding="utf-8")
+    _git(out, "add", "-A")
+    return len(picked)
+
+
+def measure(cmd: List[str], cwd: pathlib.Path) -> Dict[str, float]:
+    """Run one command; returns wall seconds, exit code and child peak RSS (KiB)."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _pid, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss  # bytes on macOS
+    return {"seconds": elapsed, "exit_code": proc.returncode, "peak_rss_kb": rss}
+
+
+def run(sizes: List[int], repeat: int, stages: List[str], fraction: float, seed: int, keep: bool) -> Dict:
+    commands = _stage_commands()
+    results = []
+    for size in sizes:
+        tmp = pathlib.Path(tempfile.mkdtemp(prefix=f"prompt-bench-{size}-"))
+        try:
+            t0 = time.perf_counter()
+            generate(tmp, size, seed)
+            gen_seconds = time.perf_counter() - t0
+            changed = stage_changes(tmp, fraction, seed) if "check_last_updated" in stages else 0
+            # Warm the incremental state so that stage measures a no-change run.
+            if "build_prompts_index_incremental" in stages:
+                measure(commands["build_prompts_index_incremental"], tmp)
+            for stage in stages:
+                runs = [measure(commands[stage], tmp) for _ in range(repeat)]
+                secs = [r["seconds"] for r in runs]
+                median = statistics.median(secs)
+                files = changed if stage == "check_last_updated" else size
+                results.append({
+                    "size": size,
+                    "stage": stage,
+                    "files": files,
+                    "repeat": repeat,
+                    "seconds": {"min": min(secs), "median": median, "max": max(secs)},
+                    "throughput_files_per_s": files / median if median else None,
+                    "peak_rss_kb": max(r["peak_rss_kb"] for r in runs),
+                    "exit_codes": sorted({r["exit_code"] for r in runs}),
+                })
+                print(f"{size:>8} {stage:<34} median {median * 1000:9.1f} ms  "
+                      f"rss {results[-1]['peak_rss_kb'] / 1024:7.1f} MiB", file=sys.stderr)
+            results.append({"size": size, "stage": "generate", "files": size, "seconds": {"median": gen_seconds}})
+        finally:
+            if keep:
+                print(f"Kept synthetic catalog: {tmp}", file=sys.stderr)
+            else:
+                shutil.rmtree(tmp, ignore_errors=True)
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "meta": {
+            "commit": commit or None,
+            "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "seed": seed,
+            "changed_fraction": fraction,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hub tooling against synthetic catalogs")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_gen = sub.add_parser("generate", help="Write a synthetic catalog")
+    p_gen.add_argument("--count", type=int, required=True)
+    p_gen.add_argument("--out", type=pathlib.Path, required=True)
+    p_gen.add_argument("--seed", type=int, default=0)
+    p_run = sub.add_parser("run", help="Time every stage across catalog sizes")
+    p_run.add_argument("--sizes", default="100,1000", help="Comma-separated prompt counts (default: 100,1000)")
+    p_run.add_argument("--repeat", type=int, default=3)
+    p_run.add_argument("--stages", default=",".join(_stage_commands()), help="Comma-separated stage names")
+    p_run.add_argument("--changed-fraction", type=float, default=0.05,
+                       help="Share of docs edited and staged for check_last_updated (default: 0.05)")
+    p_run.add_argument("--seed", type=int, default=0)
+    p_run.add_argument("--keep", action="store_true", help="Keep generated catalogs for inspection")
+    p_run.add_argument("-o", "--output", type=pathlib.Path, help="Write JSON results here instead of stdout")
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        generate(args.out, args.count, args.seed)
+        print(f"Wrote {args.count} synthetic prompts under {args.out / 'prompts'}")
+        return
+    stages = [s for s in args.stages.split(",") if s]
+    unknown = set(stages) - set(_stage_commands())
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+    report = run([int(s) for s in args.sizes.split(",")], args.repeat, stages, args.changed_fraction, args.seed, args.keep)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
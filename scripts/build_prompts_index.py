@@ -1,20 +1,39 @@
 #!/usr/bin/env python3
-import json, pathlib, hashlib, sys
-root = pathlib.Path('prompts')
-index = []
-for jf in root.rglob('*.json'):
-    # Skip index.json (catalog) to avoid circular dependency
-    if jf.name == 'index.json':
-        continue
-    try:
-        data = json.loads(jf.read_text())
-    except Exception as e:
-        print(f"WARN: skip {jf}: {e}", file=sys.stderr)
-        continue
+"""Regenerate prompts/index.json from the prompt JSON specs.
+
+With --incremental, only specs whose mtime/size (and then raw content hash)
+changed since the last build are re-parsed and re-hashed and spliced into
+the existing index; unchanged entries are reused as-is. Entries are ordered
+by path (catalog order). The index is left untouched when nothing changed.
+
+Each entry carries offline token/byte estimates (scripts/token_estimate.py),
+memoized by content hash so unchanged specs are never re-counted.
+"""
+import argparse, json, pathlib, hashlib, sys
+
+import catalog
+import instrument
+import token_estimate
+from index_state import STATE_DIR, IndexState
+
+INDEX_PATH = pathlib.Path('prompts/index.json')
+
+
+def list_specs(root):
+    # Skips index.json (catalog) to avoid circular dependency
+    return catalog.list_files(root, '.json', skip_templates=False)
+
+
+def build_entry(jf, raw):
+    return entry_for(jf, json.loads(raw))
+
+
+def entry_for(jf, data):
     slug = jf.stem
     category = jf.parent.name
-    h = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()[:12]
-    index.append({
+    with instrument.span("hash spec"):
+        h = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()[:12]
+    entry = {
         "slug": slug,
         "category": category,
         "path": str(jf),
@@ -22,8 +41,80 @@ for jf in root.rglob('*.json'):
         "model": data.get("target_model"),
         "reasoning_effort": data.get("parameters", {}).get("reasoning_effort"),
         "verbosity": data.get("parameters", {}).get("verbosity")
-    })
-index_path = pathlib.Path('prompts/index.json')
-index_path.parent.mkdir(parents=True, exist_ok=True)
-index_path.write_text(json.dumps({"prompts": index}, separators=(',',':')) + '\n')
-print(f"Wrote {index_path} with {len(index)} entries")
+    }
+    with instrument.span("token estimate"):
+        entry.update(token_estimate.MEMO.get(h, data))
+    return entry
+
+
+def scan(root, state):
+    index = []
+    for rec in catalog.scan(root, skip_templates=False).specs():
+        if rec.spec is None:
+            print(f"WARN: skip {rec.json_path}: {rec.spec_error}", file=sys.stderr)
+            continue
+        index.append(entry_for(rec.json_path, rec.spec))
+        state.record(rec.json_path, rec.json_raw)
+    return index
+
+
+def splice(root, previous, state):
+    """Re-parse changed specs in place; returns (index, changed_count)."""
+    known = {e["path"]: e for e in previous}
+    index = []
+    changed = 0
+    for jf in list_specs(root):
+        try:
+            unchanged, raw = state.check(jf)
+            if unchanged and str(jf) in known:
+                index.append(known[str(jf)])
+                continue
+            index.append(build_entry(jf, raw if raw is not None else jf.read_bytes()))
+        except Exception as e:
+            print(f"WARN: skip {jf}: {e}", file=sys.stderr)
+            # Keep the file out of the index and force a re-check next run.
+            state.files.pop(str(jf), None)
+        changed += 1
+    changed += len(state.prune())
+    return index, changed
+
+
+def write_index(index):
+    INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with instrument.span("write index"):
+        INDEX_PATH.write_text(json.dumps({"prompts": index}, separators=(',',':')) + '\n')
+    instrument.wrote(INDEX_PATH)
+    return INDEX_PATH
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate prompts/index.json from prompt JSON specs")
+    parser.add_argument('--incremental', action='store_true',
+                        help='Re-parse only specs changed since the last build and splice them into the index')
+    instrument.add_arguments(parser)
+    args = parser.parse_args()
+    instrument.start(args, "build_prompts_index")
+
+    root = pathlib.Path('prompts')
+    state = IndexState(STATE_DIR / 'prompts_index.state.json', INDEX_PATH)
+    if args.incremental and state.valid:
+        previous = json.loads(INDEX_PATH.read_text()).get("prompts", [])
+        with instrument.span("splice"):
+            index, changed = splice(root, previous, state)
+        if not changed:
+            state.save()
+            print(f"{INDEX_PATH} is up to date ({len(index)} entries)")
+            return
+    else:
+        index = scan(root, state)
+        changed = len(index)
+    write_index(index)
+    with instrument.span("save state"):
+        state.save()
+    with instrument.span("save token memo"):
+        token_estimate.MEMO.save(keep=[e["hash"] for e in index])
+    print(f"Wrote {INDEX_PATH} with {len(index)} entries ({changed} re-parsed)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+build_search_index.py
+
+Build the persistent inverted index used by tools/search.py.
+
+Documents are taken from tools/index.json (markdown metadata) joined with
+prompts/index.json (JSON specs). Each document is tokenized from its title,
+tags, markdown body and JSON message contents into weighted posting lists,
+and the result is written minified to .cache/search_index.json.
+
+tools/search.py rebuilds the index on demand whenever either source index
+changes, so running this script by hand is only needed to warm the cache.
+"""
+import json
+import math
+import pathlib
+import re
+import sys
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import instrument
+
+INDEX_VERSION = 3
+INDEX_PATH = pathlib.Path(".cache") / "search_index.json"
+SOURCES = (pathlib.Path("tools") / "index.json", pathlib.Path("prompts") / "index.json")
+
+# Per-field term frequency weights (a simplified BM25F).
+FIELD_WEIGHTS = {"title": 3, "tags": 2, "body": 1, "messages": 1}
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+FRONTMATTER_RE = re.compile(r"^---\n.*?\n---\n", re.DOTALL)
+STOPWORDS = frozenset(
+    "a an and are as at be by for from if in into is it of on or that the this to was were will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, dropping stopwords and single characters."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def _source_stamp(root: pathlib.Path) -> Dict[str, List[int]]:
+    stamp = {}
+    for rel in SOURCES:
+        try:
+            st = (root / rel).stat()
+        except OSError:
+            continue
+        stamp[str(rel)] = [st.st_mtime_ns, st.st_size]
+    return stamp
+
+
+def _load_json(path: pathlib.Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        print(f"WARN: Could not read {path}: {e}", file=sys.stderr)
+        return None
+
+
+def _read_body(path: pathlib.Path) -> str:
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return ""
+    return FRONTMATTER_RE.sub("", text, count=1)
+
+
+def _read_messages(path: pathlib.Path) -> str:
+    data = _load_json(path) if path.exists() else None
+    if not data:
+        return ""
+    return "\n".join(m.get("content", "") for m in data.get("messages", []) if isinstance(m, dict))
+
+
+def collect_documents(root: pathlib.Path) -> List[Dict[str, Any]]:
+    """Join tools/index.json and prompts/index.json into one document list."""
+    tools_index = _load_json(root / SOURCES[0]) or {}
+    prompts_index = _load_json(root / SOURCES[1]) or {}
+    specs = {str(pathlib.PurePosixPath(e["path"]).with_suffix("")): e for e in prompts_index.get("prompts", [])}
+
+    docs = []
+    for entry in tools_index.get("prompts", []):
+        stem = str(pathlib.PurePosixPath(entry["path"]).with_suffix(""))
+        spec = specs.pop(stem, None)
+        docs.append({
+            "path": entry["path"],
+            "title": entry.get("title") or "",
+            "tags": entry.get("tags") or [],
+            "category": entry.get("category", ""),
+            "last_updated": entry.get("last_updated", ""),
+            "author": entry.get("author", ""),
+            "slug": spec["slug"] if spec else pathlib.PurePosixPath(stem).name,
+            "spec": spec["path"] if spec else None,
+            "model": spec.get("model") if spec else None,
+            "reasoning_effort": spec.get("reasoning_effort") if spec else None,
+            "verbosity": spec.get("verbosity") if spec else None,
+            "tokens": spec.get("tokens") if spec else None,
+            "bytes": spec.get("bytes") if spec else None,
+        })
+    # JSON specs without a markdown doc are still searchable by their messages.
+    for stem, spec in sorted(specs.items()):
+        docs.append({
+            "path": spec["path"],
+            "title": spec["slug"],
+            "tags": [],
+            "category": pathlib.PurePosixPath(stem).parts[1] if stem.startswith("prompts/") else "",
+            "last_updated": "",
+            "author": "",
+            "slug": spec["slug"],
+            "spec": spec["path"],
+            "model": spec.get("model"),
+            "reasoning_effort": spec.get("reasoning_effort"),
+            "verbosity": spec.get("verbosity"),
+            "tokens": spec.get("tokens"),
+            "bytes": spec.get("bytes"),
+        })
+    return docs
+
+
+def document_terms(title: str, tags: List[str], body: str, messages: str) -> Counter:
+    """Field-weighted term frequencies for one document."""
+    fields = {"title": title, "tags": " ".join(tags), "body": body, "messages": messages}
+    tf: Counter = Counter()
+    for name, text in fields.items():
+        weight = FIELD_WEIGHTS[name]
+        for token in tokenize(text):
+            tf[token] += weight
+    return tf
+
+
+def build_index(root: pathlib.Path) -> Dict[str, Any]:
+    """Tokenize every document and build weighted posting lists."""
+    docs = collect_documents(root)
+    postings: Dict[str, List[int]] = {}
+    total_len = 0
+    for doc_id, doc in enumerate(docs):
+        tf = document_terms(
+            doc["title"],
+            doc["tags"],
+            _read_body(root / doc["path"]) if doc["path"].endswith(".md") else "",
+            _read_messages(root / doc["spec"]) if doc["spec"] else "",
+        )
+        doc["len"] = sum(tf.values())
+        total_len += doc["len"]
+        for token, freq in tf.items():
+            postings.setdefault(token, []).extend((doc_id, freq))
+    return {
+        "version": INDEX_VERSION,
+        "sources": _source_stamp(root),
+        "avgdl": total_len / len(docs) if docs else 0.0,
+        "docs": docs,
+        "postings": dict(sorted(postings.items())),
+    }
+
+
+def write_index(index: Dict[str, Any], root: pathlib.Path) -> pathlib.Path:
+    path = root / INDEX_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(index, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+    return path
+
+
+def load_index(root: pathlib.Path, rebuild: bool = True) -> Optional[Dict[str, Any]]:
+    """Load the cached index, rebuilding it if missing or stale.
+
+    Freshness is a stat() of the two source indexes, so a warm lookup costs
+    one JSON load of the cache file.
+    """
+    path = root / INDEX_PATH
+    try:
+        index = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        index = None
+    stamp = _source_stamp(root)
+    if index and index.get("version") == INDEX_VERSION and index.get("sources") == stamp:
+        return index
+    if not rebuild or not stamp:
+        return None
+    with instrument.span("build search index"):
+        index = build_index(root)
+    try:
+        instrument.wrote(write_index(index, root))
+    except OSError as e:
+        print(f"WARN: Could not write {path}: {e}", file=sys.stderr)
+    return index
+
+
+def _postings(index: Dict[str, Any], term: str) -> Dict[int, int]:
+    flat = index["postings"].get(term, [])
+    return dict(zip(flat[::2], flat[1::2]))
+
+
+def rank(plists: List[Dict[Any, int]], doc_len: Callable[[Any], int], n: int, avgdl: float) -> Dict[Any, float]:
+    """BM25 scores for documents present in every posting list (AND semantics)."""
+    if not plists:
+        return {}
+    plists = sorted(plists, key=len)
+    candidates = set(plists[0])
+    for plist in plists[1:]:
+        candidates.intersection_update(plist)
+        if not candidates:
+            return {}
+    avgdl = avgdl or 1.0
+    scores = dict.fromkeys(candidates, 0.0)
+    for plist in plists:
+        idf = math.log(1 + (n - len(plist) + 0.5) / (len(plist) + 0.5))
+        for doc_id in candidates:
+            tf = plist[doc_id]
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_len(doc_id) / avgdl)
+            scores[doc_id] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+    return scores
+
+
+def query(index: Dict[str, Any], text: str, limit: Optional[int] = None) -> List[Tuple[float, Dict[str, Any]]]:
+    """Return (score, doc) pairs for documents containing every query term, best first."""
+    terms = list(dict.fromkeys(tokenize(text)))
+    if not terms:
+        return []
+    docs = index["docs"]
+    scores = rank([_postings(index, t) for t in terms], lambda i: docs[i]["len"], len(docs), index["avgdl"])
+    ranked = sorted(scores.items(), key=lambda kv: (-kv[1], docs[kv[0]]["path"]))
+    if limit is not None:
+        ranked = ranked[:limit]
+    return [(round(score, 4), docs[doc_id]) for doc_id, score in ranked]
+
+
+def main():
+    root = pathlib.Path(".")
+    if not (root / SOURCES[0]).exists():
+        print(f"Error: {SOURCES[0]} not found. Run scripts/build_tools_index.py first.", file=sys.stderr)
+        sys.exit(1)
+    index = build_index(root)
+    path = write_index(index, root)
+    print(f"Wrote {path} with {len(index['docs'])} documents and {len(index['postings'])} terms")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,51 +3,26 @@
 build_tools_index.py
 
 Regenerate tools/index.json from markdown prompt files with YAML frontmatter.
-This script scans all .md files in the prompts/ directory, extracts their frontmatter,
-and writes a fresh tools/index.json.
+This script scans all .md files in the prompts/ directory (via scripts/catalog.py),
+extracts their frontmatter, and writes a fresh tools/index.json.
+
+With --incremental, only markdown files whose mtime/size (and then content
+hash) changed since the last build are re-parsed and spliced into the
+existing index; the index is left untouched when nothing changed.
 """
+import argparse
 import json
 import pathlib
-import re
 import sys
 from datetime import datetime, timezone
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
-FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---\n", re.DOTALL)
+import catalog
+import instrument
+from catalog import extract_frontmatter
+from index_state import STATE_DIR, IndexState
 
-def extract_frontmatter(text: str) -> Dict[str, Any]:
-    """Extract YAML frontmatter from markdown text."""
-    m = FRONTMATTER_RE.match(text)
-    if not m:
-        return {}
-    raw = m.group(1)
-    meta = {}
-    current_key = None
-    for line in raw.splitlines():
-        if not line.strip():
-            continue
-        if re.match(r"^[a-zA-Z0-9_]+:", line):
-            key, val = line.split(":", 1)
-            key = key.strip()
-            val = val.strip()
-            if val.startswith("[") and val.endswith("]"):
-                # Parse array: ["item1", "item2", "item3"]
-                items = [x.strip().strip('"').strip("'") for x in val[1:-1].split(",") if x.strip()]
-                meta[key] = items
-            else:
-                # Remove quotes if present
-                meta[key] = val.strip('"').strip("'")
-            current_key = key
-        elif re.match(r"^\s*-\s", line) and current_key:
-            # Handle multi-line array format:
-            # key:
-            #   - item1
-            #   - item2
-            dash_index = line.find("-")
-            if current_key not in meta:
-                meta[current_key] = []
-            meta[current_key].append(line[dash_index + 1:].strip())
-    return meta
+INDEX_PATH = pathlib.Path("tools") / "index.json"
 
 def extract_metadata_from_content(text: str) -> Dict[str, Any]:
     """Extract metadata from markdown content structure for files without frontmatter."""
@@ -78,93 +53,136 @@ def extract_metadata_from_content(text: str) -> Dict[str, Any]:
     
     return meta
 
-def scan_prompts(root: pathlib.Path) -> List[Dict[str, Any]]:
+def build_entry(path: pathlib.Path, content: str) -> Dict[str, Any]:
+    """Build one index entry from a markdown file's content."""
+    # Extract frontmatter once
+    meta = extract_frontmatter(content)
+    # Always compute content-derived metadata once; use as fallback only
+    content_meta = extract_metadata_from_content(content)
+
+    # Determine category from the first subdirectory under 'prompts'
+    # e.g., prompts/engineering/code-review/file.md -> category = 'engineering'
+    parts = list(path.parts)
+    try:
+        p_idx = parts.index("prompts")
+        category = parts[p_idx + 1] if len(parts) > p_idx + 1 else "uncategorized"
+    except ValueError:
+        category = "uncategorized"
+    
+    # Warn if frontmatter or content category mismatches parent directory
+    fm_category = meta.get("category")
+    content_category = content_meta.get("category")
+    expected_category = category
+    if fm_category and fm_category != expected_category:
+        print(
+            f"WARN: {path} frontmatter category '{fm_category}' does not match directory '{expected_category}'",
+            file=sys.stderr,
+        )
+    if content_category and content_category != expected_category:
+        print(
+            f"WARN: {path} content-derived category '{content_category}' does not match directory '{expected_category}'",
+            file=sys.stderr,
+        )
+
+    # Get title from frontmatter or content
+    title = meta.get("title", content_meta.get("title", ""))
+    
+    # For files without complete metadata, generate some reasonable defaults
+    tags = meta.get("tags", [category] if category != "uncategorized" else [])
+    if isinstance(tags, str):
+        tags = [tags]  # Ensure tags is always a list
+        
+    return {
+        "path": str(path),
+        "title": title,
+        "tags": tags,
+        "category": category,
+        "last_updated": meta.get("last_updated", ""),
+        "author": meta.get("author", ""),
+    }
+
+def scan_prompts(root: pathlib.Path, state: Optional[IndexState] = None) -> List[Dict[str, Any]]:
     """Scan all markdown files in prompts directory and extract metadata."""
     results = []
-    for path in sorted(root.rglob("*.md")):
-        # Skip template files
-        if "templates" in path.parts:
-            continue
-        
+    for rec in catalog.scan(root).docs():
+        if state is not None:
+            state.record(rec.md_path, rec.md_text.encode("utf-8"))
+        with instrument.span("build entry"):
+            results.append(build_entry(rec.md_path, rec.md_text))
+    return results
+
+def splice_prompts(root: pathlib.Path, previous: List[Dict[str, Any]], state: IndexState) -> Tuple[List[Dict[str, Any]], int]:
+    """Re-parse only changed/added files and splice them into the previous entries.
+
+    Returns the new entry list and the number of entries added, changed or removed.
+    """
+    by_path = {e["path"]: e for e in previous}
+    results = []
+    changed = 0
+    for path in catalog.list_files(root, ".md"):
         try:
-            content = path.read_text(encoding="utf-8")
+            unchanged, data = state.check(path)
+            if unchanged and str(path) in by_path:
+                results.append(by_path[str(path)])
+                continue
+            content = (data if data is not None else path.read_bytes()).decode("utf-8")
         except Exception as e:
             print(f"WARN: Could not read {path}: {e}", file=sys.stderr)
             continue
-        # Extract frontmatter once
-        meta = extract_frontmatter(content)
-        # Always compute content-derived metadata once; use as fallback only
-        content_meta = extract_metadata_from_content(content)
-
-        # Determine category from the first subdirectory under 'prompts'
-        # e.g., prompts/engineering/code-review/file.md -> category = 'engineering'
-        parts = list(path.parts)
-        try:
-            p_idx = parts.index("prompts")
-            category = parts[p_idx + 1] if len(parts) > p_idx + 1 else "uncategorized"
-        except ValueError:
-            category = "uncategorized"
-        
-        # Warn if frontmatter or content category mismatches parent directory
-        fm_category = meta.get("category")
-        content_category = content_meta.get("category")
-        expected_category = category
-        if fm_category and fm_category != expected_category:
-            print(
-                f"WARN: {path} frontmatter category '{fm_category}' does not match directory '{expected_category}'",
-                file=sys.stderr,
-            )
-        if content_category and content_category != expected_category:
-            print(
-                f"WARN: {path} content-derived category '{content_category}' does not match directory '{expected_category}'",
-                file=sys.stderr,
-            )
-
-        # Get title from frontmatter or content
-        title = meta.get("title", content_meta.get("title", ""))
-        
-        # For files without complete metadata, generate some reasonable defaults
-        tags = meta.get("tags", [category] if category != "uncategorized" else [])
-        if isinstance(tags, str):
-            tags = [tags]  # Ensure tags is always a list
-            
-        results.append({
-            "path": str(path),
-            "title": title,
-            "tags": tags,
-            "category": category,
-            "last_updated": meta.get("last_updated", ""),
-            "author": meta.get("author", ""),
-        })
-    
-    return results
+        with instrument.span("build entry"):
+            results.append(build_entry(path, content))
+        changed += 1
+    changed += len(state.prune())
+    return results, changed
+
+def write_index(prompts: List[Dict[str, Any]]) -> pathlib.Path:
+    """Write tools/index.json (minified, no trailing newline)."""
+    index_data = {
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "prompts": prompts
+    }
+    INDEX_PATH.parent.mkdir(exist_ok=True)
+    with instrument.span("write index"), open(INDEX_PATH, 'w', encoding='utf-8') as f:
+        # Minified JSON output (no pretty-printing, no trailing newline)
+        json.dump(index_data, f, ensure_ascii=False, separators=(",", ":"))
+    instrument.wrote(INDEX_PATH)
+    return INDEX_PATH
 
 def main():
     """Main function to regenerate tools/index.json."""
+    parser = argparse.ArgumentParser(description="Regenerate tools/index.json from prompt markdown")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Re-parse only files changed since the last build and splice them into the index")
+    instrument.add_arguments(parser)
+    args = parser.parse_args()
+    instrument.start(args, "build_tools_index")
+
     root = pathlib.Path("prompts")
     if not root.exists():
         print("Error: prompts directory not found.", file=sys.stderr)
         sys.exit(1)
     
-    # Scan all markdown files
-    prompts = scan_prompts(root)
-    
-    # Generate index data
-    index_data = {
-        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "prompts": prompts
-    }
-    
-    # Write to tools/index.json
-    tools_dir = pathlib.Path("tools")
-    tools_dir.mkdir(exist_ok=True)
-    index_path = tools_dir / "index.json"
+    index_path = INDEX_PATH
+    state = IndexState(STATE_DIR / "tools_index.state.json", index_path)
+
+    if args.incremental and state.valid:
+        previous = json.loads(index_path.read_text(encoding="utf-8")).get("prompts", [])
+        with instrument.span("splice"):
+            prompts, changed = splice_prompts(root, previous, state)
+        if not changed:
+            state.save()
+            print(f"{index_path} is up to date ({len(prompts)} entries)")
+            return
+    else:
+        # Scan all markdown files
+        prompts = scan_prompts(root, state)
+        changed = len(prompts)
     
-    with open(index_path, 'w', encoding='utf-8') as f:
-        # Minified JSON output (no pretty-printing, no trailing newline)
-        json.dump(index_data, f, ensure_ascii=False, separators=(",", ":"))
+    write_index(prompts)
+    with instrument.span("save state"):
+        state.save()
     
-    print(f"Wrote {index_path} with {len(prompts)} entries")
+    print(f"Wrote {index_path} with {len(prompts)} entries ({changed} re-parsed)")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
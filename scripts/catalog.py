@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+catalog.py
+
+Single-pass prompt catalog scanner shared by the hub scripts.
+
+One os.scandir walk over prompts/ groups files by directory and parses each
+<name>.md / <name>.json pair once into a PromptRecord. The index builders,
+schema validator, stray detector, search and pre-commit hooks all consume
+this module instead of walking the tree and parsing frontmatter themselves.
+
+Usage:
+  python scripts/catalog.py check-all           # validate + pair + stray + index drift check
+  python scripts/catalog.py check-all --write   # same, but rewrite both indexes
+"""
+import argparse
+import json
+import os
+import pathlib
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import instrument
+
+PROMPTS_ROOT = pathlib.Path("prompts")
+INDEX_NAME = "index.json"
+
+FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---\n", re.DOTALL)
+_KEY_RE = re.compile(r"^[a-zA-Z0-9_]+:")
+_ITEM_RE = re.compile(r"^\s*-\s")
+
+
+def parse_frontmatter(text: str) -> Tuple[Dict[str, Any], str]:
+    """Split markdown into (frontmatter metadata, body).
+
+    Handles ``key: value``, inline ``[a, b]`` arrays and multi-line
+    ``- item`` arrays. Text without frontmatter returns ({}, text).
+    """
+    m = FRONTMATTER_RE.match(text)
+    if not m:
+        return {}, text
+    meta: Dict[str, Any] = {}
+    current_key = None
+    for line in m.group(1).splitlines():
+        if not line.strip():
+            continue
+        if _KEY_RE.match(line):
+            key, val = line.split(":", 1)
+            key = key.strip()
+            val = val.strip()
+            if val.startswith("[") and val.endswith("]"):
+                meta[key] = [x.strip().strip('"').strip("'") for x in val[1:-1].split(",") if x.strip()]
+            else:
+                meta[key] = val.strip('"').strip("'")
+            current_key = key
+        elif _ITEM_RE.match(line) and current_key:
+            # Multi-line array format:
+            # key:
+            #   - item1
+            dash_index = line.find("-")
+            value = meta.get(current_key)
+            if not isinstance(value, list):
+                value = meta[current_key] = []
+            value.append(line[dash_index + 1:].strip())
+    return meta, text[m.end():]
+
+
+def extract_frontmatter(text: str) -> Dict[str, Any]:
+    """Extract YAML frontmatter from markdown text."""
+    return parse_frontmatter(text)[0]
+
+
+def _sort_key(path: str) -> Tuple[str, ...]:
+    # Match pathlib ordering (component-wise) so output is stable across tools.
+    return tuple(path.split("/"))
+
+
+def walk(root: pathlib.Path = PROMPTS_ROOT) -> Iterator[Tuple[str, List[os.DirEntry]]]:
+    """Yield (directory, file entries) for every directory under root, sorted."""
+    stack = [str(root)]
+    while stack:
+        top = stack.pop()
+        try:
+            with os.scandir(top) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as e:
+            print(f"WARN: Could not scan {top}: {e}", file=sys.stderr)
+            continue
+        files = [e for e in entries if e.is_file()]
+        instrument.count("dirs_scanned")
+        instrument.count("files_scanned", len(entries))
+        if files:
+            yield top, files
+        stack.extend(os.path.join(top, e.name) for e in reversed(entries) if e.is_dir())
+
+
+def list_files(root: pathlib.Path = PROMPTS_ROOT, suffix: str = ".md", skip_templates: bool = True) -> List[pathlib.Path]:
+    """Paths of files with ``suffix`` under root in catalog order, without reading them."""
+    out = []
+    for top, files in walk(root):
+        if skip_templates and "templates" in pathlib.PurePath(top).parts:
+            continue
+        for e in files:
+            if e.name.endswith(suffix) and not (suffix == ".json" and e.name == INDEX_NAME):
+                out.append(os.path.join(top, e.name))
+    return [pathlib.Path(p) for p in sorted(out, key=_sort_key)]
+
+
+def load_spec(raw: bytes) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Parse a JSON spec; returns (data, error)."""
+    try:
+        return json.loads(raw), None
+    except Exception as e:
+        return None, str(e)
+
+
+def category_of(directory: str) -> str:
+    """Top-level category directory (prompts/<category>/...)."""
+    parts = pathlib.PurePath(directory).parts
+    try:
+        idx = parts.index("prompts")
+        return parts[idx + 1] if len(parts) > idx + 1 else "uncategorized"
+    except ValueError:
+        return "uncategorized"
+
+
+@dataclass
+class PromptRecord:
+    """One prompt directory entry: a <name>.md doc and/or <name>.json spec."""
+
+    name: str
+    directory: str
+    md_path: Optional[pathlib.Path] = None
+    json_path: Optional[pathlib.Path] = None
+    test_path: Optional[pathlib.Path] = None
+    md_text: Optional[str] = None
+    meta: Dict[str, Any] = field(default_factory=dict)
+    body: str = ""
+    json_raw: Optional[bytes] = None
+    spec: Optional[Dict[str, Any]] = None
+    spec_error: Optional[str] = None
+
+    @property
+    def category(self) -> str:
+        return category_of(self.directory)
+
+
+@dataclass
+class Catalog:
+    root: pathlib.Path
+    records: List[PromptRecord]
+
+    def docs(self) -> List[PromptRecord]:
+        return [r for r in self.records if r.md_path is not None]
+
+    def specs(self) -> List[PromptRecord]:
+        return [r for r in self.records if r.json_path is not None]
+
+    def by_slug(self) -> Dict[str, PromptRecord]:
+        return {r.name: r for r in self.specs()}
+
+
+def _read_record(rec: PromptRecord) -> None:
+    if rec.md_path is not None:
+        try:
+            with instrument.span("read .md"):
+                rec.md_text = rec.md_path.read_text(encoding="utf-8")
+        except Exception as e:
+            print(f"WARN: Could not read {rec.md_path}: {e}", file=sys.stderr)
+            rec.md_path = None
+        else:
+            instrument.count("files_read")
+            if instrument.TRACER.enabled:
+                instrument.count("bytes_read", len(rec.md_text.encode("utf-8")))
+            with instrument.span("parse frontmatter"):
+                rec.meta, rec.body = parse_frontmatter(rec.md_text)
+    if rec.json_path is not None:
+        try:
+            with instrument.span("read .json"):
+                rec.json_raw = rec.json_path.read_bytes()
+        except OSError as e:
+            rec.spec_error = str(e)
+        else:
+            instrument.count("files_read")
+            instrument.count("bytes_read", len(rec.json_raw))
+            with instrument.span("parse json"):
+                rec.spec, rec.spec_error = load_spec(rec.json_raw)
+
+
+def load_record(directory: str, name: str) -> Optional[PromptRecord]:
+    """Read one <directory>/<name>.md/.json pair; None if neither file exists."""
+    rec = PromptRecord(name=name, directory=directory)
+    base = pathlib.Path(directory)
+    if (base / f"{name}.md").is_file():
+        rec.md_path = base / f"{name}.md"
+    if (base / f"{name}.json").is_file() and f"{name}.json" != INDEX_NAME:
+        rec.json_path = base / f"{name}.json"
+    if rec.md_path is None and rec.json_path is None:
+        return None
+    if (base / "test.sh").is_file():
+        rec.test_path = base / "test.sh"
+    _read_record(rec)
+    return rec
+
+
+def scan(root: pathlib.Path = PROMPTS_ROOT, skip_templates: bool = True) -> Catalog:
+    """Walk root once and parse every .md/.json pair into PromptRecords."""
+    records: Dict[Tuple[str, str], PromptRecord] = {}
+    with instrument.span("catalog.walk"):
+        _group(root, skip_templates, records)
+    ordered = sorted(records.values(), key=lambda r: _sort_key(os.path.join(r.directory, r.name)))
+    with instrument.span("catalog.read", records=len(ordered)):
+        for rec in ordered:
+            _read_record(rec)
+    return Catalog(root=root, records=ordered)
+
+
+def _group(root: pathlib.Path, skip_templates: bool, records: Dict[Tuple[str, str], PromptRecord]) -> None:
+    for top, files in walk(root):
+        if skip_templates and "templates" in pathlib.PurePath(top).parts:
+            continue
+        has_test = any(e.name == "test.sh" for e in files)
+        for e in files:
+            stem, ext = os.path.splitext(e.name)
+            if ext not in (".md", ".json") or (ext == ".json" and e.name == INDEX_NAME):
+                continue
+            rec = records.get((top, stem))
+            if rec is None:
+                rec = records[(top, stem)] = PromptRecord(name=stem, directory=top)
+                if has_test:
+                    rec.test_path = pathlib.Path(top) / "test.sh"
+            path = pathlib.Path(top) / e.name
+            if ext == ".md":
+                rec.md_path = path
+            else:
+                rec.json_path = path
+
+
+def stray_errors(repo_root: pathlib.Path = pathlib.Path(".")) -> List[str]:
+    """Prompt-like JSON outside canonical locations, plus deprecated directories."""
+    errors = []
+    repo_root = repo_root.resolve()
+    with os.scandir(repo_root) as it:
+        root_json = sorted(e.path for e in it if e.is_file() and e.name.endswith(".json"))
+    for p in root_json:
+        # allow root level non-prompt tooling indexes etc if needed later; currently no root prompts allowed
+        try:
+            data = json.loads(pathlib.Path(p).read_text())
+        except Exception:
+            continue
+        if isinstance(data, dict) and {'target_model', 'messages'} <= set(data):
+            errors.append(f"Stray prompt spec at repo root: {p}")
+    # Detect any nested prompts_json leftovers (forbid)
+    if (repo_root / 'prompts_json').exists():
+        errors.append("Deprecated directory present: prompts_json (must be removed)")
+    return errors
+
+
+def check_all(write: bool = False) -> int:
+    """Validation, pairing, stray detection and both index builds off one scan."""
+    import build_prompts_index
+    import build_tools_index
+    import schema_validate_prompts
+    import token_estimate
+
+    cat = scan(PROMPTS_ROOT, skip_templates=False)
+    errors = schema_validate_prompts.validate_catalog(cat)
+    errors.extend(stray_errors())
+
+    tools_entries = [build_tools_index.build_entry(r.md_path, r.md_text) for r in cat.docs()
+                     if "templates" not in pathlib.PurePath(r.directory).parts]
+    prompt_entries = [build_prompts_index.entry_for(r.json_path, r.spec) for r in cat.specs() if r.spec is not None]
+
+    if write:
+        build_tools_index.write_index(tools_entries)
+        build_prompts_index.write_index(prompt_entries)
+        print(f"Wrote tools/index.json ({len(tools_entries)}) and prompts/index.json ({len(prompt_entries)})")
+    else:
+        errors.extend(_index_drift(build_tools_index.INDEX_PATH, tools_entries, "build_tools_index.py"))
+        errors.extend(_index_drift(build_prompts_index.INDEX_PATH, prompt_entries, "build_prompts_index.py"))
+
+    token_estimate.MEMO.save()
+
+    if errors:
+        for e in errors:
+            print(e, file=sys.stderr)
+        return 1
+    print(f"Catalog OK: {len(cat.specs())} specs, {len(cat.docs())} docs.")
+    return 0
+
+
+def _index_drift(index_path: pathlib.Path, entries: List[Dict[str, Any]], builder: str) -> List[str]:
+    try:
+        committed = json.loads(index_path.read_text(encoding="utf-8")).get("prompts", [])
+    except (OSError, ValueError) as e:
+        return [f"{index_path}: unreadable ({e}). Run: python scripts/{builder}"]
+    key = lambda e: e["path"]  # noqa: E731
+    if sorted(committed, key=key) == sorted(entries, key=key):
+        return []
+    old = {e["path"]: e for e in committed}
+    new = {e["path"]: e for e in entries}
+    drift = sorted(p for p in old.keys() | new.keys() if old.get(p) != new.get(p))
+    return [f"{index_path}: drift for {', '.join(drift)}. Run: python scripts/{builder} and commit {index_path}"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prompt catalog utilities")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_check = sub.add_parser("check-all", help="Validate, pair, detect strays and check both indexes in one pass")
+    p_check.add_argument("--write", action="store_true", help="Rewrite tools/index.json and prompts/index.json instead of checking drift")
+    args = parser.parse_args()
+    if args.command == "check-all":
+        sys.exit(check_all(write=args.write))
+
+
+if __name__ == "__main__":
+    main()
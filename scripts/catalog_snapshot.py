@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+catalog_snapshot.py
+
+Build and read a compact binary snapshot of the whole prompt catalog.
+
+The snapshot is a single file meant to be mmap'd by services embedding the
+hub: opening it reads a fixed header only, and each record, string and
+message body is decoded lazily on access. Layout (all integers little-endian):
+
+  header    magic "RPHSNAP1", version, counts and section offsets
+  strings   u32 offset table (count + 1 entries) + concatenated UTF-8;
+            slugs, categories, models, tags, titles, roles... interned once
+  records   fixed-size rows of string ids plus tag/message table ranges
+  slugs     record ordinals sorted by slug (binary-searched by find())
+  tags      u32 string ids referenced by records
+  messages  (role string id, blob offset, blob length) rows
+  blob      concatenated message contents and per-spec "extra" JSON
+            (the spec with messages nulled out, so spec() is lossless)
+
+Usage:
+  python scripts/catalog_snapshot.py build [-o .cache/catalog.snap]
+  python scripts/catalog_snapshot.py show <slug> [--snapshot PATH]
+"""
+import argparse
+import json
+import mmap
+import pathlib
+import struct
+import sys
+from typing import Any, Dict, List, Optional
+
+import build_prompts_index
+import build_tools_index
+import catalog
+
+MAGIC = b"RPHSNAP1"
+VERSION = 1
+DEFAULT_PATH = pathlib.Path(".cache") / "catalog.snap"
+
+# magic, version, record_count, string_count, tag_count, message_count,
+# then offsets of strings, records, slugs, tags, messages, blob sections.
+HEADER = struct.Struct("<8sIIIII6Q")
+# slug, category, title, path, spec_path, model, reasoning_effort, verbosity,
+# version, hash, last_updated, author (string ids); tags start/count;
+# messages start/count; extra JSON blob offset/length.
+RECORD = struct.Struct("<12IIHIHQI")
+MESSAGE = struct.Struct("<IQI")
+U32 = struct.Struct("<I")
+
+_FIELDS = ("slug", "category", "title", "path", "spec_path", "model",
+           "reasoning_effort", "verbosity", "version", "hash", "last_updated", "author")
+
+
+class _Strings:
+    def __init__(self):
+        self.ids: Dict[str, int] = {"": 0}
+        self.values: List[str] = [""]
+
+    def intern(self, value: Optional[str]) -> int:
+        value = "" if value is None else str(value)
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return sid
+
+
+def build_snapshot(cat: catalog.Catalog) -> bytes:
+    """Serialize every spec in the catalog into snapshot bytes."""
+    strings = _Strings()
+    rows, tag_ids, messages = [], [], []
+    blob = bytearray()
+    for rec in cat.specs():
+        if rec.spec is None:
+            print(f"WARN: skip {rec.json_path}: {rec.spec_error}", file=sys.stderr)
+            continue
+        spec_entry = build_prompts_index.entry_for(rec.json_path, rec.spec)
+        doc = build_tools_index.build_entry(rec.md_path, rec.md_text) if rec.md_path else {}
+        values = {
+            "slug": rec.name,
+            "category": rec.category,
+            "title": doc.get("title") or rec.name,
+            "path": doc.get("path", ""),
+            "spec_path": spec_entry["path"],
+            "model": spec_entry["model"],
+            "reasoning_effort": spec_entry["reasoning_effort"],
+            "verbosity": spec_entry["verbosity"],
+            "version": rec.spec.get("version"),
+            "hash": spec_entry["hash"],
+            "last_updated": doc.get("last_updated", ""),
+            "author": doc.get("author", ""),
+        }
+        tags = doc.get("tags", [])
+        tag_start = len(tag_ids)
+        tag_ids.extend(strings.intern(t) for t in tags)
+        msg_start = len(messages)
+        for m in rec.spec.get("messages", []):
+            content = str(m.get("content", "")).encode("utf-8")
+            messages.append((strings.intern(m.get("role")), len(blob), len(content)))
+            blob += content
+        # Messages live in the blob; keep a null placeholder to preserve key order.
+        extra = json.dumps({k: (None if k == "messages" else v) for k, v in rec.spec.items()},
+                           ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        extra_off = len(blob)
+        blob += extra
+        rows.append(([strings.intern(values[f]) for f in _FIELDS],
+                     tag_start, len(tags), msg_start, len(messages) - msg_start, extra_off, len(extra)))
+
+    encoded = [s.encode("utf-8") for s in strings.values]
+    str_offsets, pos = [], 0
+    for b in encoded:
+        str_offsets.append(pos)
+        pos += len(b)
+    str_offsets.append(pos)
+    str_section = b"".join(U32.pack(o) for o in str_offsets) + b"".join(encoded)
+
+    rec_section = b"".join(RECORD.pack(*sids, ts, tc, ms, mc, eo, el) for sids, ts, tc, ms, mc, eo, el in rows)
+    order = sorted(range(len(rows)), key=lambda i: strings.values[rows[i][0][0]])
+    slug_section = b"".join(U32.pack(i) for i in order)
+    tag_section = b"".join(U32.pack(t) for t in tag_ids)
+    msg_section = b"".join(MESSAGE.pack(*m) for m in messages)
+
+    offsets, pos = [], HEADER.size
+    for section in (str_section, rec_section, slug_section, tag_section, msg_section):
+        offsets.append(pos)
+        pos += len(section)
+    offsets.append(pos)
+    header = HEADER.pack(MAGIC, VERSION, len(rows), len(encoded), len(tag_ids), len(messages), *offsets)
+    return header + str_section + rec_section + slug_section + tag_section + msg_section + bytes(blob)
+
+
+class Snapshot:
+    """Lazily decoded, mmap-backed view of a catalog snapshot."""
+
+    def __init__(self, path: pathlib.Path = DEFAULT_PATH):
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self._n, self._nstr, _ntags, _nmsg,
+         self._str_off, self._rec_off, self._slug_off, self._tag_off, self._msg_off, self._blob_off) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a catalog snapshot (v{VERSION})")
+        self._str_data = self._str_off + 4 * (self._nstr + 1)
+        self._strings: Dict[int, str] = {}
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def string(self, sid: int) -> str:
+        s = self._strings.get(sid)
+        if s is None:
+            start, end = struct.unpack_from("<II", self._mm, self._str_off + 4 * sid)
+            s = self._strings[sid] = self._mm[self._str_data + start:self._str_data + end].decode("utf-8")
+        return s
+
+    def _row(self, i: int):
+        return RECORD.unpack_from(self._mm, self._rec_off + RECORD.size * i)
+
+    def record(self, i: int) -> Dict[str, Any]:
+        """Metadata for record ordinal i (no message bodies are decoded)."""
+        row = self._row(i)
+        out: Dict[str, Any] = {f: self.string(sid) or None for f, sid in zip(_FIELDS, row[:12])}
+        tag_start, tag_count = row[12], row[13]
+        out["tags"] = [self.string(U32.unpack_from(self._mm, self._tag_off + 4 * (tag_start + j))[0]) for j in range(tag_count)]
+        return out
+
+    def find(self, slug: str) -> Optional[int]:
+        """Record ordinal for a slug via binary search over the sorted slug table."""
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            i = U32.unpack_from(self._mm, self._slug_off + 4 * mid)[0]
+            key = self.string(self._row(i)[0])
+            if key < slug:
+                lo = mid + 1
+            elif key > slug:
+                hi = mid
+            else:
+                return i
+        return None
+
+    def messages(self, slug: str) -> Optional[List[Dict[str, str]]]:
+        i = self.find(slug)
+        if i is None:
+            return None
+        row = self._row(i)
+        out = []
+        for j in range(row[14], row[14] + row[15]):
+            role, off, length = MESSAGE.unpack_from(self._mm, self._msg_off + MESSAGE.size * j)
+            start = self._blob_off + off
+            out.append({"role": self.string(role), "content": self._mm[start:start + length].decode("utf-8")})
+        return out
+
+    def spec(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Reconstruct the full JSON spec for a slug."""
+        i = self.find(slug)
+        if i is None:
+            return None
+        row = self._row(i)
+        start = self._blob_off + row[16]
+        spec = json.loads(self._mm[start:start + row[17]].decode("utf-8"))
+        spec["messages"] = self.messages(slug)
+        return spec
+
+    def slugs(self) -> List[str]:
+        return [self.string(self._row(U32.unpack_from(self._mm, self._slug_off + 4 * k)[0])[0]) for k in range(self._n)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or inspect the binary catalog snapshot")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="Write a snapshot of every prompt spec")
+    p_build.add_argument("-o", "--output", type=pathlib.Path, default=DEFAULT_PATH)
+    p_show = sub.add_parser("show", help="Print one prompt's spec from a snapshot")
+    p_show.add_argument("slug")
+    p_show.add_argument("--snapshot", type=pathlib.Path, default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        data = build_snapshot(catalog.scan(catalog.PROMPTS_ROOT))
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        tmp = args.output.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(args.output)
+        with Snapshot(args.output) as snap:
+            print(f"Wrote {args.output} with {len(snap)} prompts ({len(data)} bytes)")
+    else:
+        with Snapshot(args.snapshot) as snap:
+            spec = snap.spec(args.slug)
+            if spec is None:
+                print(f"Error: unknown prompt '{args.slug}'", file=sys.stderr)
+                sys.exit(1)
+            print(json.dumps(spec, ensure_ascii=False, separators=(",", ":")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+facets.py
+
+Faceted filtering with precomputed facet counts over the prompt catalog.
+
+Documents are the tools/index.json + prompts/index.json join used by the
+search index (build_search_index.collect_documents). Each document gets an
+ordinal, and every facet value keeps a bitset (a Python int) of the
+ordinals carrying it:
+
+  category          tools/index.json category
+  tag               frontmatter tags (multi-valued)
+  target_model      spec target_model
+  reasoning_effort  spec parameters.reasoning_effort
+  verbosity         spec parameters.verbosity
+  author            frontmatter author
+
+A query ORs the bitsets of the values selected within a facet (or ANDs
+them for facets in match_all, e.g. "all of these tags") and ANDs across
+facets. Counts are disjunctive, as catalog UIs expect: each facet is
+counted against the filters of the *other* facets, so selecting one
+category still shows how many prompts the sibling categories hold. Every
+count is one popcount of an intersection; nothing re-scans the catalog.
+
+The index is cached in .cache/facet_index.json (bitsets as hex) and rebuilt
+when either source index changes, like .cache/search_index.json.
+tools/catalog_server.py serves the same queries from memory at /facets.
+
+Usage:
+  python scripts/facets.py                                  # counts only
+  python scripts/facets.py category=engineering tag=git --json
+  python scripts/facets.py tag=audit tag=github --all-tags --limit 5
+"""
+import argparse
+import json
+import pathlib
+import sys
+from typing import Any, Dict, Iterable, List, Optional
+
+import build_search_index
+
+INDEX_VERSION = 1
+INDEX_PATH = pathlib.Path(".cache") / "facet_index.json"
+# Facet name -> document field.
+FACETS = {
+    "category": "category",
+    "tag": "tags",
+    "target_model": "model",
+    "reasoning_effort": "reasoning_effort",
+    "verbosity": "verbosity",
+    "author": "author",
+}
+DOC_FIELDS = ("slug", "path", "spec", "title", "tags", "category", "author", "last_updated",
+              "model", "reasoning_effort", "verbosity", "tokens", "bytes")
+
+
+def facet_values(doc: Dict[str, Any], facet: str) -> List[str]:
+    value = doc.get(FACETS[facet])
+    if isinstance(value, list):
+        return [str(v) for v in value if v]
+    return [str(value)] if value else []
+
+
+class FacetIndex:
+    """Per-facet value bitsets over document ordinals."""
+
+    def __init__(self, docs: List[Dict[str, Any]], bitsets: Optional[Dict[str, Dict[str, int]]] = None):
+        self.docs = docs
+        self.all = (1 << len(docs)) - 1
+        if bitsets is None:
+            bitsets = {facet: {} for facet in FACETS}
+            for ordinal, doc in enumerate(docs):
+                bit = 1 << ordinal
+                for facet in FACETS:
+                    for value in facet_values(doc, facet):
+                        bitsets[facet][value] = bitsets[facet].get(value, 0) | bit
+        self.bitsets = bitsets
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "FacetIndex":
+        return cls(data["docs"], {f: {v: int(h, 16) for v, h in values.items()} for f, values in data["facets"].items()})
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"docs": self.docs, "facets": {f: {v: format(b, "x") for v, b in sorted(values.items())}
+                                              for f, values in self.bitsets.items()}}
+
+    def mask(self, facet: str, values: Iterable[str], match_all: bool = False) -> int:
+        """Bitset of documents with any (or, with match_all, every) of the values."""
+        table = self.bitsets.get(facet, {})
+        out = self.all if match_all else 0
+        for value in values:
+            if match_all:
+                out &= table.get(value, 0)
+            else:
+                out |= table.get(value, 0)
+        return out
+
+    def counts(self, facet: str, within: int) -> Dict[str, int]:
+        """Nonzero value counts of one facet inside a document bitset, largest first."""
+        counts = {v: (b & within).bit_count() for v, b in self.bitsets.get(facet, {}).items()}
+        return dict(sorted(((v, n) for v, n in counts.items() if n), key=lambda kv: (-kv[1], kv[0])))
+
+    @staticmethod
+    def ordinals(bits: int, offset: int = 0, limit: Optional[int] = None) -> List[int]:
+        """Set bit positions in ascending order, paged.
+
+        Works on 64-bit words so big bitsets are not shifted or copied per
+        bit; whole words before the page are skipped by popcount, and the
+        walk stops as soon as the page is full.
+        """
+        out: List[int] = []
+        if not bits or limit == 0:
+            return out
+        end = offset + limit if limit is not None else None
+        size = (bits.bit_length() + 63) // 64 * 8
+        words = memoryview(bits.to_bytes(size, sys.byteorder)).cast("Q")
+        seen = 0
+        for w, word in enumerate(words):
+            if not word:
+                continue
+            n = word.bit_count()
+            if seen + n <= offset:
+                seen += n
+                continue
+            base = w * 64
+            while word:
+                low = word & -word
+                if seen >= offset:
+                    out.append(base + low.bit_length() - 1)
+                    if end is not None and seen + 1 >= end:
+                        return out
+                word ^= low
+                seen += 1
+        return out
+
+    def query(self, filters: Optional[Dict[str, List[str]]] = None, match_all: Iterable[str] = (),
+              limit: Optional[int] = None, offset: int = 0) -> Dict[str, Any]:
+        """Matching documents plus disjunctive counts for every facet.
+
+        ``filters`` maps facet names to selected values; unknown facets raise
+        KeyError. Facets named in ``match_all`` require every selected value.
+        """
+        filters = {f: list(v) for f, v in (filters or {}).items() if v}
+        unknown = [f for f in filters if f not in FACETS]
+        if unknown:
+            raise KeyError(", ".join(unknown))
+        match_all = set(match_all)
+        masks = {f: self.mask(f, values, f in match_all) for f, values in filters.items()}
+        hits = self.all
+        for m in masks.values():
+            hits &= m
+        counts = {}
+        for facet in FACETS:
+            within = self.all
+            for other, m in masks.items():
+                # A match_all facet narrows its own counts too ("tags that co-occur").
+                if other != facet or facet in match_all:
+                    within &= m
+            counts[facet] = self.counts(facet, within)
+        return {
+            "total": len(self.docs),
+            "count": hits.bit_count(),
+            "filters": filters,
+            "prompts": [self.docs[i] for i in self.ordinals(hits, offset, limit)],
+            "facets": counts,
+        }
+
+
+def build(root: pathlib.Path) -> Dict[str, Any]:
+    docs = [{k: d.get(k) for k in DOC_FIELDS} for d in build_search_index.collect_documents(root)]
+    return dict(FacetIndex(docs).to_json(), version=INDEX_VERSION, sources=build_search_index._source_stamp(root))
+
+
+def load_index(root: pathlib.Path = pathlib.Path("."), rebuild: bool = True) -> Optional[FacetIndex]:
+    """Load the cached facet index, rebuilding it if missing or stale."""
+    path = root / INDEX_PATH
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = None
+    stamp = build_search_index._source_stamp(root)
+    if data and data.get("version") == INDEX_VERSION and data.get("sources") == stamp:
+        return FacetIndex.from_json(data)
+    if not rebuild or not stamp:
+        return None
+    data = build(root)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as e:
+        print(f"WARN: Could not write {path}: {e}", file=sys.stderr)
+    return FacetIndex.from_json(data)
+
+
+def parse_filters(pairs: Iterable[str]) -> Dict[str, List[str]]:
+    """["tag=a", "tag=b", "category=x"] -> {"tag": ["a", "b"], "category": ["x"]}."""
+    filters: Dict[str, List[str]] = {}
+    for pair in pairs:
+        facet, sep, value = pair.partition("=")
+        if not sep or not value:
+            raise ValueError(f"expected facet=value, got {pair!r}")
+        if facet not in FACETS:
+            raise ValueError(f"unknown facet {facet!r} (known: {', '.join(FACETS)})")
+        filters.setdefault(facet, []).extend(v for v in value.split(",") if v)
+    return filters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Faceted prompt filtering with facet counts")
+    parser.add_argument("filters", nargs="*", metavar="FACET=VALUE",
+                        help=f"Filters; repeat or comma-separate values. Facets: {', '.join(FACETS)}")
+    parser.add_argument("--all-tags", action="store_true", help="Require every tag= value (default: any)")
+    parser.add_argument("--limit", type=int, help="Maximum number of prompts to return")
+    parser.add_argument("--offset", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Output the full query result as JSON")
+    args = parser.parse_args()
+
+    try:
+        filters = parse_filters(args.filters)
+    except ValueError as e:
+        parser.error(str(e))
+    index = load_index()
+    if index is None:
+        print("Error: tools/index.json not found. Run scripts/build_tools_index.py first.", file=sys.stderr)
+        sys.exit(1)
+    result = index.query(filters, ("tag",) if args.all_tags else (), args.limit, args.offset)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"{result['count']} of {result['total']} prompts match")
+    for facet, counts in result["facets"].items():
+        print(f"\n{facet}:")
+        for value, n in counts.items():
+            mark = "*" if value in filters.get(facet, ()) else " "
+            print(f" {mark}{n:>5}  {value}")
+    if filters:
+        print()
+        for doc in result["prompts"]:
+            print(f"{doc['path']}  {doc['title'] or ''}")
+
+
+if __name__ == "__main__":
+    main()
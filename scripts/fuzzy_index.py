@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+fuzzy_index.py
+
+Typo-tolerant lookup of prompts by title, slug and tag, for autocomplete.
+
+Every title, slug and tag is normalized to a lowercase key ("kata-runner"
+and "Kata Runner" both become "kata runner") and split into padded
+character trigrams. A query's trigrams pick candidate keys from the posting
+lists (most shared trigrams first, at most CANDIDATES of them), and each
+candidate is scored with a bit-parallel edit distance (Myers/Hyyro):
+
+  distance   fewest edits turning the query into a substring of the key
+  prefix     fewest edits turning the query into a prefix of the key
+
+Matches are ranked by distance, then prefix (so "kata ru" prefers keys that
+start with it), then whole-key distance, field (title, slug, tag) and key,
+and each prompt is returned once under its best key. Queries of fewer than
+4 characters must match exactly; longer ones allow one edit per 4
+characters, up to 3, so "acceptence criteria" and "kata runer" still hit.
+A keystroke query costs a few dictionary lookups plus one pass over each
+candidate key. Short queries are the exception: when the edit budget can
+break every query trigram (e.g. "gile" vs "engineering", 1 edit), an
+in-range key may share none, so those queries score every key instead
+(the key list is small: one per distinct title, slug and tag). Longer
+queries score at most CANDIDATES keys, so in-range keys beyond that many
+stronger trigram matches are not returned.
+
+The index is built from tools/index.json + prompts/index.json
+(build_search_index.collect_documents), cached in .cache/fuzzy_index.json
+and rebuilt when either source changes. Posting lists stay encoded strings
+until a query first touches them. tools/search.py --keyword and
+tools/catalog_server.py /suggest use it.
+
+Usage:
+  python scripts/fuzzy_index.py "kata runer"
+  python scripts/fuzzy_index.py "acceptence criteria" --limit 3 --json
+  python scripts/fuzzy_index.py "git workflow" --keystrokes   # time every prefix
+  python scripts/fuzzy_index.py --build
+"""
+import argparse
+import json
+import pathlib
+import re
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import build_search_index
+
+INDEX_VERSION = 1
+INDEX_PATH = pathlib.Path(".cache") / "fuzzy_index.json"
+FIELDS = ("title", "slug", "tag")  # tie-break order
+DOC_FIELDS = ("slug", "path", "title", "tags", "category", "last_updated", "tokens", "bytes")
+# Keys scored per query, by shared trigrams; bounds per-keystroke work.
+CANDIDATES = 64
+
+_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase alphanumeric words joined by single spaces."""
+    return " ".join(w for w in _SPLIT_RE.split(str(text).lower()) if w)
+
+
+def trigrams(key: str, partial: bool = False) -> Set[str]:
+    """Trigrams of "  key " (no trailing pad when the last word may be incomplete)."""
+    padded = "  " + key + ("" if partial else " ")
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def max_edits(length: int) -> int:
+    return min(length // 4, 3)
+
+
+def distances(pattern: str, text: str) -> Tuple[int, int, int]:
+    """(substring, prefix, whole) edit distances of pattern against text.
+
+    Myers' bit-vector algorithm: one column of the DP matrix per character
+    of text, held as bitmasks over pattern positions.
+    """
+    m = len(pattern)
+    if not m:
+        return 0, 0, len(text)
+    peq: Dict[str, int] = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    # Search mode (free start in text) and global mode (anchored at 0) run side by side.
+    spv, smv, sscore = mask, 0, m
+    gpv, gmv, gscore = mask, 0, m
+    best_sub = best_prefix = m
+    for c in text:
+        eq = peq.get(c, 0)
+        for mode in (0, 1):
+            pv, mv = (spv, smv) if mode == 0 else (gpv, gmv)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | ~(xh | pv)
+            mh = pv & xh
+            delta = 1 if ph & high else -1 if mh & high else 0
+            ph = (ph << 1) | mode
+            mh <<= 1
+            pv = (mh | ~(xv | ph)) & mask
+            mv = ph & xv & mask
+            if mode == 0:
+                spv, smv, sscore = pv, mv, sscore + delta
+                best_sub = min(best_sub, sscore)
+            else:
+                gpv, gmv, gscore = pv, mv, gscore + delta
+                best_prefix = min(best_prefix, gscore)
+    return best_sub, best_prefix, gscore
+
+
+class FuzzyIndex:
+    """Trigram postings over normalized title/slug/tag keys."""
+
+    def __init__(self, docs: List[Dict[str, Any]], keys: Optional[List[str]] = None,
+                 refs: Optional[List[List[int]]] = None, postings: Optional[Dict[str, str]] = None):
+        self.docs = docs
+        if keys is None:
+            by_key: Dict[str, List[int]] = {}
+            for ordinal, doc in enumerate(docs):
+                values = [("title", doc.get("title")), ("slug", doc.get("slug"))]
+                values += [("tag", t) for t in doc.get("tags") or []]
+                for field, value in values:
+                    key = normalize(value or "")
+                    if key:
+                        by_key.setdefault(key, []).extend((ordinal, FIELDS.index(field)))
+            keys = sorted(by_key)
+            refs = [by_key[k] for k in keys]
+            lists: Dict[str, List[int]] = {}
+            for key_id, key in enumerate(keys):
+                for gram in trigrams(key):
+                    lists.setdefault(gram, []).append(key_id)
+            postings = {g: " ".join(map(str, ids)) for g, ids in sorted(lists.items())}
+        self.keys = keys
+        self.refs = refs
+        self.postings = postings
+        self._decoded: Dict[str, List[int]] = {}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "FuzzyIndex":
+        return cls(data["docs"], data["keys"], data["refs"], data["postings"])
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"docs": self.docs, "keys": self.keys, "refs": self.refs, "postings": self.postings}
+
+    def _posting(self, gram: str) -> List[int]:
+        ids = self._decoded.get(gram)
+        if ids is None:
+            raw = self.postings.get(gram)
+            ids = self._decoded[gram] = [int(i) for i in raw.split()] if raw else []
+        return ids
+
+    def search(self, text: str, limit: Optional[int] = 10, max_distance: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Best-first prompts whose title, slug or a tag approximately contains the query.
+
+        Each result is the prompt's document plus "match" (the key), "field",
+        "distance" and "score" (1 - distance / query length).
+        """
+        query = normalize(text)
+        if not query:
+            return []
+        allowed = max_edits(len(query)) if max_distance is None else max_distance
+        grams = trigrams(query, partial=True)
+        # Each edit breaks at most 3 trigrams, and a match inside a word misses
+        # the 2 start-padded ones, so keys sharing fewer cannot be in range.
+        need = len(grams) - 2 - 3 * allowed
+        if need <= 0:
+            # Keys sharing no trigram can still be in range; score them all.
+            candidates: Iterable[int] = range(len(self.keys))
+        else:
+            shared: Counter = Counter()
+            for gram in grams:
+                shared.update(self._posting(gram))
+            candidates = [key_id for key_id, n in shared.most_common(CANDIDATES) if n >= need]
+        scored = []
+        for key_id in candidates:
+            key = self.keys[key_id]
+            if need <= 0 and (query not in key if allowed == 0 else
+                              sum(c in key for c in query) < len(query) - allowed):
+                # Cheap rejects for the full scan: an exact match is a substring,
+                # and a match within `allowed` edits keeps the other query characters.
+                continue
+            sub, prefix, whole = distances(query, key)
+            if sub <= allowed:
+                scored.append((sub, prefix, whole, key_id))
+        seen: Set[int] = set()
+        results = []
+        for sub, prefix, whole, key_id in sorted(scored, key=lambda s: (s[:3], self.keys[s[3]])):
+            refs = self.refs[key_id]
+            for ordinal, field in sorted(zip(refs[::2], refs[1::2]), key=lambda r: r[1]):
+                if ordinal in seen:
+                    continue
+                seen.add(ordinal)
+                results.append(dict(self.docs[ordinal], match=self.keys[key_id], field=FIELDS[field],
+                                    distance=sub, score=round(1 - sub / len(query), 3)))
+                if limit is not None and len(results) >= limit:
+                    return results
+        return results
+
+
+def build(root: pathlib.Path) -> Dict[str, Any]:
+    docs = [{k: d.get(k) for k in DOC_FIELDS} for d in build_search_index.collect_documents(root)]
+    return dict(FuzzyIndex(docs).to_json(), version=INDEX_VERSION, sources=build_search_index._source_stamp(root))
+
+
+def load_index(root: pathlib.Path = pathlib.Path("."), rebuild: bool = True) -> Optional[FuzzyIndex]:
+    """Load the cached fuzzy index, rebuilding it if missing or stale."""
+    path = root / INDEX_PATH
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = None
+    stamp = build_search_index._source_stamp(root)
+    if data and data.get("version") == INDEX_VERSION and data.get("sources") == stamp:
+        return FuzzyIndex.from_json(data)
+    if not rebuild or not stamp:
+        return None
+    data = build(root)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as e:
+        print(f"WARN: Could not write {path}: {e}", file=sys.stderr)
+    return FuzzyIndex.from_json(data)
+
+
+def _keystrokes(index: FuzzyIndex, text: str, limit: int) -> Iterable[Tuple[str, float, List[Dict[str, Any]]]]:
+    for end in range(1, len(text) + 1):
+        start = time.perf_counter()
+        results = index.search(text[:end], limit)
+        yield text[:end], (time.perf_counter() - start) * 1e6, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Typo-tolerant prompt lookup by title, slug and tag")
+    parser.add_argument("query", nargs="?", help="Text to look up")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum number of prompts (default: 10)")
+    parser.add_argument("--max-distance", type=int, help="Allowed edits (default: 1 per 4 characters, up to 3)")
+    parser.add_argument("--keystrokes", action="store_true", help="Query every prefix of QUERY and report timings")
+    parser.add_argument("--build", action="store_true", help="Rebuild .cache/fuzzy_index.json and exit")
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    args = parser.parse_args()
+
+    root = pathlib.Path(".")
+    if args.build:
+        (root / INDEX_PATH).unlink(missing_ok=True)
+    index = load_index(root)
+    if index is None:
+        print("Error: tools/index.json not found. Run scripts/build_tools_index.py first.", file=sys.stderr)
+        sys.exit(1)
+    if args.build:
+        print(f"Wrote {INDEX_PATH} with {len(index.docs)} prompts, {len(index.keys)} keys "
+              f"and {len(index.postings)} trigrams")
+        return
+    if not args.query:
+        parser.error("a query is required")
+
+    if args.keystrokes:
+        rows = [{"query": q, "micros": round(us, 1), "top": [r["slug"] for r in results[:3]]}
+                for q, us, results in _keystrokes(index, args.query, args.limit)]
+        if args.json:
+            print(json.dumps(rows, indent=2))
+            return
+        for row in rows:
+            print(f"{row['micros']:>9.1f} us  {row['query']!r:<{len(args.query) + 2}}  {', '.join(row['top'])}")
+        return
+
+    results = index.search(args.query, args.limit, args.max_distance)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    if not results:
+        print("No prompts found.")
+        return
+    for r in results:
+        print(f"{r['score']:<5.2f}  {r['slug']:<32}  {r['field']:<5}  {r['match']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+gitobjects.py
+
+Read many git objects through a single long-lived ``git cat-file --batch``
+process instead of one ``git show`` fork per object.
+
+    with GitObjectReader() as reader:
+        blobs = reader.read_many([":prompts/a.md", "HEAD:prompts/a.md", sha])
+
+Requests are pipelined: a writer thread feeds object names to git while the
+caller reads responses, so large batches cannot deadlock on full pipes.
+"""
+import subprocess
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import instrument
+
+
+class GitObjectReader:
+    """One ``git cat-file --batch`` process serving object reads."""
+
+    def __init__(self, cwd: Optional[str] = None):
+        instrument.count("subprocesses")
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._proc.poll() is None:
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+            self._proc.wait()
+
+    def _read_response(self) -> Tuple[Optional[str], Optional[bytes]]:
+        header = self._proc.stdout.readline()
+        if not header:
+            raise RuntimeError("git cat-file --batch exited unexpectedly")
+        parts = header.rstrip(b"\n").split(b" ")
+        # "<name> missing" / "<name> ambiguous"
+        if len(parts) != 3:
+            return None, None
+        oid, _type, size = parts
+        instrument.count("git_objects")
+        instrument.count("bytes_read", int(size))
+        data = self._proc.stdout.read(int(size))
+        self._proc.stdout.read(1)  # trailing LF
+        return oid.decode(), data
+
+    def read(self, name: str) -> Optional[bytes]:
+        """Content of one object (``<sha>``, ``<rev>:<path>``, ``:<path>``), or None."""
+        with self._lock:
+            self._proc.stdin.write(name.encode() + b"\n")
+            self._proc.stdin.flush()
+            return self._read_response()[1]
+
+    def iter_objects(self, names: Iterable[str]) -> Iterator[Tuple[str, Optional[str], Optional[bytes]]]:
+        """Yield (name, oid, content) for each name, in request order."""
+        names = list(names)
+        if not names:
+            return
+        with self._lock:
+            def feed():
+                try:
+                    for name in names:
+                        self._proc.stdin.write(name.encode() + b"\n")
+                    self._proc.stdin.flush()
+                except OSError:
+                    pass
+            writer = threading.Thread(target=feed, daemon=True)
+            writer.start()
+            try:
+                for name in names:
+                    oid, data = self._read_response()
+                    yield name, oid, data
+            finally:
+                writer.join()
+
+    def read_many(self, names: Iterable[str]) -> Dict[str, Optional[bytes]]:
+        """Map each object name to its content (None when missing)."""
+        return {name: data for name, _oid, data in self.iter_objects(names)}
+
+
+def run_git(args: List[str], cwd: Optional[str] = None) -> bytes:
+    """Run a git command and return stdout (raises CalledProcessError)."""
+    instrument.count("subprocesses")
+    with instrument.span(f"git {args[0]}" if args else "git"):
+        return subprocess.run(["git", *args], cwd=cwd, capture_output=True, check=True).stdout
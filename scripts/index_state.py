@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+index_state.py
+
+Sidecar state for incremental index builds (build_tools_index.py and
+build_prompts_index.py --incremental).
+
+The state maps each source path to its (mtime_ns, size, sha256) stamp and
+remembers the hash of the index file it was recorded against. A source is
+re-parsed only when its stat stamp changed *and* its content hash differs;
+a stat-only change (touch, fresh checkout) just refreshes the stamp. If the
+index on disk no longer matches the recorded hash the state is discarded
+and the caller falls back to a full rebuild.
+"""
+import hashlib
+import json
+import os
+import pathlib
+from typing import Dict, List, Optional, Tuple
+
+import instrument
+
+STATE_VERSION = 1
+STATE_DIR = pathlib.Path(".cache")
+
+
+def sha256_bytes(data: bytes) -> str:
+    with instrument.span("sha256"):
+        return hashlib.sha256(data).hexdigest()
+
+
+class IndexState:
+    """Per-file stamps for one generated index."""
+
+    def __init__(self, state_path: pathlib.Path, index_path: pathlib.Path):
+        self.state_path = state_path
+        self.index_path = index_path
+        self.files: Dict[str, List] = {}
+        self.valid = False
+        self._seen = set()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.state_path.read_text(encoding="utf-8"))
+            index_bytes = self.index_path.read_bytes()
+        except (OSError, ValueError):
+            return
+        if raw.get("version") != STATE_VERSION or raw.get("index_sha") != sha256_bytes(index_bytes):
+            return
+        self.files = raw.get("files", {})
+        self.valid = True
+
+    def check(self, path: pathlib.Path) -> Tuple[bool, Optional[bytes]]:
+        """Return (unchanged, data) for a source file.
+
+        ``data`` is the file content when it had to be read for the hash
+        fallback, so callers that must re-parse don't read it twice.
+        """
+        key = str(path)
+        self._seen.add(key)
+        st = os.stat(path)
+        stamp = self.files.get(key)
+        if stamp and stamp[0] == st.st_mtime_ns and stamp[1] == st.st_size:
+            return True, None
+        data = path.read_bytes()
+        instrument.count("files_read")
+        instrument.count("bytes_read", len(data))
+        sha = sha256_bytes(data)
+        unchanged = bool(stamp) and stamp[2] == sha
+        self.files[key] = [st.st_mtime_ns, st.st_size, sha]
+        return unchanged, data
+
+    def record(self, path: pathlib.Path, data: bytes) -> None:
+        """Stamp a file that was parsed outside of check() (full rebuilds)."""
+        key = str(path)
+        self._seen.add(key)
+        st = os.stat(path)
+        self.files[key] = [st.st_mtime_ns, st.st_size, sha256_bytes(data)]
+
+    def prune(self) -> List[str]:
+        """Forget files not visited since load; returns the deleted paths."""
+        deleted = sorted(set(self.files) - self._seen)
+        for key in deleted:
+            del self.files[key]
+        return deleted
+
+    def save(self) -> None:
+        self.prune()
+        payload = {
+            "version": STATE_VERSION,
+            "index_sha": sha256_bytes(self.index_path.read_bytes()),
+            "files": dict(sorted(self.files.items())),
+        }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        self.state_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        instrument.wrote(self.state_path)
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+instrument.py
+
+Lightweight timing spans and counters for the hub scripts, with a
+Chrome-trace report and optional cProfile capture.
+
+Shared modules (catalog.py, gitobjects.py, index_state.py, the index
+builders) wrap their stages in spans and bump counters:
+
+    with instrument.span("catalog.walk"):
+        ...
+    instrument.count("bytes_read", len(data))
+
+Both are no-ops until a script enables tracing, so normal runs pay one
+attribute check per call. A script opts in with two lines:
+
+    instrument.add_arguments(parser)       # --profile, --profile-out PATH, --cprofile PATH
+    instrument.start(args, "build_tools_index")
+
+--profile writes a Chrome trace (open in chrome://tracing or
+https://ui.perfetto.dev) with one complete event per span, counter totals,
+and an "otherData" summary of time per span name; a short summary is also
+printed to stderr. The trace goes to .cache/profile/<script>.trace.json, or
+to --profile-out PATH (which implies --profile). Trace paths must end in
+.trace.json, may not point into prompts/, and never replace an existing
+file that is not itself a trace. --cprofile additionally dumps pstats for
+`python -m pstats`, under the same rules (no prompts/, and an existing file
+is only replaced if it already holds pstats). Setting PROMPT_HUB_PROFILE=<dir> enables --profile for
+every instrumented script (handy inside pre-commit hooks and workflows),
+writing <dir>/<script>.trace.json.
+
+Counters: dirs_scanned, files_scanned (directory entries), files_read,
+bytes_read, files_written, bytes_written, subprocesses, git_objects.
+Spans inside process-pool workers are not collected; use --jobs 1 for a
+complete trace.
+"""
+import atexit
+import json
+import marshal
+import os
+import pathlib
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+ENV_VAR = "PROMPT_HUB_PROFILE"
+DEFAULT_DIR = pathlib.Path(".cache") / "profile"
+TRACE_SUFFIX = ".trace.json"
+PROMPTS_DIR = pathlib.Path(__file__).resolve().parent.parent / "prompts"
+# Per-file spans on very large catalogs would otherwise grow without bound;
+# past this many events only the summary keeps counting.
+MAX_EVENTS = 200_000
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer: "Tracer", name: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer._record(self.name, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+
+class Tracer:
+    """Collects spans and counters for one process."""
+
+    def __init__(self):
+        self.enabled = False
+        self.script = ""
+        self.trace_path: Optional[pathlib.Path] = None
+        self.cprofile_path: Optional[pathlib.Path] = None
+        self.events: List[Dict[str, Any]] = []
+        self.dropped = 0
+        self.stages: Dict[str, List[int]] = {}  # name -> [calls, total ns]
+        self.counters: Counter = Counter()
+        self._t0 = time.perf_counter_ns()
+        self._profiler = None
+        self._pid = os.getpid()
+
+    def span(self, name: str, **args: Any):
+        if not self.enabled:
+            return _NULL
+        return _Span(self, name, args)
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] += n
+
+    def _record(self, name: str, start: int, end: int, args: Dict[str, Any]) -> None:
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = [0, 0]
+        stage[0] += 1
+        stage[1] += end - start
+        if len(self.events) >= MAX_EVENTS:
+            self.dropped += 1
+            return
+        event = {"name": name, "ph": "X", "ts": (start - self._t0) / 1000, "dur": (end - start) / 1000,
+                 "pid": self._pid, "tid": threading.get_ident()}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def start(self, script: str, trace_path: Optional[pathlib.Path], cprofile_path: Optional[pathlib.Path] = None) -> None:
+        self.enabled = True
+        self.script = script
+        self.trace_path = trace_path
+        self.cprofile_path = cprofile_path
+        self._t0 = time.perf_counter_ns()
+        if cprofile_path is not None:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        atexit.register(self.finish)
+
+    def summary(self) -> Dict[str, Any]:
+        wall = (time.perf_counter_ns() - self._t0) / 1e6
+        stages = {name: {"calls": calls, "total_ms": round(ns / 1e6, 3)}
+                  for name, (calls, ns) in sorted(self.stages.items(), key=lambda kv: -kv[1][1])}
+        return {"script": self.script, "argv": sys.argv[1:], "wall_ms": round(wall, 3), "stages": stages,
+                "counters": dict(sorted(self.counters.items())), "dropped_events": self.dropped}
+
+    def finish(self) -> None:
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._profiler is not None:
+            self._profiler.disable()
+            try:
+                check_cprofile_path(self.cprofile_path)
+                self.cprofile_path.parent.mkdir(parents=True, exist_ok=True)
+                self._profiler.dump_stats(str(self.cprofile_path))
+                print(f"cProfile stats written to {self.cprofile_path} (python -m pstats {self.cprofile_path})",
+                      file=sys.stderr)
+            except (OSError, ValueError) as e:
+                print(f"WARN: Could not write {self.cprofile_path}: {e}", file=sys.stderr)
+        summary = self.summary()
+        end_us = summary["wall_ms"] * 1000
+        events = [{"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": self.script}},
+                  {"name": self.script, "ph": "X", "ts": 0, "dur": end_us, "pid": self._pid,
+                   "tid": threading.main_thread().ident}]
+        events.extend(self.events)
+        if self.counters:
+            events.append({"name": "counters", "ph": "C", "ts": end_us, "pid": self._pid,
+                           "args": dict(self.counters)})
+        if self.trace_path is not None:
+            try:
+                # Checked again here: the run itself may have created the file.
+                check_trace_path(self.trace_path)
+                self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+                self.trace_path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms",
+                                                       "otherData": summary}, separators=(",", ":")),
+                                           encoding="utf-8")
+            except (OSError, ValueError) as e:
+                print(f"WARN: Could not write {self.trace_path}: {e}", file=sys.stderr)
+        _print_summary(summary, self.trace_path)
+
+
+def _print_summary(summary: Dict[str, Any], path: Optional[pathlib.Path]) -> None:
+    out = sys.stderr
+    print(f"⏱  {summary['script']}: {summary['wall_ms']:.1f} ms wall" + (f", trace: {path}" if path else ""), file=out)
+    for name, st in list(summary["stages"].items())[:12]:
+        print(f"   {st['total_ms']:>9.2f} ms  {st['calls']:>6}x  {name}", file=out)
+    if summary["counters"]:
+        print("   " + ", ".join(f"{k}={v}" for k, v in summary["counters"].items()), file=out)
+
+
+TRACER = Tracer()
+span = TRACER.span
+count = TRACER.count
+
+
+def wrote(path) -> None:
+    """Count a file just written (files_written, bytes_written) when tracing."""
+    if TRACER.enabled:
+        try:
+            TRACER.counters["bytes_written"] += os.stat(path).st_size
+            TRACER.counters["files_written"] += 1
+        except OSError:
+            pass
+
+
+def add_arguments(parser) -> None:
+    """Add --profile, --profile-out PATH and --cprofile PATH to an argparse parser."""
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", action="store_true",
+                       help=f"Write a Chrome trace of timing spans and counters to {DEFAULT_DIR}/<script>{TRACE_SUFFIX}")
+    group.add_argument("--profile-out", type=pathlib.Path, metavar="PATH",
+                       help=f"Write the trace to PATH instead (must end in {TRACE_SUFFIX}; implies --profile)")
+    group.add_argument("--cprofile", type=pathlib.Path, metavar="PATH", help="Also dump cProfile stats to PATH")
+
+
+def _check_output_path(path: pathlib.Path, kind: str, is_own: Callable[[Any], bool]) -> None:
+    if path.resolve().is_relative_to(PROMPTS_DIR):
+        raise ValueError(f"{path}: refusing to write {kind} under prompts/")
+    if path.exists():
+        try:
+            with open(path, "rb") as fh:
+                own = is_own(fh)
+        except OSError as e:
+            raise ValueError(f"{path}: {e}")
+        if not own:
+            raise ValueError(f"{path}: exists and is not {kind}; refusing to overwrite it")
+
+
+def check_trace_path(path: pathlib.Path) -> None:
+    """Raise ValueError unless path is safe to (over)write with a trace."""
+    if not path.name.endswith(TRACE_SUFFIX):
+        raise ValueError(f"{path}: trace files must end in {TRACE_SUFFIX}")
+    _check_output_path(path, "a trace", lambda fh: fh.read(16).startswith(b'{"traceEvents"'))
+
+
+def _is_pstats(fh) -> bool:
+    # pstats files are a marshalled {(file, line, func): (cc, nc, tt, ct, callers)} dict.
+    try:
+        stats = marshal.load(fh)
+    except (EOFError, ValueError, TypeError):
+        return False
+    return isinstance(stats, dict) and all(isinstance(k, tuple) and len(k) == 3 for k in stats)
+
+
+def check_cprofile_path(path: pathlib.Path) -> None:
+    """Raise ValueError unless path is safe to (over)write with cProfile stats."""
+    _check_output_path(path, "cProfile stats", _is_pstats)
+
+
+def start(args: Any, script: str) -> None:
+    """Enable tracing if --profile/--profile-out/--cprofile were given or PROMPT_HUB_PROFILE is set."""
+    profile_out = getattr(args, "profile_out", None)
+    profile = getattr(args, "profile", False) or profile_out is not None
+    cprofile = getattr(args, "cprofile", None)
+    env_dir = os.environ.get(ENV_VAR)
+    if not profile and cprofile is None and not env_dir:
+        return
+    if profile_out is not None:
+        trace_path = profile_out
+    elif profile or env_dir:
+        trace_path = pathlib.Path(env_dir or DEFAULT_DIR) / f"{script}{TRACE_SUFFIX}"
+    else:
+        trace_path = None  # --cprofile alone: summary + pstats only
+    try:
+        if trace_path is not None:
+            check_trace_path(trace_path)
+        if cprofile is not None:
+            check_cprofile_path(cprofile)
+    except ValueError as e:
+        raise SystemExit(f"Error: {e}")
+    TRACER.start(script, trace_path, cprofile)
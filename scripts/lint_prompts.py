@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+lint_prompts.py
+
+Prompt JSON lint engine: schema validation plus repository rules, one parse
+per file.
+
+Each rule is a plugin registered with @rule over an already-parsed spec
+(LintFile: path, raw text, parsed spec). Rules marked fixable also provide
+a fixer that rewrites the file text; --fix applies them and re-lints.
+
+Results are cached in .cache/lint_cache.json keyed on the file's SHA-256
+(plus whether its .md sibling exists, for the pairing rule); the cache is
+dropped whenever the rule set, the schema, this file or the modules it
+relies on (schema_validate_prompts.py, schema_compiler.py, catalog.py)
+change. Uncached files are linted across a process pool (--jobs) above
+POOL_THRESHOLD files.
+
+Rules:
+  schema        prompt.schema.json (required fields, roles, semver, ...)
+  pairing       every spec has a sibling .md doc
+  minified      at most 2 lines (fixable: re-minify)
+  trailing-ws   no trailing spaces in minified files (fixable: re-minify)
+
+Usage:
+  python scripts/lint_prompts.py                       # whole catalog
+  python scripts/lint_prompts.py prompts/writing/blog-outline/blog-outline.json
+  python scripts/lint_prompts.py --fix --jobs 8
+  python scripts/lint_prompts.py --rules minified,trailing-ws --no-cache
+"""
+import argparse
+import hashlib
+import json
+import os
+import pathlib
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import catalog
+import schema_compiler
+import schema_validate_prompts
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+CACHE_PATH = pathlib.Path(".cache") / "lint_cache.json"
+CACHE_VERSION = 1
+MAX_LINES = 2
+# Below this many files a pool costs more to start than it saves.
+POOL_THRESHOLD = 8
+
+_TRAILING_WS_RE = re.compile(r" +$", re.MULTILINE)
+
+
+@dataclass
+class LintFile:
+    path: str
+    text: str
+    spec: Any
+    has_doc: bool
+
+    @property
+    def lines(self) -> int:
+        # Same count as `wc -l`: newline characters.
+        return self.text.count("\n")
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    check: Callable[[LintFile], List[str]]
+    fix: Optional[Callable[[LintFile], str]] = None
+
+
+RULES: Dict[str, Rule] = {}
+
+
+def rule(name: str, fix: Optional[Callable[[LintFile], str]] = None):
+    """Register a check(LintFile) -> [messages] plugin, optionally with a fixer."""
+    def wrap(check: Callable[[LintFile], List[str]]):
+        RULES[name] = Rule(name, check, fix)
+        return check
+    return wrap
+
+
+def minify(f: LintFile) -> str:
+    out = json.dumps(f.spec, ensure_ascii=False, separators=(",", ":"))
+    return out + "\n" if f.text.endswith("\n") or f.lines > 0 else out
+
+
+@rule("schema")
+def _schema(f: LintFile) -> List[str]:
+    return schema_validate_prompts.validate_schema(f.spec, f.path)
+
+
+@rule("pairing")
+def _pairing(f: LintFile) -> List[str]:
+    if f.has_doc:
+        return []
+    return [f"{f.path}: missing markdown doc {pathlib.Path(f.path).with_suffix('.md').name}"]
+
+
+@rule("minified", fix=minify)
+def _minified(f: LintFile) -> List[str]:
+    return [f"{f.path}: not minified (lines={f.lines})"] if f.lines > MAX_LINES else []
+
+
+@rule("trailing-ws", fix=minify)
+def _trailing_ws(f: LintFile) -> List[str]:
+    # Only meaningful for minified files; multi-line ones are reported as not minified.
+    if f.lines <= MAX_LINES and _TRAILING_WS_RE.search(f.text):
+        return [f"{f.path}: trailing spaces detected"]
+    return []
+
+
+def load(path: str) -> Tuple[Optional[LintFile], List[str]]:
+    """Read and parse one spec; returns (file, fatal errors)."""
+    try:
+        raw = pathlib.Path(path).read_bytes()
+    except OSError as e:
+        return None, [f"{path}: unreadable: {e}"]
+    text = raw.decode("utf-8", errors="replace")
+    spec, error = catalog.load_spec(raw)
+    if error:
+        return None, [f"{path}: JSON parse error: {error}"]
+    return LintFile(path, text, spec, pathlib.Path(path).with_suffix(".md").exists()), []
+
+
+def lint_file(path: str, rules: List[str], fix: bool = False) -> Tuple[str, List[str], bool]:
+    """Run the selected rules over one parsed file; returns (path, issues, fixed)."""
+    f, fatal = load(path)
+    if f is None:
+        return path, fatal, False
+    issues = _run(f, rules)
+    fixed = False
+    if fix and issues:
+        original = f.text
+        for name in rules:
+            r = RULES[name]
+            if r.fix is not None and r.check(f):
+                f = LintFile(f.path, r.fix(f), f.spec, f.has_doc)
+        if f.text != original:
+            pathlib.Path(path).write_text(f.text, encoding="utf-8")
+            fixed = True
+            issues = _run(f, rules)
+    return path, issues, fixed
+
+
+def _run(f: LintFile, rules: List[str]) -> List[str]:
+    issues = []
+    for name in rules:
+        issues.extend(RULES[name].check(f))
+    return issues
+
+
+def _lint_chunk(paths: List[str], rules: List[str], fix: bool) -> List[Tuple[str, List[str], bool]]:
+    return [lint_file(p, rules, fix) for p in paths]
+
+
+def _engine_signature(rules: List[str]) -> str:
+    h = hashlib.sha256()
+    h.update(",".join(rules).encode())
+    # Everything a cached verdict depends on: the rules, the schema and the code that applies it.
+    deps = [__file__, schema_validate_prompts.__file__, schema_compiler.__file__, catalog.__file__]
+    for dep in [pathlib.Path(d) for d in deps] + [schema_validate_prompts.SCHEMA_PATH]:
+        try:
+            h.update(dep.read_bytes())
+        except OSError:
+            pass
+    return h.hexdigest()[:16]
+
+
+class LintCache:
+    """Issues per file keyed on (content sha256, has .md sibling)."""
+
+    def __init__(self, signature: str, path: pathlib.Path = CACHE_PATH):
+        self.path = path
+        self.signature = signature
+        self.files: Dict[str, List[Any]] = {}
+        self.dirty = False
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if raw.get("version") == CACHE_VERSION and raw.get("signature") == signature:
+            self.files = raw.get("files", {})
+
+    @staticmethod
+    def key(path: str) -> Optional[str]:
+        try:
+            digest = hashlib.sha256(pathlib.Path(path).read_bytes()).hexdigest()
+        except OSError:
+            return None
+        return f"{digest}:{int(pathlib.Path(path).with_suffix('.md').exists())}"
+
+    def get(self, path: str) -> Optional[List[str]]:
+        hit = self.files.get(path)
+        key = self.key(path)
+        if hit and key and hit[0] == key:
+            return hit[1]
+        return None
+
+    def put(self, path: str, issues: List[str]) -> None:
+        key = self.key(path)
+        if key:
+            self.files[path] = [key, issues]
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": CACHE_VERSION, "signature": self.signature, "files": self.files},
+                                      separators=(",", ":")), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as e:
+            print(f"WARN: Could not write {self.path}: {e}", file=sys.stderr)
+
+
+def lint_paths(paths: List[str], rules: Optional[List[str]] = None, jobs: int = 1, fix: bool = False,
+               use_cache: bool = True) -> Dict[str, Tuple[List[str], bool]]:
+    """Lint files; returns {path: (issues, fixed)} in input order."""
+    rules = list(rules or RULES)
+    cache = LintCache(_engine_signature(rules)) if use_cache else None
+    results: Dict[str, Tuple[List[str], bool]] = {}
+    todo = []
+    for p in paths:
+        hit = cache.get(p) if cache else None
+        # Cached clean files need no fixing either; only re-run files with issues under --fix.
+        if hit is not None and not (fix and hit):
+            results[p] = (hit, False)
+        else:
+            todo.append(p)
+    if jobs <= 1 or len(todo) < POOL_THRESHOLD:
+        done = _lint_chunk(todo, rules, fix)
+    else:
+        size = max(1, len(todo) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_lint_chunk, todo[i:i + size], rules, fix) for i in range(0, len(todo), size)]
+            done = [r for fut in futures for r in fut.result()]
+    for path, issues, fixed in done:
+        results[path] = (issues, fixed)
+        if cache:
+            cache.put(path, issues)
+    if cache:
+        cache.save()
+    return {p: results[p] for p in paths}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Lint prompt JSON specs (schema + repository rules)")
+    parser.add_argument("files", nargs="*", help="Spec files (default: every spec under prompts/)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    parser.add_argument("--fix", action="store_true", help="Apply mechanical fixes (re-minify) in place")
+    parser.add_argument("--rules", help=f"Comma-separated subset of: {', '.join(RULES)}")
+    parser.add_argument("--no-cache", action="store_true", help=f"Ignore and don't update {CACHE_PATH}")
+    parser.add_argument("--json", action="store_true", help="Print {path: [issues]} as JSON")
+    args = parser.parse_args(argv)
+
+    rules = [r for r in (args.rules or "").split(",") if r] or list(RULES)
+    unknown = [r for r in rules if r not in RULES]
+    if unknown:
+        parser.error(f"unknown rules: {', '.join(unknown)}")
+    # Paths are taken relative to the caller's cwd; rules run from the repo root.
+    files = [os.path.relpath(os.path.abspath(p), REPO_ROOT) for p in args.files]
+    os.chdir(REPO_ROOT)
+    paths = list(dict.fromkeys(files)) or [str(p) for p in catalog.list_files(catalog.PROMPTS_ROOT, ".json", skip_templates=False)]
+    paths = [p for p in paths if pathlib.Path(p).name != catalog.INDEX_NAME]
+    if not paths:
+        print("❌ No prompt JSON files found", file=sys.stderr)
+        return 1
+
+    results = lint_paths(paths, rules, args.jobs, args.fix, not args.no_cache)
+    problems = [i for issues, _fixed in results.values() for i in issues]
+    if args.json:
+        print(json.dumps({p: issues for p, (issues, _fixed) in results.items()}, indent=2))
+        return 1 if problems else 0
+    for path, (_issues, fixed) in results.items():
+        if fixed:
+            print(f"🔧 Fixed {path}")
+    if problems:
+        print(f"❌ Lint failed ({len(problems)} issues across {len(paths)} files):")
+        for p in problems:
+            print(f" - {p}")
+        return 1
+    print(f"✅ All {len(paths)} prompt files passed lint rules ({', '.join(rules)})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+prompt_history.py
+
+Versioned history index for "prompt as of version / date" lookups.
+
+The indexer walks first-parent git history once (`git log --raw`, which
+already carries the blob id of every changed file) and reads the changed
+spec and doc blobs through one `git cat-file --batch` process
+(scripts/gitobjects.py) to pick up each spec's `version` and each doc's
+`last_updated`. Every commit that changes a prompt's .json or .md appends a
+revision:
+
+  [commit, commit time (unix), spec path, spec blob, version, md blob, last_updated]
+
+Prompts are keyed by slug (file stem), so moving a prompt between
+categories keeps its history; a deleted spec is a revision with a null
+blob. The index lives in .cache/prompt_history.json together with the head
+commit it covers; later runs only walk `<head>..HEAD` and append. If the
+recorded head is no longer an ancestor of HEAD (rebase, branch switch) the
+index is rebuilt from scratch.
+
+Lookups never scan history: each prompt keeps a version -> revision map
+(the latest revision carrying that version, i.e. the final state of the
+release) and a time-ordered revision list for bisecting by date. Spec
+content is read by blob id.
+
+Usage:
+  python scripts/prompt_history.py build [--rebuild]
+  python scripts/prompt_history.py log repo-audit
+  python scripts/prompt_history.py show repo-audit --version 1.0.0
+  python scripts/prompt_history.py show repo-audit --date 2025-09-01
+  python scripts/prompt_history.py diff repo-audit 1.0.0 1.1.0
+"""
+import argparse
+import bisect
+import difflib
+import itertools
+import json
+import pathlib
+import subprocess
+import sys
+from datetime import date, datetime, time, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import catalog
+from gitobjects import GitObjectReader, run_git
+
+INDEX_VERSION = 1
+INDEX_PATH = pathlib.Path(".cache") / "prompt_history.json"
+REV_FIELDS = ("commit", "time", "path", "blob", "version", "md_blob", "last_updated")
+NULL_OID = "0" * 40
+
+
+def _prompt_file(path: str) -> Optional[Tuple[str, str]]:
+    """(slug, kind) for a prompt .json/.md path, None for anything else."""
+    p = pathlib.PurePosixPath(path)
+    if p.parts[:1] != ("prompts",) or "templates" in p.parts or len(p.parts) < 3 or p.name == catalog.INDEX_NAME:
+        return None
+    if p.suffix == ".json":
+        return p.stem, "spec"
+    if p.suffix == ".md":
+        return p.stem, "md"
+    return None
+
+
+def read_log(rev_range: str) -> List[Tuple[str, int, List[Tuple[str, str]]]]:
+    """Oldest-first [(commit, time, [(path, new blob or None)])] touching prompts/."""
+    out = run_git(["log", "--reverse", "--first-parent", "--diff-merges=first-parent", "--raw", "--no-abbrev",
+                   "--no-renames", "--format=commit %H %ct", rev_range, "--", "prompts/"]).decode("utf-8", "replace")
+    commits: List[Tuple[str, int, List[Tuple[str, str]]]] = []
+    for line in out.splitlines():
+        if line.startswith("commit "):
+            _, sha, ts = line.split(" ")
+            commits.append((sha, int(ts), []))
+        elif line.startswith(":") and commits:
+            meta, path = line.split("\t", 1)
+            blob = meta.split(" ")[3]
+            commits[-1][2].append((path, None if blob == NULL_OID else blob))
+    return commits
+
+
+def _spec_version(raw: Optional[bytes]) -> Optional[str]:
+    spec, _error = catalog.load_spec(raw) if raw is not None else (None, None)
+    return spec.get("version") if isinstance(spec, dict) else None
+
+
+def _last_updated(raw: Optional[bytes]) -> Optional[str]:
+    if raw is None:
+        return None
+    value = catalog.extract_frontmatter(raw.decode("utf-8", "replace")).get("last_updated")
+    return str(value) if value else None
+
+
+def build(previous: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], int]:
+    """Return (index, revisions added), extending ``previous`` when it is an ancestor of HEAD."""
+    head = run_git(["rev-parse", "HEAD"]).decode().strip()
+    prompts: Dict[str, List[List[Any]]] = {}
+    rev_range = "HEAD"
+    if previous and previous.get("version") == INDEX_VERSION and previous.get("head"):
+        if previous["head"] == head:
+            return previous, 0
+        if subprocess.run(["git", "merge-base", "--is-ancestor", previous["head"], head]).returncode == 0:
+            prompts = previous["prompts"]
+            rev_range = f"{previous['head']}..HEAD"
+    commits = read_log(rev_range)
+
+    # One batched read for every spec/doc blob the new commits introduce.
+    kinds = {blob: hit[1] for _sha, _ts, changes in commits for path, blob in changes
+             if blob and (hit := _prompt_file(path))}
+    meta: Dict[str, Optional[str]] = {}
+    if kinds:
+        with GitObjectReader() as reader:
+            for blob, _oid, raw in reader.iter_objects(sorted(kinds)):
+                meta[blob] = _spec_version(raw) if kinds[blob] == "spec" else _last_updated(raw)
+
+    state = {slug: dict(zip(REV_FIELDS, revs[-1])) for slug, revs in prompts.items()}
+    added = 0
+    for sha, ts, changes in commits:
+        # (slug, kind) -> (path, blob); an add wins over a delete so moves keep the prompt alive.
+        latest: Dict[Tuple[str, str], Tuple[str, Optional[str]]] = {}
+        for path, blob in changes:
+            hit = _prompt_file(path)
+            if hit is not None and (hit not in latest or latest[hit][1] is None):
+                latest[hit] = (path, blob)
+        for (slug, kind), (path, blob) in latest.items():
+            cur = state.setdefault(slug, dict.fromkeys(REV_FIELDS))
+            if kind == "spec":
+                cur.update(path=path, blob=blob, version=meta.get(blob) if blob else None)
+            else:
+                cur.update(md_blob=blob, last_updated=meta.get(blob) if blob else None)
+        for slug in sorted({slug for slug, _kind in latest}):
+            cur = state[slug]
+            if cur["path"] is None:
+                continue  # docs without a spec (release notes, READMEs) have no versions
+            cur.update(commit=sha, time=ts)
+            revs = prompts.setdefault(slug, [])
+            row = [cur[f] for f in REV_FIELDS]
+            if revs and revs[-1][2:4] == row[2:4] and revs[-1][5] == row[5]:
+                continue  # e.g. only test.sh changed alongside
+            revs.append(row)
+            added += 1
+    versions = {slug: {} for slug in prompts}
+    for slug, revs in prompts.items():
+        for i, rev in enumerate(revs):
+            if rev[4] is not None and rev[3] is not None:
+                versions[slug][rev[4]] = i
+    return {"version": INDEX_VERSION, "head": head, "fields": list(REV_FIELDS),
+            "prompts": dict(sorted(prompts.items())), "versions": versions}, added
+
+
+def load_index(update: bool = True, rebuild: bool = False) -> Tuple[Dict[str, Any], int]:
+    """Load the cached index, extending it to HEAD unless ``update`` is False."""
+    previous = None
+    if not rebuild:
+        try:
+            previous = json.loads(INDEX_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            previous = None
+    if previous is not None and not update:
+        return previous, 0
+    data, added = build(previous)
+    if data is not previous:
+        try:
+            INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp = INDEX_PATH.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            tmp.replace(INDEX_PATH)
+        except OSError as e:
+            print(f"WARN: Could not write {INDEX_PATH}: {e}", file=sys.stderr)
+    return data, added
+
+
+def parse_when(text: str) -> int:
+    """Unix time for an ISO date (end of that day, UTC) or datetime (UTC if naive)."""
+    try:
+        if len(text) == 10:
+            moment = datetime.combine(date.fromisoformat(text), time.max)
+        else:
+            moment = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError as e:
+        raise ValueError(f"invalid date {text!r}: use YYYY-MM-DD or an ISO datetime") from e
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+class PromptHistory:
+    """Version and date lookups over the history index; blobs read on demand."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.prompts: Dict[str, List[List[Any]]] = data["prompts"]
+        self.versions: Dict[str, Dict[str, int]] = data["versions"]
+        # Commit times are not monotonic along first-parent history (clock skew,
+        # rebased commits); bisect over the running maximum instead.
+        self._times = {slug: list(itertools.accumulate((r[1] for r in revs), max)) for slug, revs in self.prompts.items()}
+        self._reader: Optional[GitObjectReader] = None
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def revisions(self, slug: str) -> List[Dict[str, Any]]:
+        if slug not in self.prompts:
+            raise KeyError(slug)
+        return [self._revision(r) for r in self.prompts[slug]]
+
+    @staticmethod
+    def _revision(row: List[Any]) -> Dict[str, Any]:
+        rev = dict(zip(REV_FIELDS, row))
+        rev["date"] = datetime.fromtimestamp(rev["time"], timezone.utc).isoformat()
+        return rev
+
+    def at_version(self, slug: str, version: str) -> Optional[Dict[str, Any]]:
+        """Latest revision of ``slug`` whose spec carries ``version``."""
+        if slug not in self.prompts:
+            raise KeyError(slug)
+        i = self.versions[slug].get(version)
+        return None if i is None else self._revision(self.prompts[slug][i])
+
+    def at_date(self, slug: str, when: int) -> Optional[Dict[str, Any]]:
+        """Revision of ``slug`` current at unix time ``when`` (None if it did not exist yet)."""
+        if slug not in self.prompts:
+            raise KeyError(slug)
+        i = bisect.bisect_right(self._times[slug], when)
+        return self._revision(self.prompts[slug][i - 1]) if i else None
+
+    def spec(self, rev: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if rev.get("blob") is None:
+            return None
+        if self._reader is None:
+            self._reader = GitObjectReader()
+        spec, _error = catalog.load_spec(self._reader.read(rev["blob"]) or b"")
+        return spec
+
+    def diff(self, slug: str, old: str, new: str) -> List[str]:
+        """Unified diff between the specs of two versions."""
+        revs = []
+        for version in (old, new):
+            rev = self.at_version(slug, version)
+            if rev is None:
+                raise KeyError(f"{slug}@{version}")
+            revs.append(rev)
+        a, b = (spec_lines(self.spec(r)) for r in revs)
+        return list(difflib.unified_diff(a, b, f"{slug}@{old} ({revs[0]['commit'][:12]})",
+                                         f"{slug}@{new} ({revs[1]['commit'][:12]})", lineterm=""))
+
+
+def spec_lines(spec: Optional[Dict[str, Any]]) -> List[str]:
+    """Diff-friendly rendering: one line per scalar field, message contents line by line."""
+    if spec is None:
+        return []
+    lines = []
+    for key, value in spec.items():
+        if key == "messages" and isinstance(value, list):
+            for i, m in enumerate(value):
+                m = m if isinstance(m, dict) else {"content": m}
+                lines.append(f"messages[{i}] ({m.get('role')}):")
+                lines.extend(f"  {line}" for line in str(m.get("content", "")).splitlines())
+        else:
+            lines.append(f"{key}: {json.dumps(value, ensure_ascii=False, sort_keys=True)}")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Versioned prompt history index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="Index new commits (or everything with --rebuild)")
+    p_build.add_argument("--rebuild", action="store_true")
+    p_log = sub.add_parser("log", help="List a prompt's revisions")
+    p_log.add_argument("slug")
+    p_log.add_argument("--json", action="store_true")
+    p_show = sub.add_parser("show", help="Print a prompt's spec at a version or date")
+    p_show.add_argument("slug")
+    when = p_show.add_mutually_exclusive_group(required=True)
+    when.add_argument("--version", dest="at_version")
+    when.add_argument("--date", dest="at_date", help="YYYY-MM-DD (end of day, UTC) or ISO datetime")
+    p_diff = sub.add_parser("diff", help="Diff a prompt's spec between two versions")
+    p_diff.add_argument("slug")
+    p_diff.add_argument("old")
+    p_diff.add_argument("new")
+    args = parser.parse_args()
+
+    try:
+        data, added = load_index(rebuild=getattr(args, "rebuild", False))
+    except subprocess.CalledProcessError as e:
+        print(f"Error: git failed: {e.stderr.decode(errors='replace').strip()}", file=sys.stderr)
+        sys.exit(1)
+    if args.command == "build":
+        total = sum(len(r) for r in data["prompts"].values())
+        print(f"Indexed {len(data['prompts'])} prompts, {total} revisions up to {data['head'][:12]} ({added} new)")
+        return
+
+    history = PromptHistory(data)
+    try:
+        if args.command == "log":
+            revs = history.revisions(args.slug)
+            if args.json:
+                print(json.dumps(revs, indent=2))
+            for r in ([] if args.json else revs):
+                print(f"{r['commit'][:12]}  {r['date'][:10]}  {str(r['version'] or '-'):<10} "
+                      f"{str(r['last_updated'] or '-'):<11} {r['path'] if r['blob'] else '(deleted)'}")
+        elif args.command == "show":
+            if args.at_version:
+                rev = history.at_version(args.slug, args.at_version)
+                missing = f"{args.slug} has no version {args.at_version}"
+            else:
+                rev = history.at_date(args.slug, parse_when(args.at_date))
+                missing = f"{args.slug} did not exist at {args.at_date}"
+            spec = history.spec(rev) if rev else None
+            if spec is None:
+                print(f"Error: {missing}" if rev is None else f"Error: {args.slug} was deleted at {rev['commit'][:12]}",
+                      file=sys.stderr)
+                sys.exit(1)
+            print(f"# {rev['path']} @ {rev['commit'][:12]} ({rev['date']})", file=sys.stderr)
+            print(json.dumps(spec, ensure_ascii=False, separators=(",", ":")))
+        else:
+            print("\n".join(history.diff(args.slug, args.old, args.new)) or "No differences.")
+    except KeyError as e:
+        print(f"Error: unknown prompt or version {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+prompt_tests.py
+
+Declarative per-prompt test runner.
+
+Each prompt directory carries a test.toml next to its <slug>.json describing
+what the spec must contain. The file is compiled once into check closures
+(all regexes precompiled), the spec is loaded once, and every check runs
+in-process; prompts are spread across a process pool when there are enough
+of them. test.sh in each directory is a thin wrapper around this runner.
+
+test.toml keys (all optional):
+  required_fields = ["target_model", "parameters.reasoning_effort"]  # present, not null/false
+  non_empty       = ["assumptions", "risks_or_notes"]                # non-empty list/string/object
+  roles           = ["system", "user"]                               # a message with each role exists
+  sections        = ["Role", "Goals"]                                # "# <heading>" in system content
+  schema          = true                                             # passes scripts/prompt.schema.json
+
+  [allowed]                                                          # dotted path -> allowed values
+  "parameters.reasoning_effort" = ["medium", "high"]
+  "parameters.verbosity" = { values = ["low"], warn = true }       # report only
+  "messages.0.role" = ["system"]                                     # list items by index
+
+  [limits]                                                           # numeric bounds, checked if present
+  lines = { max = 1 }                                                # "lines"/"bytes": the spec file itself
+  "parameters.temperature" = { max = 0.3, warn = true }
+
+  [[match]]                         # regexes (Python syntax) searched line-wise in:
+  name = "Review role"              #   system | user | any (system + user) | <dotted path>
+  in = "system"                     # or a list of those; lists/objects search items/keys
+  patterns = ["code.*review"]       # or pattern = "..."
+  min = 1                           # how many must match (default: all)
+  case_sensitive = false            # default false, like grep -i
+  warn = false                      # report but do not fail the prompt
+
+Usage:
+  python scripts/prompt_tests.py                          # every prompt with a test.toml
+  python scripts/prompt_tests.py code-review prompts/meta/promptsmith --verbose
+  python scripts/prompt_tests.py --jobs 8 --junit .cache/prompt-tests.xml --json -
+"""
+import argparse
+import json
+import os
+import pathlib
+import re
+import sys
+import time
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+import catalog
+
+ASSERTIONS_NAME = "test.toml"
+POOL_THRESHOLD = 8  # below this many prompts, process startup costs more than it saves
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+_MISSING = object()
+_TOP_KEYS = {"required_fields", "non_empty", "roles", "sections", "schema", "allowed", "limits", "match"}
+_MATCH_KEYS = {"name", "in", "pattern", "patterns", "min", "case_sensitive", "warn"}
+
+
+@dataclass
+class Case:
+    name: str
+    ok: bool
+    message: str = ""
+    warn: bool = False
+
+
+@dataclass
+class PromptResult:
+    slug: str
+    path: str
+    cases: List[Case] = field(default_factory=list)
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or any(not c.ok and not c.warn for c in self.cases)
+
+
+Check = Callable[[Dict[str, Any], bytes], Case]
+
+
+def _lookup(data: Any, dotted: str) -> Any:
+    for part in dotted.split("."):
+        if isinstance(data, list) and part.isdigit() and int(part) < len(data):
+            data = data[int(part)]
+        elif isinstance(data, dict) and part in data:
+            data = data[part]
+        else:
+            return _MISSING
+    return data
+
+
+def _role_text(spec: Dict[str, Any], role: str) -> str:
+    return "\n".join(str(m.get("content", "")) for m in spec.get("messages") or []
+                     if isinstance(m, dict) and m.get("role") == role)
+
+
+def _target_text(spec: Dict[str, Any], target: str) -> str:
+    if target in ("system", "user"):
+        return _role_text(spec, target)
+    if target == "any":
+        return _role_text(spec, "system") + " " + _role_text(spec, "user")
+    value = _lookup(spec, target)
+    if value is _MISSING or value is None:
+        return ""
+    if isinstance(value, dict):
+        return "\n".join(value)
+    if isinstance(value, list):
+        return "\n".join(v if isinstance(v, str) else json.dumps(v, ensure_ascii=False) for v in value)
+    return str(value)
+
+
+def _compile_match(spec: Dict[str, Any], where: str) -> Check:
+    unknown = set(spec) - _MATCH_KEYS
+    if unknown:
+        raise ValueError(f"{where}: unknown match keys {sorted(unknown)}")
+    patterns = spec.get("patterns") or ([spec["pattern"]] if "pattern" in spec else [])
+    if not patterns:
+        raise ValueError(f"{where}: match needs 'pattern' or 'patterns'")
+    flags = re.MULTILINE | (0 if spec.get("case_sensitive") else re.IGNORECASE)
+    compiled = [re.compile(p, flags) for p in patterns]
+    need = spec.get("min", len(compiled))
+    target = spec.get("in", "system")
+    targets = [target] if isinstance(target, str) else list(target)
+    where_text = " or ".join(targets)
+    name = spec.get("name") or f"{where_text} matches {patterns[0]}"
+    warn = bool(spec.get("warn"))
+
+    def check(data, _raw):
+        text = "\n".join(_target_text(data, t) for t in targets)
+        missing = [rx.pattern for rx in compiled if not rx.search(text)]
+        found = len(compiled) - len(missing)
+        if found >= need:
+            return Case(name, True, warn=warn)
+        detail = f"{found}/{len(compiled)} matched, need {need}" if need < len(compiled) else "missing"
+        return Case(name, False, f"{detail}: {', '.join(missing)} (in {where_text})", warn=warn)
+    return check
+
+
+def compile_suite(assertions: Dict[str, Any], where: str = ASSERTIONS_NAME) -> List[Check]:
+    """Turn a parsed test.toml into a list of check closures."""
+    unknown = set(assertions) - _TOP_KEYS
+    if unknown:
+        raise ValueError(f"{where}: unknown keys {sorted(unknown)}")
+    checks: List[Check] = []
+
+    for path in assertions.get("required_fields", []):
+        def required(data, _raw, path=path):
+            value = _lookup(data, path)
+            ok = value is not _MISSING and value is not None and value is not False
+            return Case(f"field {path}", ok, "" if ok else "missing or null")
+        checks.append(required)
+
+    for path in assertions.get("non_empty", []):
+        def non_empty(data, _raw, path=path):
+            value = _lookup(data, path)
+            ok = value is not _MISSING and value is not None and bool(value)
+            return Case(f"non-empty {path}", ok, "" if ok else "missing or empty")
+        checks.append(non_empty)
+
+    for role in assertions.get("roles", []):
+        def has_role(data, _raw, role=role):
+            ok = any(isinstance(m, dict) and m.get("role") == role for m in data.get("messages") or [])
+            return Case(f"{role} message", ok, "" if ok else f"no message with role '{role}'")
+        checks.append(has_role)
+
+    if assertions.get("sections"):
+        headings = [(s, re.compile(rf"^#+\s*{re.escape(s)}", re.MULTILINE | re.IGNORECASE))
+                    for s in assertions["sections"]]
+
+        def sections(data, _raw):
+            text = _role_text(data, "system")
+            missing = [s for s, rx in headings if not rx.search(text)]
+            return Case("system sections", not missing, f"missing headings: {', '.join(missing)}" if missing else "")
+        checks.append(sections)
+
+    for path, allowed in assertions.get("allowed", {}).items():
+        warn = isinstance(allowed, dict) and bool(allowed.get("warn"))
+        values = tuple(allowed["values"] if isinstance(allowed, dict) else allowed)
+
+        def in_allowed(data, _raw, path=path, values=values, warn=warn):
+            value = _lookup(data, path)
+            ok = value in values
+            shown = "missing" if value is _MISSING else json.dumps(value)
+            return Case(f"{path} in {list(values)}", ok, "" if ok else f"got {shown}", warn=warn)
+        checks.append(in_allowed)
+
+    if assertions.get("schema"):
+        def schema(data, _raw):
+            import schema_validate_prompts
+            errors = schema_validate_prompts.validate_schema(data, "spec")
+            return Case("schema", not errors, "; ".join(errors))
+        checks.append(schema)
+
+    for path, bounds in assertions.get("limits", {}).items():
+        def in_limits(data, raw, path=path, lo=bounds.get("min"), hi=bounds.get("max"), warn=bool(bounds.get("warn"))):
+            if path == "lines":
+                value = raw.count(b"\n")
+            elif path == "bytes":
+                value = len(raw)
+            else:
+                value = _lookup(data, path)
+            name = f"{path} within [{'' if lo is None else lo}, {'' if hi is None else hi}]"
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                return Case(name, True, warn=warn)
+            ok = (lo is None or value >= lo) and (hi is None or value <= hi)
+            return Case(name, ok, "" if ok else f"got {value}", warn=warn)
+        checks.append(in_limits)
+
+    for i, spec in enumerate(assertions.get("match", [])):
+        checks.append(_compile_match(spec, f"{where}: match[{i}]"))
+    return checks
+
+
+def load_suite(path: pathlib.Path) -> List[Check]:
+    with open(path, "rb") as f:
+        return compile_suite(tomllib.load(f), str(path))
+
+
+def run_prompt(directory: str) -> PromptResult:
+    """Run one directory's test.toml against its <slug>.json."""
+    start = time.perf_counter()
+    base = pathlib.Path(directory)
+    slug = base.name
+    spec_path = base / f"{slug}.json"
+    result = PromptResult(slug=slug, path=str(spec_path))
+    try:
+        checks = load_suite(base / ASSERTIONS_NAME)
+        raw = spec_path.read_bytes()
+        data, error = catalog.load_spec(raw)
+        if error:
+            raise ValueError(f"invalid JSON: {error}")
+        if not isinstance(data, dict):
+            raise ValueError("spec is not a JSON object")
+        result.cases = [check(data, raw) for check in checks]
+    except (OSError, ValueError, re.error, tomllib.TOMLDecodeError) as e:
+        result.error = str(e)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _run_chunk(directories: List[str]) -> List[PromptResult]:
+    return [run_prompt(d) for d in directories]
+
+
+def run_all(directories: List[str], jobs: int = 1) -> Iterator[PromptResult]:
+    """Yield results in input order, spreading prompts over ``jobs`` processes."""
+    if jobs <= 1 or len(directories) < POOL_THRESHOLD:
+        yield from map(run_prompt, directories)
+        return
+    size = max(1, len(directories) // (jobs * 4))
+    chunks = [directories[i:i + size] for i in range(0, len(directories), size)]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for results in pool.map(_run_chunk, chunks):
+            yield from results
+
+
+def discover(root: pathlib.Path = catalog.PROMPTS_ROOT) -> List[str]:
+    """Every prompt directory under root that has a test.toml."""
+    return [top for top, files in catalog.walk(root)
+            if "templates" not in pathlib.PurePath(top).parts and any(e.name == ASSERTIONS_NAME for e in files)]
+
+
+def resolve(targets: Iterable[str], cwd: str = ".") -> List[str]:
+    """Map slugs or directory paths (relative to cwd) to prompt directories."""
+    known: Optional[Dict[str, str]] = None
+    out = []
+    for t in targets:
+        p = pathlib.Path(cwd, t)
+        if p.is_file():
+            p = p.parent
+        if p.is_dir():
+            p = p.resolve()
+            out.append(os.path.relpath(p, REPO_ROOT) if p.is_relative_to(REPO_ROOT) else str(p))
+            continue
+        if known is None:
+            known = {pathlib.PurePath(d).name: d for d in discover()}
+        if t not in known:
+            raise SystemExit(f"Error: unknown prompt '{t}'")
+        out.append(known[t])
+    return out
+
+
+def write_junit(results: List[PromptResult], out) -> None:
+    tests = sum(max(len(r.cases), 1) for r in results)
+    failures = sum(1 for r in results for c in r.cases if not c.ok and not c.warn)
+    errors = sum(1 for r in results if r.error)
+    total = sum(r.seconds for r in results)
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write(f'<testsuites name="prompts" tests="{tests}" failures="{failures}" errors="{errors}" time="{total:.6f}">\n')
+    for r in results:
+        r_fail = sum(1 for c in r.cases if not c.ok and not c.warn)
+        out.write(f'  <testsuite name={quoteattr(r.slug)} tests="{max(len(r.cases), 1)}" failures="{r_fail}" '
+                  f'errors="{1 if r.error else 0}" time="{r.seconds:.6f}" file={quoteattr(r.path)}>\n')
+        if r.error:
+            out.write(f'    <testcase classname={quoteattr(r.slug)} name="load"><error message={quoteattr(r.error)}/></testcase>\n')
+        for c in r.cases:
+            out.write(f'    <testcase classname={quoteattr(r.slug)} name={quoteattr(c.name)}')
+            if c.ok:
+                out.write("/>\n")
+            elif c.warn:
+                out.write(f'><system-out>{escape("WARN: " + c.message)}</system-out></testcase>\n')
+            else:
+                out.write(f'><failure message={quoteattr(c.message)}/></testcase>\n')
+        out.write("  </testsuite>\n")
+    out.write("</testsuites>\n")
+
+
+def write_json(results: List[PromptResult], out) -> None:
+    report = [dict(asdict(r), failed=r.failed) for r in results]
+    out.write(json.dumps(report, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+def _write(path: str, writer, results: List[PromptResult]) -> None:
+    if path == "-":
+        writer(results, sys.stdout)
+        return
+    pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        writer(results, f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run declarative test.toml assertions against prompt specs")
+    parser.add_argument("targets", nargs="*", help="Prompt slugs or directories (default: all with a test.toml)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    parser.add_argument("--junit", metavar="PATH", help="Write JUnit XML ('-' for stdout)")
+    parser.add_argument("--json", metavar="PATH", help="Write JSON results ('-' for stdout)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print every check, not just failures")
+    args = parser.parse_args(argv)
+
+    cwd = os.getcwd()
+    os.chdir(REPO_ROOT)
+    directories = resolve(args.targets, cwd) or discover()
+    if not directories:
+        print(f"No {ASSERTIONS_NAME} files found under {catalog.PROMPTS_ROOT}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    results = list(run_all(directories, args.jobs))
+    elapsed = time.perf_counter() - start
+
+    # Keep stdout clean when a report is streamed there.
+    log = sys.stderr if "-" in (args.junit, args.json) else sys.stdout
+    for r in results:
+        print(f"{'FAIL' if r.failed else 'PASS'} {r.path}", file=log)
+        if r.error:
+            print(f"  ❌ {r.error}", file=log)
+        for c in r.cases:
+            if not c.ok:
+                print(f"  {'⚠️ ' if c.warn else '❌'} {c.name}: {c.message}", file=log)
+            elif args.verbose:
+                print(f"  ✅ {c.name}", file=log)
+    failed = sum(r.failed for r in results)
+    checks = sum(len(r.cases) for r in results)
+    print(f"{len(results)} prompts, {checks} checks, {failed} failed in {elapsed * 1000:.0f} ms", file=log)
+
+    if args.junit:
+        _write(args.junit, write_junit, results)
+    if args.json:
+        _write(args.json, write_json, results)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
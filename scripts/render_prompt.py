@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+render_prompt.py
+
+Render prompt specs into provider-ready request payloads.
+
+Each spec's messages are compiled once into a list of segments (literal text
+and slots) and cached by the spec hash from prompts/index.json, so rendering
+is a single join per message. Slot grammar inside message content:
+
+  {{NAME}}             required
+  {{NAME: hint}}       required; the text after ':' is a hint for authors
+  {{NAME:=default}}    optional, falls back to default
+  {{NAME|default}}     optional, falls back to default (no further '|')
+
+NAME is upper-case letters, digits and underscores. Any other {{...}} text
+(choice lists such as {{yes|no | default: no}}, "e.g." hints) is addressed
+to the model and kept verbatim.
+
+The payload is the spec's target_model and messages with parameters merged
+at the top level (Chat Completions shape):
+  {"model": ..., "messages": [{"role", "content"}, ...], "reasoning_effort": ..., ...}
+
+Usage:
+  python scripts/render_prompt.py repo-audit --var REPO_URL_OR_PATH=. --var NFRS=latency
+  python scripts/render_prompt.py repo-audit --vars vars.json
+  python scripts/render_prompt.py repo-audit --slots
+  python scripts/render_prompt.py repo-audit --batch sets.ndjson > payloads.ndjson
+  python scripts/render_prompt.py --batch requests.ndjson   # lines carry "slug"
+"""
+import argparse
+import functools
+import hashlib
+import json
+import pathlib
+import re
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+INDEX_PATH = pathlib.Path("prompts/index.json")
+CACHE_SIZE = 256
+
+SLOT_RE = re.compile(r"\{\{([A-Z][A-Z0-9_]*)(?:(:=)([^}]*)|\|([^|}]*)|:\s*([^}]*))?\}\}")
+
+# A segment is either literal text or a slot reference.
+Segment = Union[str, "Slot"]
+
+
+class MissingSlotsError(ValueError):
+    """Raised when required slots have no value."""
+
+    def __init__(self, slug: str, names: List[str]):
+        super().__init__(f"{slug}: missing required slots: {', '.join(names)}")
+        self.slug = slug
+        self.names = names
+
+
+@dataclass(frozen=True)
+class Slot:
+    name: str
+    default: Optional[str] = None
+    hint: Optional[str] = None
+    raw: str = ""
+
+    @property
+    def required(self) -> bool:
+        return self.default is None
+
+
+@dataclass(frozen=True)
+class Template:
+    slug: str
+    hash: str
+    model: Optional[str]
+    parameters: Dict[str, Any]
+    messages: Tuple[Tuple[str, Tuple[Segment, ...]], ...]
+    required: Tuple[str, ...]
+    slots: Dict[str, Slot]
+    descriptions: Dict[str, str]
+
+    def missing(self, variables: Dict[str, Any]) -> List[str]:
+        return [name for name in self.required if variables.get(name) is None]
+
+    def render(self, variables: Dict[str, Any], strict: bool = True) -> Dict[str, Any]:
+        """Return the request payload; unfilled required slots raise unless strict=False."""
+        if strict:
+            missing = self.missing(variables)
+            if missing:
+                raise MissingSlotsError(self.slug, missing)
+        values = {k: _text(v) for k, v in variables.items() if v is not None}
+        messages = [
+            {"role": role, "content": "".join(
+                seg if seg.__class__ is str else values.get(seg.name, seg.raw if seg.default is None else seg.default)
+                for seg in segments)}
+            for role, segments in self.messages
+        ]
+        payload: Dict[str, Any] = {"model": self.model, "messages": messages}
+        payload.update(self.parameters)
+        return payload
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def compile_segments(content: str) -> List[Segment]:
+    """Split message content into literal strings and Slot references."""
+    segments: List[Segment] = []
+    pos = 0
+    for m in SLOT_RE.finditer(content):
+        if m.start() > pos:
+            segments.append(content[pos:m.start()])
+        name, walrus, assign_default, pipe_default, hint = m.groups()
+        default = assign_default if walrus else pipe_default
+        segments.append(Slot(name, default, hint.strip() if hint else None, m.group(0)))
+        pos = m.end()
+    if pos < len(content):
+        segments.append(content[pos:])
+    return segments
+
+
+def spec_hash(spec: Dict[str, Any]) -> str:
+    """Same content hash build_prompts_index.py records."""
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def compile_spec(slug: str, spec: Dict[str, Any], digest: Optional[str] = None) -> Template:
+    messages = []
+    slots: Dict[str, Slot] = {}
+    required: List[str] = []
+    for msg in spec.get("messages") or []:
+        segments = compile_segments(msg.get("content") or "")
+        for seg in segments:
+            if isinstance(seg, Slot):
+                # A name stays required if any occurrence lacks a default.
+                if seg.name not in slots or (seg.required and not slots[seg.name].required):
+                    slots[seg.name] = seg
+                if seg.required and seg.name not in required:
+                    required.append(seg.name)
+        messages.append((msg.get("role"), tuple(segments)))
+    variables = spec.get("input_variables")
+    return Template(
+        slug=slug,
+        hash=digest or spec_hash(spec),
+        model=spec.get("target_model"),
+        parameters=dict(spec.get("parameters") or {}),
+        messages=tuple(messages),
+        required=tuple(required),
+        slots=slots,
+        descriptions={k: str(v) for k, v in variables.items()} if isinstance(variables, dict) else {},
+    )
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _compiled(digest: str, path: str) -> Template:
+    spec = json.loads(pathlib.Path(path).read_text(encoding="utf-8"))
+    return compile_spec(pathlib.Path(path).stem, spec, digest)
+
+
+class Renderer:
+    """Resolves slugs through prompts/index.json and renders cached templates."""
+
+    def __init__(self, index_path: pathlib.Path = INDEX_PATH):
+        self.index_path = index_path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+
+    def _index(self) -> Dict[str, Dict[str, Any]]:
+        st = self.index_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._entries is None or stamp != self._stamp:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            self._entries = {e["slug"]: e for e in data.get("prompts", [])}
+            self._stamp = stamp
+        return self._entries
+
+    def template(self, slug: str) -> Template:
+        entry = self._index().get(slug)
+        if entry is None:
+            raise KeyError(f"unknown prompt slug: {slug}")
+        return _compiled(entry["hash"], entry["path"])
+
+    def render(self, slug: str, variables: Dict[str, Any], strict: bool = True) -> Dict[str, Any]:
+        return self.template(slug).render(variables, strict)
+
+    def render_many(self, items: Iterable[Tuple[Optional[str], Dict[str, Any]]],
+                    strict: bool = True) -> Iterator[Dict[str, Any]]:
+        """Render (slug, line) pairs; yields {"id"?, "slug", "payload"} or {"id"?, "slug", "error"}."""
+        for default_slug, line in items:
+            slug = line.get("slug", default_slug)
+            if "variables" in line:
+                variables = line["variables"]
+            else:
+                variables = {k: v for k, v in line.items() if k not in ("slug", "id")}
+            out: Dict[str, Any] = {"id": line["id"]} if "id" in line else {}
+            out["slug"] = slug
+            try:
+                if not slug:
+                    raise KeyError("line has no slug")
+                out["payload"] = self.render(slug, variables, strict)
+            except (KeyError, ValueError, OSError) as e:
+                out["error"] = e.args[0] if isinstance(e, KeyError) else str(e)
+            yield out
+
+
+def cache_info():
+    return _compiled.cache_info()
+
+
+def _read_ndjson(stream) -> Iterator[Dict[str, Any]]:
+    for n, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise SystemExit(f"ERROR: batch line {n}: {e}")
+        if not isinstance(obj, dict):
+            raise SystemExit(f"ERROR: batch line {n}: expected a JSON object")
+        yield obj
+
+
+def _parse_vars(pairs: List[str], vars_file: Optional[pathlib.Path]) -> Dict[str, Any]:
+    variables: Dict[str, Any] = {}
+    if vars_file:
+        variables.update(json.loads(vars_file.read_text(encoding="utf-8")))
+    for pair in pairs:
+        name, sep, value = pair.partition("=")
+        if not sep:
+            raise SystemExit(f"ERROR: --var expects NAME=VALUE, got {pair!r}")
+        variables[name] = value
+    return variables
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Render prompt specs into request payloads")
+    parser.add_argument("slug", nargs="?", help="Prompt slug (optional with --batch when lines carry 'slug')")
+    parser.add_argument("--var", action="append", default=[], metavar="NAME=VALUE", help="Slot value (repeatable)")
+    parser.add_argument("--vars", type=pathlib.Path, help="JSON object of slot values")
+    parser.add_argument("--batch", metavar="PATH", help="NDJSON variable sets ('-' for stdin); writes NDJSON results")
+    parser.add_argument("--allow-missing", action="store_true", help="Leave unfilled required slots as-is")
+    parser.add_argument("--slots", action="store_true", help="List the spec's slots instead of rendering")
+    parser.add_argument("--index", type=pathlib.Path, default=INDEX_PATH)
+    args = parser.parse_args(argv)
+
+    renderer = Renderer(args.index)
+    strict = not args.allow_missing
+    if args.batch:
+        stream = sys.stdin if args.batch == "-" else open(args.batch, encoding="utf-8")
+        failed = 0
+        with stream:
+            for out in renderer.render_many(((args.slug, line) for line in _read_ndjson(stream)), strict):
+                failed += "error" in out
+                sys.stdout.write(json.dumps(out, ensure_ascii=False, separators=(",", ":")) + "\n")
+        if failed:
+            print(f"WARN: {failed} batch line(s) failed to render", file=sys.stderr)
+        return 1 if failed else 0
+
+    if not args.slug:
+        parser.error("slug is required unless --batch lines carry one")
+    try:
+        template = renderer.template(args.slug)
+    except KeyError as e:
+        print(f"ERROR: {e.args[0]}", file=sys.stderr)
+        return 1
+    if args.slots:
+        for name, slot in template.slots.items():
+            kind = "required" if name in template.required else f"default={slot.default!r}"
+            note = template.descriptions.get(name) or slot.hint or ""
+            print(f"{name}\t{kind}\t{note}".rstrip())
+        return 0
+    variables = _parse_vars(args.var, args.vars)
+    unknown = sorted(set(variables) - set(template.slots))
+    if unknown:
+        print(f"WARN: {args.slug} has no slots named: {', '.join(unknown)}", file=sys.stderr)
+    try:
+        payload = template.render(variables, strict)
+    except MissingSlotsError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+schema_compiler.py
+
+Compile a JSON Schema (the draft-07 subset used by prompt.schema.json) into a
+tree of precompiled check closures, without depending on jsonschema.
+
+Supported keywords: type, enum, const, required, properties,
+additionalProperties, items, minItems, maxItems, minLength, maxLength,
+pattern, minimum, maximum. Annotation keywords ($schema, title,
+description) are ignored; any other keyword raises ValueError at compile
+time so an unsupported schema is never silently under-enforced.
+
+Compiled validators are cached by the SHA-256 of the schema file, so each
+process compiles prompt.schema.json once and reuses it for every spec.
+"""
+import hashlib
+import json
+import operator
+import pathlib
+import re
+from typing import Any, Callable, Dict, List
+
+Check = Callable[[Any, str, List[str]], None]
+
+ANNOTATIONS = {"$schema", "$id", "title", "description", "examples", "default", "$comment"}
+
+_TYPES = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+}
+
+_cache: Dict[str, Callable[[Any], List[str]]] = {}
+
+
+def _child(loc: str, key: Any) -> str:
+    return f"{loc}[{key}]" if isinstance(key, int) else f"{loc}.{key}"
+
+
+def _compile(schema: Dict[str, Any]) -> Check:
+    unknown = set(schema) - ANNOTATIONS - {
+        "type", "enum", "const", "required", "properties", "additionalProperties",
+        "items", "minItems", "maxItems", "minLength", "maxLength", "pattern", "minimum", "maximum",
+    }
+    if unknown:
+        raise ValueError(f"unsupported schema keywords: {sorted(unknown)}")
+
+    checks: List[Check] = []
+    hint = f" ({schema['description']})" if "description" in schema else ""
+
+    if "type" in schema:
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        preds = [_TYPES[n] for n in names]
+        expected = " or ".join(names)
+
+        def check_type(v, loc, errs):
+            if not any(p(v) for p in preds):
+                errs.append(f"{loc}: expected {expected}, got {type(v).__name__}")
+                raise _Stop
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+
+        def check_enum(v, loc, errs):
+            if v not in allowed:
+                errs.append(f"{loc}: {v!r} is not one of {allowed}")
+        checks.append(check_enum)
+
+    if "const" in schema:
+        const = schema["const"]
+
+        def check_const(v, loc, errs):
+            if v != const:
+                errs.append(f"{loc}: expected {const!r}")
+        checks.append(check_const)
+
+    if "pattern" in schema:
+        rx = re.compile(schema["pattern"])
+
+        def check_pattern(v, loc, errs):
+            if isinstance(v, str) and not rx.search(v):
+                errs.append(f"{loc}: {v!r} does not match the required pattern{hint}")
+        checks.append(check_pattern)
+
+    for key, op, word in (("minLength", operator.lt, "shorter"), ("maxLength", operator.gt, "longer")):
+        if key in schema:
+            bound = schema[key]
+
+            def check_len(v, loc, errs, bound=bound, op=op, word=word):
+                if isinstance(v, str) and op(len(v), bound):
+                    errs.append(f"{loc}: string is {word} than {bound}")
+            checks.append(check_len)
+
+    for key, op, word in (("minimum", operator.lt, "below"), ("maximum", operator.gt, "above")):
+        if key in schema:
+            bound = schema[key]
+
+            def check_num(v, loc, errs, bound=bound, op=op, word=word, key=key):
+                if _TYPES["number"](v) and op(v, bound):
+                    errs.append(f"{loc}: {v} is {word} {key} {bound}")
+            checks.append(check_num)
+
+    if "required" in schema:
+        required = list(schema["required"])
+
+        def check_required(v, loc, errs):
+            if isinstance(v, dict):
+                for k in required:
+                    if k not in v:
+                        errs.append(f"{loc}: missing required key '{k}'")
+        checks.append(check_required)
+
+    if "properties" in schema or "additionalProperties" in schema:
+        props = {k: _compile(s) for k, s in schema.get("properties", {}).items()}
+        extra = schema.get("additionalProperties", True)
+        extra_check = _compile(extra) if isinstance(extra, dict) else None
+
+        def check_props(v, loc, errs):
+            if not isinstance(v, dict):
+                return
+            for k, item in v.items():
+                sub = props.get(k)
+                if sub is not None:
+                    sub(item, _child(loc, k), errs)
+                elif extra is False:
+                    errs.append(f"{loc}: unexpected key '{k}'")
+                elif extra_check is not None:
+                    extra_check(item, _child(loc, k), errs)
+        checks.append(check_props)
+
+    for key, op, word in (("minItems", operator.lt, "fewer"), ("maxItems", operator.gt, "more")):
+        if key in schema:
+            bound = schema[key]
+
+            def check_items_len(v, loc, errs, bound=bound, op=op, word=word):
+                if isinstance(v, list) and op(len(v), bound):
+                    errs.append(f"{loc}: array has {word} than {bound} item(s)")
+            checks.append(check_items_len)
+
+    if isinstance(schema.get("items"), dict):
+        item_check = _compile(schema["items"])
+
+        def check_items(v, loc, errs):
+            if isinstance(v, list):
+                for i, item in enumerate(v):
+                    item_check(item, _child(loc, i), errs)
+        checks.append(check_items)
+
+    def run(v, loc, errs):
+        try:
+            for c in checks:
+                c(v, loc, errs)
+        except _Stop:
+            # A type mismatch makes the remaining keywords meaningless.
+            pass
+    return run
+
+
+class _Stop(Exception):
+    pass
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], List[str]]:
+    """Compile a schema dict into ``validate(instance) -> [error, ...]``."""
+    root = _compile(schema)
+
+    def validate(instance: Any) -> List[str]:
+        errs: List[str] = []
+        root(instance, "$", errs)
+        return errs
+    return validate
+
+
+def load_validator(path: pathlib.Path) -> Callable[[Any], List[str]]:
+    """Return the compiled validator for a schema file, cached by content hash."""
+    raw = pathlib.Path(path).read_bytes()
+    key = hashlib.sha256(raw).hexdigest()
+    validator = _cache.get(key)
+    if validator is None:
+        validator = _cache[key] = compile_schema(json.loads(raw))
+    return validator
@@ -1,54 +1,139 @@
 #!/usr/bin/env python3
-"""Validate prompt JSON files against prompt.schema.json and pairing rules."""
+"""Validate prompt JSON files against prompt.schema.json and pairing rules.
+
+Usage:
+  python scripts/schema_validate_prompts.py                 # whole catalog
+  python scripts/schema_validate_prompts.py a.json b.json   # explicit files
+  find prompts -name '*.json' -print0 | python scripts/schema_validate_prompts.py --stdin -0
+
+Files are validated across a process pool (--jobs, default: CPU count) and
+results are streamed back per file as they complete, so validating N files
+costs one interpreter start rather than N.
+"""
 from __future__ import annotations
-import json, pathlib, sys
+import argparse, json, os, pathlib, sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import catalog
+import instrument
+import schema_compiler
 
 ROOT = pathlib.Path('prompts')
-SCHEMA = json.loads(pathlib.Path('scripts/prompt.schema.json').read_text())
+SCHEMA_PATH = pathlib.Path('scripts/prompt.schema.json')
+
+_validator = None
+
+
+def get_validator():
+    """Compiled prompt.schema.json validator (compiled once per process)."""
+    global _validator
+    if _validator is None:
+        with instrument.span("compile schema"):
+            _validator = schema_compiler.load_validator(SCHEMA_PATH)
+    return _validator
+
 
 def validate_schema(data, path):
-    # Minimal manual validation to avoid external deps (jsonschema)
-    missing = [k for k in ('target_model','parameters','messages') if k not in data]
-    if missing:
-        return [f"{path}: missing keys {missing}"]
-    params = data.get('parameters', {})
-    for k in ('reasoning_effort',):
-        if k not in params:
-            return [f"{path}: parameters.{k} missing"]
-    if not isinstance(data['messages'], list) or not data['messages']:
-        return [f"{path}: messages invalid"]
-    for m in data['messages']:
-        if not isinstance(m, dict) or 'role' not in m or 'content' not in m:
-            return [f"{path}: message entry invalid"]
-    # Validate version field if present (semantic versioning)
-    if 'version' in data:
-        version = data['version']
-        if not isinstance(version, str):
-            return [f"{path}: version must be a string"]
-        # Basic semantic version pattern check: MAJOR.MINOR.PATCH
-        import re
-        semver_pattern = r'^([0-9]+)\.([0-9]+)\.([0-9]+)(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$'
-        if not re.match(semver_pattern, version):
-            return [f"{path}: version must follow semantic versioning (e.g., '1.0.0', '2.1.3-beta.1')"]
-    return []
-
-errors = []
-for jf in ROOT.rglob('*.json'):
-    if jf.name == 'index.json':
-        continue
+    # Full prompt.schema.json fidelity via precompiled checks (no jsonschema dependency)
+    validator = get_validator()
+    with instrument.span("validate schema"):
+        return [f"{path}: {e}" for e in validator(data)]
+
+def validate_catalog(cat):
+    """Schema + pairing errors for every spec in a scanned catalog."""
+    errors = []
+    for rec in cat.specs():
+        jf = rec.json_path
+        if rec.spec is None:
+            errors.append(f"{jf}: JSON parse error: {rec.spec_error}")
+            continue
+        errors.extend(validate_schema(rec.spec, jf))
+        # Pairing rule: must have .md sibling
+        if rec.md_path is None:
+            errors.append(f"{jf}: missing markdown doc {jf.with_suffix('.md').name}")
+    return errors
+
+
+def validate_file(path):
+    """Validate one spec file from disk; returns (path, errors)."""
+    jf = pathlib.Path(path)
     try:
-        data = json.loads(jf.read_text())
+        with instrument.span("read .json"):
+            text = jf.read_text()
+        instrument.count("files_read")
+        instrument.count("bytes_read", len(text))
+        with instrument.span("parse json"):
+            data = json.loads(text)
     except Exception as e:
-        errors.append(f"{jf}: JSON parse error: {e}")
-        continue
-    errors.extend(validate_schema(data, jf))
+        return path, [f"{jf}: JSON parse error: {e}"]
+    errors = validate_schema(data, jf)
     # Pairing rule: must have .md sibling
     md = jf.with_suffix('.md')
     if not md.exists():
         errors.append(f"{jf}: missing markdown doc {md.name}")
+    return path, errors
+
+
+# Below this many files a pool costs more to start than it saves.
+POOL_THRESHOLD = 8
+
+
+def iter_results(paths, jobs):
+    """Yield (path, errors) per file, in completion order when run in parallel."""
+    if jobs <= 1 or len(paths) < POOL_THRESHOLD:
+        for path in paths:
+            yield validate_file(path)
+        return
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_validate_chunk, paths[i:i + chunksize]) for i in range(0, len(paths), chunksize)]
+        for fut in as_completed(futures):
+            yield from fut.result()
+
+
+def _validate_chunk(paths):
+    return [validate_file(p) for p in paths]
+
+
+def read_paths(stream, null_separated):
+    data = stream.read()
+    parts = data.split('\0') if null_separated else data.splitlines()
+    return [p for p in (x.strip() if not null_separated else x for x in parts) if p]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate prompt JSON specs against the schema and pairing rules")
+    parser.add_argument('files', nargs='*', help="Spec files to validate (default: every spec under prompts/)")
+    parser.add_argument('--stdin', action='store_true', help="Read additional file paths from stdin")
+    parser.add_argument('-0', '--null', action='store_true', help="Stdin paths are NUL-separated (find -print0)")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    parser.add_argument('--verbose', '-v', action='store_true', help="Report passing files too")
+    instrument.add_arguments(parser)
+    args = parser.parse_args(argv)
+    instrument.start(args, "schema_validate_prompts")
+
+    paths = list(args.files)
+    if args.stdin:
+        paths.extend(read_paths(sys.stdin, args.null))
+    if not args.files and not args.stdin:
+        with instrument.span("list specs"):
+            paths = [str(p) for p in catalog.list_files(ROOT, '.json', skip_templates=False)]
+    # Skip index.json (catalog) and duplicates while keeping order
+    paths = [p for p in dict.fromkeys(paths) if pathlib.Path(p).name != 'index.json']
+
+    failed = 0
+    for path, errors in iter_results(paths, args.jobs):
+        if errors:
+            failed += 1
+            for e in errors:
+                print(e, file=sys.stderr, flush=True)
+        elif args.verbose:
+            print(f"OK {path}", flush=True)
+    if failed:
+        print(f"Schema + pairing validation failed for {failed} of {len(paths)} file(s).", file=sys.stderr)
+        sys.exit(1)
+    print(f"Schema + pairing validation passed ({len(paths)} files).")
+
 
-if errors:
-    for e in errors:
-        print(e, file=sys.stderr)
-    sys.exit(1)
-print("Schema + pairing validation passed.")
+if __name__ == '__main__':
+    main()
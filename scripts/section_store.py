@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+section_store.py
+
+Content-addressed store of prompt message sections.
+
+Every message content is split into sections at markdown headings and at
+top-level agent-control blocks (<tool_preambles>, <eagerness>, ...). Each
+unique section is stored once, keyed by the SHA-256 of its UTF-8 text, and
+each prompt becomes a list of section references. Shared boilerplate
+("# Rules & Guardrails", "## Inputs", the optional Examples/Output Contract
+stubs) is therefore stored once for the whole catalog, and a service can
+invalidate cached sections individually instead of whole prompts.
+
+Layout under .cache/sections/ (generated, not committed):
+
+  objects/ab/cdef...   raw UTF-8 section text, named by its SHA-256
+  manifest.json        {"version", "prompts": {slug: {"path", "hash",
+                        "spec", "messages": [{"role", "sections"}]}}}
+
+"spec" is the spec with messages nulled out (as in catalog_snapshot.py),
+and each message's "sections" is a list of [sha256, separator] pairs:
+the newline run that followed the section is kept out of the hashed text
+so a block hashes the same whether or not it ends its message.
+
+`bundle` writes manifest plus referenced sections as a single JSON file
+for shipping to services. The bundle lists sections once, in first-use
+order, and refers to them by ordinal ([index, separator]) rather than by
+64-hex SHA-256, which would cost more than deduplication saves;
+SectionStore.open() reads either form and re-derives the SHA-256 ids, so
+section_ids() is the same for both. `stats` reports the bundle size
+against the raw spec files. On the current catalog few sections repeat
+exactly (about 2 KB saved), so the per-prompt paths, hashes and refs leave
+the bundle about 4% larger than the specs; it only shrinks once specs share
+more verbatim blocks.
+
+Usage:
+  python scripts/section_store.py build
+  python scripts/section_store.py bundle -o .cache/sections.bundle.json
+  python scripts/section_store.py show <slug> [--store PATH]
+  python scripts/section_store.py stats
+"""
+import argparse
+import hashlib
+import json
+import os
+import pathlib
+import re
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import build_prompts_index
+import catalog
+
+STORE_VERSION = 2
+DEFAULT_DIR = pathlib.Path(".cache") / "sections"
+MANIFEST_NAME = "manifest.json"
+
+# Section boundaries: a heading line or an opening <tag> on its own line.
+_BOUNDARY_RE = re.compile(r"(?m)^(?=#{1,6} |<[A-Za-z_][\w-]*>[ \t]*$)")
+
+
+def split_sections(content: str) -> List[Tuple[str, str]]:
+    """Split content into (section, trailing newlines) pairs; joining them is lossless."""
+    out = []
+    for part in _BOUNDARY_RE.split(content):
+        if not part:
+            continue
+        text = part.rstrip("\n")
+        out.append((text, part[len(text):]))
+    return out
+
+
+def section_id(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def build_manifest(cat: catalog.Catalog) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Return (manifest, {sha256: section text}) for every spec in the catalog."""
+    prompts: Dict[str, Any] = {}
+    sections: Dict[str, str] = {}
+    for rec in cat.specs():
+        if rec.spec is None:
+            print(f"WARN: skip {rec.json_path}: {rec.spec_error}", file=sys.stderr)
+            continue
+        entry = build_prompts_index.entry_for(rec.json_path, rec.spec)
+        messages = []
+        for m in rec.spec.get("messages", []):
+            refs = []
+            for text, sep in split_sections(str(m.get("content", ""))):
+                sid = section_id(text)
+                sections.setdefault(sid, text)
+                refs.append([sid, sep])
+            messages.append({"role": m.get("role"), "sections": refs})
+        prompts[rec.name] = {
+            "path": entry["path"],
+            "hash": entry["hash"],
+            "spec": {k: (None if k == "messages" else v) for k, v in rec.spec.items()},
+            "messages": messages,
+        }
+    return {"version": STORE_VERSION, "prompts": prompts}, sections
+
+
+def _object_path(root: pathlib.Path, sid: str) -> pathlib.Path:
+    return root / "objects" / sid[:2] / sid[2:]
+
+
+def write_store(root: pathlib.Path, manifest: Dict[str, Any], sections: Dict[str, str]) -> Tuple[int, int]:
+    """Write missing objects, prune unreferenced ones and replace the manifest.
+
+    Returns (objects written, objects pruned).
+    """
+    written = 0
+    for sid, text in sections.items():
+        path = _object_path(root, sid)
+        if path.exists():
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(text.encode("utf-8"))
+        tmp.replace(path)
+        written += 1
+    pruned = 0
+    objects = root / "objects"
+    for top, _dirs, files in os.walk(objects):
+        for name in files:
+            if os.path.basename(top) + name not in sections:
+                os.unlink(os.path.join(top, name))
+                pruned += 1
+    tmp = root / (MANIFEST_NAME + ".tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(root / MANIFEST_NAME)
+    return written, pruned
+
+
+def encode_bundle(manifest: Dict[str, Any], sections: Dict[str, str]) -> bytes:
+    """Manifest with section refs as ordinals into one "sections" list."""
+    ordinal = {sid: i for i, sid in enumerate(sections)}
+    prompts = {
+        slug: dict(entry, messages=[{"role": m["role"], "sections": [[ordinal[sid], sep] for sid, sep in m["sections"]]}
+                                    for m in entry["messages"]])
+        for slug, entry in manifest["prompts"].items()
+    }
+    bundle = {"version": manifest["version"], "prompts": prompts, "sections": list(sections.values())}
+    return json.dumps(bundle, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_bundle(data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Inverse of encode_bundle: (manifest with SHA-256 refs, {sha256: text})."""
+    sids = [section_id(text) for text in data["sections"]]
+    for entry in data["prompts"].values():
+        for m in entry["messages"]:
+            m["sections"] = [[sids[i], sep] for i, sep in m["sections"]]
+    return {"version": data["version"], "prompts": data["prompts"]}, dict(zip(sids, data["sections"]))
+
+
+def write_bundle(path: pathlib.Path, manifest: Dict[str, Any], sections: Dict[str, str]) -> int:
+    data = encode_bundle(manifest, sections)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return len(data)
+
+
+class SectionStore:
+    """Reassembles prompts from a store directory or a bundle file.
+
+    Sections are read on first use and cached, so a service holding the
+    whole catalog keeps each shared block in memory once.
+    """
+
+    def __init__(self, manifest: Dict[str, Any], root: Optional[pathlib.Path] = None,
+                 sections: Optional[Dict[str, str]] = None):
+        if manifest.get("version") != STORE_VERSION:
+            raise ValueError(f"unsupported section store version {manifest.get('version')!r}")
+        self.prompts: Dict[str, Any] = manifest["prompts"]
+        self.root = root
+        self._sections: Dict[str, str] = sections if sections is not None else {}
+
+    @classmethod
+    def open(cls, path: pathlib.Path = DEFAULT_DIR) -> "SectionStore":
+        if path.is_dir():
+            manifest = json.loads((path / MANIFEST_NAME).read_text(encoding="utf-8"))
+            return cls(manifest, root=path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != STORE_VERSION:
+            raise ValueError(f"unsupported section store version {data.get('version')!r}")
+        manifest, sections = decode_bundle(data)
+        return cls(manifest, sections=sections)
+
+    def section(self, sid: str) -> str:
+        text = self._sections.get(sid)
+        if text is None:
+            if self.root is None:
+                raise KeyError(f"unknown section {sid}")
+            text = self._sections[sid] = _object_path(self.root, sid).read_bytes().decode("utf-8")
+        return text
+
+    def section_ids(self, slug: str) -> List[str]:
+        """Distinct section ids a prompt depends on (for per-section invalidation)."""
+        entry = self.prompts[slug]
+        return list(dict.fromkeys(sid for m in entry["messages"] for sid, _sep in m["sections"]))
+
+    def messages(self, slug: str) -> Optional[List[Dict[str, str]]]:
+        entry = self.prompts.get(slug)
+        if entry is None:
+            return None
+        return [{"role": m["role"], "content": "".join(self.section(sid) + sep for sid, sep in m["sections"])}
+                for m in entry["messages"]]
+
+    def spec(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Reconstruct the full JSON spec for a slug."""
+        entry = self.prompts.get(slug)
+        if entry is None:
+            return None
+        spec = dict(entry["spec"])
+        spec["messages"] = self.messages(slug)
+        return spec
+
+
+def stats(manifest: Dict[str, Any], sections: Dict[str, str], raw_bytes: int) -> Dict[str, int]:
+    """Section reuse, plus the bundle size against ``raw_bytes`` (the spec files it replaces)."""
+    refs = [sid for p in manifest["prompts"].values() for m in p["messages"] for sid, _sep in m["sections"]]
+    content_bytes = sum(len(sections[sid].encode("utf-8")) for sid in refs)
+    unique_bytes = sum(len(t.encode("utf-8")) for t in sections.values())
+    bundle_bytes = len(encode_bundle(manifest, sections))
+    return {
+        "prompts": len(manifest["prompts"]),
+        "section_refs": len(refs),
+        "unique_sections": len(sections),
+        "content_bytes": content_bytes,
+        "unique_bytes": unique_bytes,
+        "dedup_saved_bytes": content_bytes - unique_bytes,
+        "raw_bytes": raw_bytes,
+        "bundle_bytes": bundle_bytes,
+        "net_bytes": bundle_bytes - raw_bytes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or read the content-addressed section store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_build = sub.add_parser("build", help="Split every spec into sections and update the store")
+    p_build.add_argument("--store", type=pathlib.Path, default=DEFAULT_DIR)
+    p_bundle = sub.add_parser("bundle", help="Write manifest and sections as one JSON file")
+    p_bundle.add_argument("-o", "--output", type=pathlib.Path, required=True)
+    p_show = sub.add_parser("show", help="Print one prompt's spec reassembled from the store")
+    p_show.add_argument("slug")
+    p_show.add_argument("--store", type=pathlib.Path, default=DEFAULT_DIR, help="Store directory or bundle file")
+    sub.add_parser("stats", help="Report section reuse and bundle size against the raw specs")
+    args = parser.parse_args()
+
+    if args.command == "show":
+        try:
+            store = SectionStore.open(args.store)
+        except (OSError, ValueError) as e:
+            print(f"Error: cannot open {args.store}: {e}. Run: python scripts/section_store.py build", file=sys.stderr)
+            sys.exit(1)
+        spec = store.spec(args.slug)
+        if spec is None:
+            print(f"Error: unknown prompt '{args.slug}'", file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(spec, ensure_ascii=False, separators=(",", ":")))
+        return
+
+    cat = catalog.scan(catalog.PROMPTS_ROOT)
+    manifest, sections = build_manifest(cat)
+    if args.command == "build":
+        args.store.mkdir(parents=True, exist_ok=True)
+        written, pruned = write_store(args.store, manifest, sections)
+        print(f"Wrote {args.store} with {len(manifest['prompts'])} prompts, {len(sections)} sections "
+              f"({written} new, {pruned} pruned)")
+    elif args.command == "bundle":
+        size = write_bundle(args.output, manifest, sections)
+        print(f"Wrote {args.output} with {len(manifest['prompts'])} prompts ({size} bytes)")
+    else:
+        raw_bytes = sum(len(rec.json_raw) for rec in cat.specs() if rec.spec is not None)
+        print(json.dumps(stats(manifest, sections, raw_bytes), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+similarity.py
+
+Near-duplicate detection across prompts with MinHash signatures and LSH.
+
+Each prompt's text (JSON message contents plus the .md body, frontmatter
+stripped) is reduced to word shingles, and each shingle is hashed once.
+Words are the search tokenizer's (lowercase, stopwords dropped). With the
+default SHINGLE_SIZE of 1 the similarity is vocabulary overlap, which
+catches prompts covering the same task in different wording as well as
+copies; larger sizes only flag near-verbatim copies.
+
+Vocabulary alone under-rates prompts for the same task written from scratch
+(engineering/repository-audit vs audit/repo-audit share a title but little
+wording), so title words are added as weighted features: each is repeated
+until the title carries TITLE_WEIGHT times the mass of the content, making
+the estimate a weighted Jaccard that blends title and content overlap. Tags
+are left out because category-level tags (engineering, meta, automation)
+are shared by unrelated prompts.
+
+Calibration (exact weighted Jaccard over the current catalog, TITLE_WEIGHT
+1.0): the two known duplicates score 0.48 (repo-audit ~ repository-audit)
+and 0.47 (issue-workflow-system-builder ~ github-issue-automation-system);
+the highest unrelated pair (blog-outline ~ press-release) scores 0.30.
+DEFAULT_THRESHOLD 0.4 sits in that gap, about three MinHash standard errors
+(sqrt(s(1-s)/NUM_BUCKETS) ~ 0.025) from either side. tests/test_similarity.py
+checks that both duplicates are still flagged; re-check the gap with
+`pairs --threshold 0.25` when changing the features.
+
+Signatures use one-permutation MinHash: the hash picks one of NUM_BUCKETS
+buckets and each bucket keeps its minimum, so a signature costs O(shingles)
+instead of O(shingles x permutations). Empty buckets are filled from the
+next non-empty one (rotation densification).
+
+Signatures are split into BANDS bands of ROWS rows; prompts sharing any band
+are candidates (probability 1 - (1 - s^ROWS)^BANDS at similarity s: about
+0.97 at 0.3 and 1.0 at the 0.4 CI threshold), and only candidates are
+scored (the fraction of equal buckets estimates Jaccard similarity). Lookups and the all-pairs check stay
+proportional to the candidate count rather than n^2. `similar --exhaustive`
+scores every prompt instead (linear per query) to rank weaker matches.
+
+The index is cached in .cache/similarity_index.json keyed by a digest of
+each prompt's text, so unchanged prompts keep their signatures.
+
+Usage:
+  python scripts/similarity.py similar repo-audit [--limit 5] [--json]
+  python scripts/similarity.py pairs [--threshold 0.5]
+  python scripts/similarity.py check --base origin/main [--threshold 0.4]
+  python scripts/similarity.py check new-slug other-slug
+"""
+import argparse
+import hashlib
+import json
+import pathlib
+import subprocess
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import build_search_index
+import catalog
+
+INDEX_VERSION = 3
+INDEX_PATH = pathlib.Path(".cache") / "similarity_index.json"
+SHINGLE_SIZE = 1
+TITLE_WEIGHT = 1.0
+NUM_BUCKETS = 384
+BANDS = 128
+ROWS = NUM_BUCKETS // BANDS
+DEFAULT_THRESHOLD = 0.4
+MAX_HASH = (1 << 64) - 1
+
+
+def document_text(rec: catalog.PromptRecord) -> str:
+    messages = "\n".join(str(m.get("content", "")) for m in (rec.spec or {}).get("messages", []) if isinstance(m, dict))
+    return f"{messages}\n{rec.body}"
+
+
+def title_text(rec: catalog.PromptRecord) -> str:
+    return str((rec.meta or {}).get("title") or (rec.spec or {}).get("name") or "")
+
+
+def _hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+
+
+def shingles(text: str, k: int = SHINGLE_SIZE) -> Set[int]:
+    """64-bit hashes of k-word shingles (the whole text if shorter than k words)."""
+    words = build_search_index.tokenize(text)
+    grams = {" ".join(words[i:i + k]) for i in range(max(1, len(words) - k + 1))} if words else set()
+    return {_hash(g) for g in grams}
+
+
+def features(text: str, title: str) -> Set[int]:
+    """Content shingles plus title words, each repeated to carry TITLE_WEIGHT of the content mass."""
+    content = shingles(text)
+    terms = set(build_search_index.tokenize(title))
+    if not terms:
+        return content
+    copies = max(1, round(TITLE_WEIGHT * len(content) / len(terms)))
+    # The NUL prefix keeps title features apart from content words.
+    return content | {_hash(f"\0{t}#{i}") for t in terms for i in range(copies)}
+
+
+def signature(hashes: Iterable[int]) -> List[int]:
+    """One-permutation MinHash with rotation densification."""
+    mins = [MAX_HASH] * NUM_BUCKETS
+    for h in hashes:
+        b = h % NUM_BUCKETS
+        v = h // NUM_BUCKETS
+        if v < mins[b]:
+            mins[b] = v
+    if all(v == MAX_HASH for v in mins):
+        return mins
+    sig = list(mins)
+    for i in range(NUM_BUCKETS):
+        if mins[i] == MAX_HASH:
+            j, step = (i + 1) % NUM_BUCKETS, 1
+            while mins[j] == MAX_HASH:
+                j, step = (j + 1) % NUM_BUCKETS, step + 1
+            # Offset by distance so borrowed values differ from the donor's own bucket.
+            sig[i] = mins[j] + step * (MAX_HASH // NUM_BUCKETS // NUM_BUCKETS)
+    return sig
+
+
+def estimate(a: List[int], b: List[int]) -> float:
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_BUCKETS
+
+
+class SimilarityIndex:
+    """MinHash signatures per slug plus LSH band buckets."""
+
+    def __init__(self, docs: Dict[str, Dict[str, Any]]):
+        self.docs = docs
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = {}
+        for slug, doc in docs.items():
+            for key in self._bands(doc["sig"]):
+                self.buckets.setdefault(key, []).append(slug)
+
+    @staticmethod
+    def _bands(sig: List[int]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [(band, tuple(sig[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+    def candidates(self, slug: str) -> Set[str]:
+        out: Set[str] = set()
+        for key in self._bands(self.docs[slug]["sig"]):
+            out.update(self.buckets.get(key, ()))
+        out.discard(slug)
+        return out
+
+    def similar(self, slug: str, threshold: float = 0.0, limit: Optional[int] = None,
+                exhaustive: bool = False) -> List[Tuple[str, float]]:
+        if slug not in self.docs:
+            raise KeyError(slug)
+        sig = self.docs[slug]["sig"]
+        others = (o for o in self.docs if o != slug) if exhaustive else self.candidates(slug)
+        scored = [(other, round(estimate(sig, self.docs[other]["sig"]), 3)) for other in others]
+        scored = sorted((s for s in scored if s[1] >= threshold), key=lambda s: (-s[1], s[0]))
+        return scored[:limit] if limit is not None else scored
+
+    def pairs(self, threshold: float, slugs: Optional[Iterable[str]] = None) -> List[Tuple[str, str, float]]:
+        """Candidate pairs at or above threshold; restricted to pairs touching ``slugs`` when given."""
+        seen: Set[Tuple[str, str]] = set()
+        out = []
+        for slug in sorted(slugs if slugs is not None else self.docs):
+            for other, score in self.similar(slug, threshold):
+                pair = tuple(sorted((slug, other)))
+                if pair not in seen:
+                    seen.add(pair)
+                    out.append((pair[0], pair[1], score))
+        return sorted(out, key=lambda p: (-p[2], p[0], p[1]))
+
+
+def build(cat: catalog.Catalog, previous: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], int]:
+    """Return (index data, number of prompts re-signed); unchanged texts reuse old signatures."""
+    old = previous.get("docs", {}) if previous and previous.get("version") == INDEX_VERSION \
+        and previous.get("params") == _params() else {}
+    docs: Dict[str, Dict[str, Any]] = {}
+    resigned = 0
+    for rec in cat.records:
+        if rec.spec is None and not rec.body:
+            continue
+        text = document_text(rec)
+        title = title_text(rec)
+        digest = hashlib.sha256(f"{title}\0{text}".encode("utf-8")).hexdigest()[:16]
+        prev = old.get(rec.name)
+        if prev and prev["digest"] == digest:
+            docs[rec.name] = prev
+            continue
+        docs[rec.name] = {
+            "path": str(rec.json_path or rec.md_path),
+            "digest": digest,
+            "sig": signature(features(text, title)),
+        }
+        resigned += 1
+    return {"version": INDEX_VERSION, "params": _params(), "docs": docs}, resigned
+
+
+def _params() -> Dict[str, Any]:
+    return {"shingle": SHINGLE_SIZE, "title_weight": TITLE_WEIGHT, "buckets": NUM_BUCKETS, "bands": BANDS}
+
+
+def load_index(rebuild: bool = True) -> SimilarityIndex:
+    """Load the cached index, re-signing only prompts whose text changed."""
+    try:
+        previous = json.loads(INDEX_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = None
+    if previous is not None and (previous.get("version") != INDEX_VERSION or previous.get("params") != _params()):
+        previous = None
+    if previous is not None and not rebuild:
+        return SimilarityIndex(previous["docs"])
+    data, resigned = build(catalog.scan(catalog.PROMPTS_ROOT), previous)
+    if resigned or previous is None or set(data["docs"]) != set(previous.get("docs", {})):
+        try:
+            INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp = INDEX_PATH.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            tmp.replace(INDEX_PATH)
+        except OSError as e:
+            print(f"WARN: Could not write {INDEX_PATH}: {e}", file=sys.stderr)
+    return SimilarityIndex(data["docs"])
+
+
+def added_slugs(base: str) -> List[str]:
+    """Slugs of prompt files added since the merge base with ``base``."""
+    out = subprocess.run(["git", "diff", "--name-only", "--diff-filter=A", f"{base}...HEAD", "--", "prompts/"],
+                         capture_output=True, text=True)
+    if out.returncode != 0:
+        raise SystemExit(f"ERROR: git diff against {base} failed: {out.stderr.strip()}")
+    return sorted({pathlib.PurePosixPath(p).stem for p in out.stdout.split()
+                   if p.endswith((".json", ".md")) and not p.endswith("/index.json")})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MinHash/LSH near-duplicate detection across prompts")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_sim = sub.add_parser("similar", help="Prompts most similar to one slug")
+    p_sim.add_argument("slug")
+    p_sim.add_argument("--limit", type=int, default=10)
+    p_sim.add_argument("--threshold", type=float, default=0.0)
+    p_sim.add_argument("--exhaustive", action="store_true", help="Score every prompt, not just LSH candidates")
+    p_sim.add_argument("--json", action="store_true")
+    p_pairs = sub.add_parser("pairs", help="All candidate pairs at or above a threshold")
+    p_pairs.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    p_pairs.add_argument("--json", action="store_true")
+    p_check = sub.add_parser("check", help="CI: fail if new prompts are near-duplicates of existing ones")
+    p_check.add_argument("slugs", nargs="*", help="Prompts to check (default: added since --base)")
+    p_check.add_argument("--base", help="Git ref to diff against for added prompts (e.g. origin/main)")
+    p_check.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    index = load_index()
+    if args.command == "similar":
+        try:
+            results = index.similar(args.slug, args.threshold, args.limit, args.exhaustive)
+        except KeyError:
+            print(f"Error: unknown prompt '{args.slug}'", file=sys.stderr)
+            sys.exit(1)
+        if args.json:
+            print(json.dumps([{"slug": s, "path": index.docs[s]["path"], "similarity": score} for s, score in results], indent=2))
+        elif not results:
+            print(f"No similar prompts found for {args.slug}.")
+        for slug, score in ([] if args.json else results):
+            print(f"{score:.3f}  {slug:<40} {index.docs[slug]['path']}")
+        return
+
+    if args.command == "pairs":
+        pairs = index.pairs(args.threshold)
+        if args.json:
+            print(json.dumps([{"a": a, "b": b, "similarity": s} for a, b, s in pairs], indent=2))
+        else:
+            for a, b, score in pairs:
+                print(f"{score:.3f}  {a}  ~  {b}")
+        return
+
+    slugs = args.slugs or (added_slugs(args.base) if args.base else [])
+    if not args.slugs and not args.base:
+        parser.error("check needs slugs or --base")
+    unknown = [s for s in slugs if s not in index.docs]
+    if unknown:
+        print(f"WARN: not in catalog (skipped): {', '.join(unknown)}", file=sys.stderr)
+    slugs = [s for s in slugs if s in index.docs]
+    flagged = index.pairs(args.threshold, slugs)
+    for a, b, score in flagged:
+        print(f"❌ {a} ~ {b}: estimated similarity {score:.2f} >= {args.threshold:.2f}")
+    if flagged:
+        print("Near-duplicate prompts found; extend the existing prompt or make the new one distinct.", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ {len(slugs)} new prompt(s) checked; none above {args.threshold:.2f} similarity.")
+
+
+if __name__ == "__main__":
+    main()
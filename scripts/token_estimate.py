@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+token_estimate.py
+
+Offline token and payload-size estimates for prompt specs.
+
+build_prompts_index.py stores the counts in prompts/index.json so context
+budgets and cost can be checked without tokenizing at request time. Counts
+are memoized by spec content hash in .cache/token_counts.json, so a spec is
+only re-counted when its content changes.
+
+Estimators are pluggable (register()) and chosen with the
+PROMPT_TOKEN_ESTIMATOR environment variable:
+
+  heuristic   (default) BPE-style: splits text the way GPT pre-tokenizers do
+              (words with their leading space, 1-3 digit groups, punctuation
+              runs, whitespace) and charges long words and non-ASCII
+              characters extra. No dependencies, deterministic.
+  chars4      len(text) / 4, the usual rule of thumb.
+  tiktoken    exact counts with tiktoken's o200k_base encoding; needs the
+              package and a locally cached encoding (TIKTOKEN_CACHE_DIR).
+
+Whatever is chosen must be the same for builds and drift checks, since the
+counts are part of every prompts/index.json entry.
+
+Per-message counts cover the content only; the total adds the chat framing
+overhead (MESSAGE_OVERHEAD per message plus REPLY_PRIMING).
+
+Usage:
+  python scripts/token_estimate.py prompts/audit/repo-audit/repo-audit.json
+  echo "some text" | python scripts/token_estimate.py -
+"""
+import json
+import math
+import os
+import pathlib
+import re
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+MEMO_PATH = pathlib.Path(".cache") / "token_counts.json"
+MEMO_VERSION = 1
+DEFAULT_ESTIMATOR = "heuristic"
+MESSAGE_OVERHEAD = 4
+REPLY_PRIMING = 3
+
+_ESTIMATORS: Dict[str, Callable[[], Callable[[str], int]]] = {}
+
+
+def register(name: str):
+    """Decorator for estimator factories; a factory returns a text -> tokens callable."""
+    def wrap(factory: Callable[[], Callable[[str], int]]):
+        _ESTIMATORS[name] = factory
+        return factory
+    return wrap
+
+
+# Mirrors the shape of the cl100k/o200k pre-tokenizer split.
+_PIECE_RE = re.compile(r"'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+")
+
+
+@register("heuristic")
+def _heuristic() -> Callable[[str], int]:
+    def count(text: str) -> int:
+        tokens = 0
+        for piece in _PIECE_RE.findall(text):
+            word = piece.lstrip(" ")
+            if not word:
+                tokens += 1
+            elif word[0].isalpha():
+                # Common words up to ~8 letters are usually one token; longer
+                # or rarer ones split into ~6-letter chunks.
+                tokens += 1 if len(word) <= 8 else math.ceil(len(word) / 6)
+                tokens += sum(1 for ch in word if ord(ch) > 127)
+            elif word[0].isdigit() or word[0].isspace():
+                tokens += 1
+            else:
+                ascii_run = sum(1 for ch in word if ord(ch) < 128)
+                tokens += math.ceil(ascii_run / 3) + (len(word) - ascii_run)
+        return tokens
+    return count
+
+
+@register("chars4")
+def _chars4() -> Callable[[str], int]:
+    return lambda text: math.ceil(len(text) / 4)
+
+
+@register("tiktoken")
+def _tiktoken() -> Callable[[str], int]:
+    try:
+        import tiktoken
+    except ImportError as e:
+        raise ValueError("estimator 'tiktoken' needs the tiktoken package (pip install tiktoken)") from e
+    encoding = tiktoken.get_encoding("o200k_base")
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def estimator_name() -> str:
+    return os.environ.get("PROMPT_TOKEN_ESTIMATOR", DEFAULT_ESTIMATOR)
+
+
+_counters: Dict[str, Callable[[str], int]] = {}
+
+
+def get_estimator(name: Optional[str] = None) -> Callable[[str], int]:
+    name = name or estimator_name()
+    if name not in _counters:
+        if name not in _ESTIMATORS:
+            raise ValueError(f"unknown token estimator {name!r} (known: {', '.join(sorted(_ESTIMATORS))})")
+        _counters[name] = _ESTIMATORS[name]()
+    return _counters[name]
+
+
+def count_spec(spec: Dict[str, Any], name: Optional[str] = None) -> Dict[str, Any]:
+    """Token and byte counts for one spec's messages."""
+    count = get_estimator(name)
+    messages = [m for m in spec.get("messages") or [] if isinstance(m, dict)]
+    contents = [m.get("content") or "" for m in messages]
+    message_tokens = [count(c) for c in contents]
+    payload = {"model": spec.get("target_model"),
+               "messages": [{"role": m.get("role"), "content": c} for m, c in zip(messages, contents)]}
+    payload.update(spec.get("parameters") or {})
+    return {
+        "tokens": sum(message_tokens) + MESSAGE_OVERHEAD * len(messages) + REPLY_PRIMING,
+        "bytes": len(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")),
+        "message_tokens": message_tokens,
+        "message_bytes": [len(c.encode("utf-8")) for c in contents],
+    }
+
+
+class Memo:
+    """Counts keyed by (estimator, spec hash), persisted under .cache/."""
+
+    def __init__(self, path: pathlib.Path = MEMO_PATH):
+        self.path = path
+        self.counts: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+        self.dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if self.counts is None:
+            try:
+                raw = json.loads(self.path.read_text(encoding="utf-8"))
+                self.counts = raw["estimators"] if raw.get("version") == MEMO_VERSION else {}
+            except (OSError, ValueError, KeyError):
+                self.counts = {}
+        return self.counts
+
+    def get(self, digest: str, spec: Dict[str, Any]) -> Dict[str, Any]:
+        name = estimator_name()
+        table = self._load().setdefault(name, {})
+        hit = table.get(digest)
+        if hit is None:
+            hit = table[digest] = count_spec(spec, name)
+            self.dirty = True
+        return dict(hit)
+
+    def save(self, keep: Optional[List[str]] = None) -> None:
+        """Write the memo if it changed; ``keep`` drops hashes no longer indexed."""
+        if self.counts is None:
+            return
+        if keep is not None:
+            wanted = set(keep)
+            for table in self.counts.values():
+                for digest in [d for d in table if d not in wanted]:
+                    del table[digest]
+                    self.dirty = True
+        if not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": MEMO_VERSION, "estimators": self.counts},
+                                      separators=(",", ":")), encoding="utf-8")
+            tmp.replace(self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"WARN: Could not write {self.path}: {e}", file=sys.stderr)
+
+
+MEMO = Memo()
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: token_estimate.py <spec.json | ->", file=sys.stderr)
+        sys.exit(2)
+    try:
+        if sys.argv[1] == "-":
+            print(get_estimator()(sys.stdin.read()))
+            return
+        spec = json.loads(pathlib.Path(sys.argv[1]).read_text(encoding="utf-8"))
+        print(json.dumps(dict(count_spec(spec), estimator=estimator_name()), separators=(",", ":")))
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Near-duplicate detection (scripts/similarity.py) against the real catalog."""
+import pathlib
+import sys
+import unittest
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+import catalog  # noqa: E402
+import similarity  # noqa: E402
+
+# Prompts for the same task written independently; `check` must flag them.
+KNOWN_DUPLICATES = (
+    ("repo-audit", "repository-audit"),
+    ("github-issue-automation-system", "issue-workflow-system-builder"),
+)
+
+
+class KnownDuplicatesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        data, _resigned = similarity.build(catalog.scan(REPO_ROOT / "prompts"))
+        cls.index = similarity.SimilarityIndex(data["docs"])
+
+    def test_check_flags_known_duplicates(self):
+        for a, b in KNOWN_DUPLICATES:
+            with self.subTest(pair=(a, b)):
+                missing = [s for s in (a, b) if s not in self.index.docs]
+                if missing:
+                    self.skipTest(f"not in catalog: {', '.join(missing)}")
+                for slug in (a, b):
+                    flagged = {(x, y) for x, y, _score in self.index.pairs(similarity.DEFAULT_THRESHOLD, [slug])}
+                    self.assertIn(tuple(sorted((a, b))), flagged, f"check {slug} does not flag {a} ~ {b}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+batch_export.py
+
+Export provider batch-inference request files: every selected prompt
+rendered against every row of one input dataset.
+
+Prompts are selected from the index with the facet filters of
+scripts/facets.py (--select category=engineering --select tag=git) and/or
+explicit --slug values. The dataset is CSV (header row = slot names) or
+NDJSON (one object per line, either flat slot values or
+{"id": ..., "variables": {...}}), read as a stream from a file or stdin.
+Each selected spec is compiled once by scripts/render_prompt.py; each row
+is rendered against every template and written straight to the current
+shard, so memory stays flat however many rows the dataset has.
+
+Request lines follow the provider's batch file format:
+
+  openai            {"custom_id", "method": "POST", "url": "/v1/chat/completions", "body": ...}
+                    reasoning_effort/verbosity stay top-level; max_output_tokens
+                    becomes max_completion_tokens
+  openai-responses  {"custom_id", "method": "POST", "url": "/v1/responses", "body": ...}
+                    messages become input; reasoning_effort -> reasoning.effort,
+                    verbosity -> text.verbosity
+
+custom_id is "<slug>-<row id>", where the row id is the --id-field value
+(default "id") or else "#" plus the 1-based row number, so ids are stable
+across re-exports of the same dataset and can be joined back to the inputs.
+Explicit ids starting with "#" get a second "#", so a synthesized id never
+equals an explicit one. Explicit ids are not checked for uniqueness (that
+would need memory proportional to the dataset). Ids are limited to 64
+characters of [A-Za-z0-9_-]; longer ids, or ids with other characters
+(including every synthesized one), keep a prefix plus a digest of the raw
+id.
+
+Shards are written as OUT/<name>-00001.jsonl, ... and rotated before a
+line would exceed --max-lines or --max-bytes (defaults match the OpenAI
+Batch API limits). Rows that fail to render (missing required slots) go to
+OUT/<name>-errors.jsonl. OUT/<name>-manifest.json lists each shard with its
+line count, size and sha256. Shards from an earlier export with the same
+name are removed first.
+
+Usage:
+  python tools/batch_export.py inputs.csv --select category=product --out .cache/batch/product
+  python tools/batch_export.py rows.ndjson --slug repo-audit --provider openai-responses --model gpt-5
+  cat rows.ndjson | python tools/batch_export.py - --format ndjson --select tag=git --max-lines 10000
+"""
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import pathlib
+import re
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+import facets  # noqa: E402
+import instrument  # noqa: E402
+import render_prompt  # noqa: E402
+
+DEFAULT_OUT = pathlib.Path(".cache") / "batch"
+DEFAULT_MAX_LINES = 50_000
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+MAX_ID_LEN = 64
+_ID_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_-]+")
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmg]?)i?b?\s*$", re.IGNORECASE)
+
+
+def parse_size(text: str) -> int:
+    """'200MB' / '512k' / '1048576' -> bytes (binary multiples)."""
+    m = _SIZE_RE.match(text)
+    if not m:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+    return int(float(m.group(1)) * 1024 ** " kmg".index((m.group(2) or " ").lower()))
+
+
+def custom_id(slug: str, row_id: str) -> str:
+    """Stable, provider-safe request id for one (prompt, row) pair."""
+    raw = f"{slug}-{row_id}"
+    cid = _ID_UNSAFE_RE.sub("-", raw)
+    if len(cid) > MAX_ID_LEN or cid != raw:
+        # Digest of the raw id keeps sanitized or truncated ids distinct.
+        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:10]
+        cid = f"{cid[:MAX_ID_LEN - len(digest) - 1]}-{digest}"
+    return cid
+
+
+# -- provider formats ---------------------------------------------------------
+
+def _openai_chat(payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    body = dict(payload)
+    if "max_output_tokens" in body:
+        body["max_completion_tokens"] = body.pop("max_output_tokens")
+    return "/v1/chat/completions", body
+
+
+def _openai_responses(payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    body = {k: v for k, v in payload.items() if k not in ("messages", "reasoning_effort", "verbosity")}
+    body["input"] = payload["messages"]
+    if payload.get("reasoning_effort"):
+        body["reasoning"] = {"effort": payload["reasoning_effort"]}
+    if payload.get("verbosity"):
+        body["text"] = {"verbosity": payload["verbosity"]}
+    return "/v1/responses", body
+
+
+PROVIDERS: Dict[str, Callable[[Dict[str, Any]], Tuple[str, Dict[str, Any]]]] = {
+    "openai": _openai_chat,
+    "openai-responses": _openai_responses,
+}
+
+
+def request_line(provider: str, cid: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    url, body = PROVIDERS[provider](payload)
+    return {"custom_id": cid, "method": "POST", "url": url, "body": body}
+
+
+# -- input --------------------------------------------------------------------
+
+def _row_id(value: Any, n: int) -> str:
+    """The row's explicit id, or "#<n>" for rows without one (never equal to an explicit id)."""
+    if value in (None, ""):
+        return f"#{n}"
+    text = str(value)
+    return "#" + text if text.startswith("#") else text
+
+
+def read_rows(stream, fmt: str, id_field: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (row id, variables) from a CSV or NDJSON stream, one row at a time."""
+    if fmt == "csv":
+        csv.field_size_limit(2 ** 31 - 1)
+        for n, row in enumerate(csv.DictReader(stream), 1):
+            # Empty cells count as unset so slot defaults apply.
+            variables = {k: v for k, v in row.items() if k and k != id_field and v not in (None, "")}
+            yield _row_id(row.get(id_field), n), variables
+        return
+    n = 0
+    for lineno, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        n += 1
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"input line {lineno}: {e}")
+        if not isinstance(obj, dict):
+            raise ValueError(f"input line {lineno}: expected a JSON object")
+        rid = _row_id(obj.get(id_field), n)
+        if isinstance(obj.get("variables"), dict):
+            variables = obj["variables"]
+        else:
+            variables = {k: v for k, v in obj.items() if k != id_field}
+        yield rid, variables
+
+
+def detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    suffix = pathlib.Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".ndjson", ".jsonl", ".json"):
+        return "ndjson"
+    raise ValueError(f"cannot infer the format of {path!r}; pass --format csv|ndjson")
+
+
+# -- output -------------------------------------------------------------------
+
+class ShardWriter:
+    """Writes JSONL lines into numbered shards capped by line count and size."""
+
+    def __init__(self, out: pathlib.Path, name: str, max_lines: int, max_bytes: int):
+        self.out = out
+        self.name = name
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.shards: List[Dict[str, Any]] = []
+        self._fh: Optional[io.BufferedWriter] = None
+        self._sha = None
+
+    def _open(self) -> None:
+        self._close()
+        path = self.out / f"{self.name}-{len(self.shards) + 1:05d}.jsonl"
+        self._fh = open(path, "wb")
+        self._sha = hashlib.sha256()
+        self.shards.append({"file": path.name, "lines": 0, "bytes": 0})
+
+    def _close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self.shards[-1]["sha256"] = self._sha.hexdigest()
+            instrument.wrote(self.out / self.shards[-1]["file"])
+            self._fh = None
+
+    def write(self, obj: Dict[str, Any]) -> None:
+        data = (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        if len(data) > self.max_bytes:
+            raise ValueError(f"{obj.get('custom_id')}: request is {len(data)} bytes, over --max-bytes {self.max_bytes}")
+        shard = self.shards[-1] if self._fh is not None else None
+        if shard is None or shard["lines"] >= self.max_lines or shard["bytes"] + len(data) > self.max_bytes:
+            self._open()
+            shard = self.shards[-1]
+        self._fh.write(data)
+        self._sha.update(data)
+        shard["lines"] += 1
+        shard["bytes"] += len(data)
+
+    def close(self) -> None:
+        self._close()
+
+
+def select_slugs(root: pathlib.Path, filters: Dict[str, List[str]], match_all: Tuple[str, ...],
+                 slugs: List[str]) -> List[str]:
+    """Slugs of specs matching the facet filters, plus explicit slugs, in index order."""
+    selected = list(dict.fromkeys(slugs))
+    if filters:
+        index = facets.load_index(root)
+        if index is None:
+            raise ValueError("tools/index.json not found; run scripts/build_tools_index.py first")
+        for doc in index.query(filters, match_all)["prompts"]:
+            if doc.get("spec") and doc["slug"] not in selected:
+                selected.append(doc["slug"])
+    return selected
+
+
+def export(rows: Iterator[Tuple[str, Dict[str, Any]]], templates: List[render_prompt.Template],
+           writer: ShardWriter, errors, provider: str, model: Optional[str] = None,
+           strict: bool = True, limit: Optional[int] = None) -> Dict[str, int]:
+    """Render every row against every template into the writer; returns counts."""
+    stats = {"rows": 0, "requests": 0, "errors": 0}
+    for row_id, variables in rows:
+        if limit is not None and stats["rows"] >= limit:
+            break
+        stats["rows"] += 1
+        for template in templates:
+            cid = custom_id(template.slug, row_id)
+            try:
+                payload = template.render(variables, strict)
+            except render_prompt.MissingSlotsError as e:
+                stats["errors"] += 1
+                errors.write(json.dumps({"custom_id": cid, "row": row_id, "slug": template.slug, "error": str(e)},
+                                        ensure_ascii=False, separators=(",", ":")) + "\n")
+                continue
+            if model:
+                payload["model"] = model
+            writer.write(request_line(provider, cid, payload))
+            stats["requests"] += 1
+    instrument.count("rows_read", stats["rows"])
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export batch-inference request JSONL for selected prompts")
+    parser.add_argument("input", help="CSV or NDJSON dataset of slot values ('-' for stdin)")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="Input format (default: from the extension)")
+    parser.add_argument("--select", action="append", default=[], metavar="FACET=VALUE",
+                        help=f"Select prompts by facet (repeatable). Facets: {', '.join(facets.FACETS)}")
+    parser.add_argument("--all-tags", action="store_true", help="Require every tag= value (default: any)")
+    parser.add_argument("--slug", action="append", default=[], help="Select a prompt by slug (repeatable)")
+    parser.add_argument("--provider", choices=sorted(PROVIDERS), default="openai",
+                        help="Request line format (default: openai)")
+    parser.add_argument("--model", help="Override every spec's target_model")
+    parser.add_argument("--id-field", default="id", help="Input column/key holding the row id (default: id)")
+    parser.add_argument("--out", type=pathlib.Path, default=DEFAULT_OUT, help=f"Output directory (default: {DEFAULT_OUT})")
+    parser.add_argument("--name", default="batch", help="Shard file prefix (default: batch)")
+    parser.add_argument("--max-lines", type=int, default=DEFAULT_MAX_LINES,
+                        help=f"Requests per shard (default: {DEFAULT_MAX_LINES})")
+    parser.add_argument("--max-bytes", type=parse_size, default=DEFAULT_MAX_BYTES,
+                        help="Bytes per shard, e.g. 100MB (default: 200MB)")
+    parser.add_argument("--limit", type=int, help="Export only the first N rows")
+    parser.add_argument("--allow-missing", action="store_true", help="Leave unfilled required slots as-is")
+    instrument.add_arguments(parser)
+    args = parser.parse_args(argv)
+    instrument.start(args, "batch_export")
+    if not args.select and not args.slug:
+        parser.error("select prompts with --select FACET=VALUE and/or --slug SLUG")
+    if args.max_lines < 1:
+        parser.error("--max-lines must be at least 1")
+
+    # Input and output paths are relative to the caller's cwd; prompts resolve from the repo root.
+    src = args.input if args.input == "-" else str(pathlib.Path(args.input).resolve())
+    out = args.out.resolve()
+    os.chdir(REPO_ROOT)
+    try:
+        fmt = detect_format(args.input, args.format) if args.input != "-" or args.format else "ndjson"
+        filters = facets.parse_filters(args.select)
+        with instrument.span("select prompts"):
+            slugs = select_slugs(pathlib.Path("."), filters, ("tag",) if args.all_tags else (), args.slug)
+            renderer = render_prompt.Renderer()
+            templates = [renderer.template(slug) for slug in slugs]
+    except (ValueError, KeyError, OSError) as e:
+        print(f"Error: {e.args[0] if isinstance(e, KeyError) else e}", file=sys.stderr)
+        return 2
+    if not templates:
+        print("Error: no prompts match the selection.", file=sys.stderr)
+        return 2
+
+    out.mkdir(parents=True, exist_ok=True)
+    for stale in out.glob(f"{args.name}-*.jsonl"):
+        if re.fullmatch(rf"{re.escape(args.name)}-(\d{{5}}|errors)\.jsonl", stale.name):
+            stale.unlink()
+    writer = ShardWriter(out, args.name, args.max_lines, args.max_bytes)
+    errors_path = out / f"{args.name}-errors.jsonl"
+    stream = sys.stdin if src == "-" else open(src, encoding="utf-8", newline="" if fmt == "csv" else None)
+    try:
+        with stream, open(errors_path, "w", encoding="utf-8") as errors, instrument.span("export"):
+            stats = export(read_rows(stream, fmt, args.id_field), templates, writer, errors,
+                           args.provider, args.model, not args.allow_missing, args.limit)
+    except (ValueError, OSError, csv.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        writer.close()
+    if not stats["errors"]:
+        errors_path.unlink()
+
+    manifest = {
+        "input": args.input,
+        "provider": args.provider,
+        "model": args.model,
+        "prompts": [{"slug": t.slug, "hash": t.hash} for t in templates],
+        **stats,
+        "errors_file": errors_path.name if stats["errors"] else None,
+        "shards": writer.shards,
+    }
+    manifest_path = out / f"{args.name}-manifest.json"
+    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {stats['requests']} requests ({stats['rows']} rows x {len(templates)} prompts) "
+          f"to {len(writer.shards)} shard(s) in {out}", file=sys.stderr)
+    if stats["errors"]:
+        print(f"WARN: {stats['errors']} request(s) failed to render; see {errors_path}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+catalog_server.py
+
+Long-running prompt catalog daemon with an HTTP/JSON query API.
+
+The catalog is parsed once at startup (via scripts/catalog.py) into the same
+entry structures as tools/index.json and prompts/index.json, plus an
+in-memory BM25 inverted index (scripts/build_search_index.py). A polling
+watcher stats prompts/ every --poll seconds and re-parses only the .md/.json
+pairs whose mtime or size changed, so lookups never touch the filesystem.
+
+Endpoints (GET):
+  /healthz                      status, entry count, reload generation
+  /prompts[?tag=&category=]     list prompt summaries; also max_tokens=,
+                                min_tokens=, max_bytes=, sort=tokens|bytes|-tokens|-bytes
+  /prompts/<slug>               one summary plus its full JSON spec ("spec" is
+                                null for prompts that only have a .md file)
+  /tags/<tag>                   prompts carrying a tag
+  /search?q=&tags=a,b&limit=N   BM25-ranked full-text search
+  /facets?tag=a&tag=b&category=&target_model=&reasoning_effort=&verbosity=&author=
+                                filtered prompts plus per-facet counts
+                                (scripts/facets.py); also all_tags=1, limit=, offset=
+  /suggest?q=&limit=N           typo-tolerant title/slug/tag autocomplete
+                                (scripts/fuzzy_index.py)
+
+Usage:
+  python tools/catalog_server.py --port 8765
+  python tools/catalog_server.py --unix /tmp/prompt-hub.sock
+"""
+import argparse
+import asyncio
+import json
+import os
+import pathlib
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+import build_prompts_index  # noqa: E402
+import build_search_index  # noqa: E402
+import build_tools_index  # noqa: E402
+import catalog  # noqa: E402
+import facets  # noqa: E402
+import fuzzy_index  # noqa: E402
+
+Key = Tuple[str, str]  # (directory, name)
+
+
+class CatalogState:
+    """Parsed catalog, summaries and inverted index held in memory."""
+
+    def __init__(self, root: pathlib.Path = catalog.PROMPTS_ROOT):
+        self.root = root
+        self.entries: Dict[Key, Dict[str, Any]] = {}
+        self.specs: Dict[Key, Dict[str, Any]] = {}
+        self.slugs: Dict[str, Key] = {}
+        self.terms: Dict[Key, Counter] = {}
+        self.lens: Dict[Key, int] = {}
+        self.postings: Dict[str, Dict[Key, int]] = {}
+        self.total_len = 0
+        self.stamps: Dict[str, Tuple[int, int]] = {}
+        self.generation = 0
+        self._facets: Optional[Tuple[int, facets.FacetIndex]] = None
+        self._fuzzy: Optional[Tuple[int, fuzzy_index.FuzzyIndex]] = None
+
+    # -- loading -----------------------------------------------------------
+    def load(self) -> None:
+        for rec in catalog.scan(self.root).records:
+            self._put(rec)
+        self.stamps = self._stat_tree()
+        self.generation += 1
+
+    def _summary(self, rec: catalog.PromptRecord) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {"slug": rec.name, "category": rec.category}
+        if rec.md_path is not None:
+            doc = build_tools_index.build_entry(rec.md_path, rec.md_text)
+            summary.update(path=doc["path"], title=doc["title"], tags=doc["tags"],
+                           last_updated=doc["last_updated"], author=doc["author"])
+        else:
+            summary.update(path=None, title=rec.name, tags=[], last_updated="", author="")
+        if rec.spec is not None:
+            spec = build_prompts_index.entry_for(rec.json_path, rec.spec)
+            summary.update(spec_path=spec["path"], hash=spec["hash"], model=spec["model"],
+                           reasoning_effort=spec["reasoning_effort"], verbosity=spec["verbosity"],
+                           tokens=spec["tokens"], bytes=spec["bytes"])
+        return summary
+
+    def _put(self, rec: catalog.PromptRecord) -> None:
+        key = (rec.directory, rec.name)
+        self._remove(key)
+        summary = self._summary(rec)
+        self.entries[key] = summary
+        if rec.spec is not None:
+            self.specs[key] = rec.spec
+        for alias in (rec.name, f"{rec.category}/{rec.name}"):
+            current = self.slugs.get(alias)
+            # A record with a JSON spec wins a shared slug over a .md-only one.
+            if current is None or rec.spec is not None or current not in self.specs:
+                self.slugs[alias] = key
+        messages = "\n".join(m.get("content", "") for m in (rec.spec or {}).get("messages", []) if isinstance(m, dict))
+        tf = build_search_index.document_terms(summary["title"] or "", summary["tags"], rec.body, messages)
+        self.terms[key] = tf
+        self.lens[key] = sum(tf.values())
+        self.total_len += self.lens[key]
+        for term, freq in tf.items():
+            self.postings.setdefault(term, {})[key] = freq
+
+    def _remove(self, key: Key) -> None:
+        summary = self.entries.pop(key, None)
+        if summary is None:
+            return
+        self.specs.pop(key, None)
+        for alias in (summary["slug"], f"{summary['category']}/{summary['slug']}"):
+            if self.slugs.get(alias) == key:
+                del self.slugs[alias]
+                # Hand the slug to any remaining record that shares it, spec-bearing first.
+                others = [k for k, e in self.entries.items() if alias in (e["slug"], f"{e['category']}/{e['slug']}")]
+                if others:
+                    self.slugs[alias] = max(others, key=lambda k: (k in self.specs, k))
+        tf = self.terms.pop(key, Counter())
+        self.total_len -= self.lens.pop(key, 0)
+        for term in tf:
+            plist = self.postings.get(term)
+            if plist is not None:
+                plist.pop(key, None)
+                if not plist:
+                    del self.postings[term]
+
+    # -- hot reload --------------------------------------------------------
+    def _stat_tree(self) -> Dict[str, Tuple[int, int]]:
+        stamps = {}
+        for top, files in catalog.walk(self.root):
+            if "templates" in pathlib.PurePath(top).parts:
+                continue
+            for e in files:
+                if e.name.endswith((".md", ".json")) and e.name != catalog.INDEX_NAME:
+                    st = e.stat()
+                    stamps[e.path] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def poll_changes(self) -> Tuple[Dict[str, Tuple[int, int]], Dict[Key, Optional[catalog.PromptRecord]]]:
+        """Stat the tree and re-read changed pairs (safe to run off the event loop)."""
+        stamps = self._stat_tree()
+        changed = {p for p in stamps.keys() | self.stamps.keys() if stamps.get(p) != self.stamps.get(p)}
+        keys = {(os.path.dirname(p), os.path.splitext(os.path.basename(p))[0]) for p in changed}
+        return stamps, {key: catalog.load_record(*key) for key in keys}
+
+    def apply_changes(self, stamps: Dict[str, Tuple[int, int]], records: Dict[Key, Optional[catalog.PromptRecord]]) -> int:
+        for key, rec in records.items():
+            if rec is None:
+                self._remove(key)
+            else:
+                self._put(rec)
+        self.stamps = stamps
+        if records:
+            self.generation += 1
+        return len(records)
+
+    # -- queries -----------------------------------------------------------
+    def list(self, tag: Optional[str] = None, category: Optional[str] = None,
+             limits: Optional[Dict[str, Tuple[Optional[int], Optional[int]]]] = None,
+             sort: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Filter by tag/category and {field: (min, max)} size limits; sort by a size field ('-' for desc)."""
+        def fits(e: Dict[str, Any]) -> bool:
+            for field, (lo, hi) in (limits or {}).items():
+                value = e.get(field)
+                if value is None or (lo is not None and value < lo) or (hi is not None and value > hi):
+                    return False
+            return True
+
+        out = [e for e in self.entries.values()
+               if (tag is None or tag in e["tags"]) and (category is None or e["category"] == category) and fits(e)]
+        out.sort(key=lambda e: e["path"] or e.get("spec_path") or "")
+        if sort:
+            field = sort.lstrip("-")
+            sized = sorted((e for e in out if e.get(field) is not None), key=lambda e: e[field], reverse=sort.startswith("-"))
+            out = sized + [e for e in out if e.get(field) is None]
+        return out
+
+    def get(self, slug: str) -> Optional[Dict[str, Any]]:
+        key = self.slugs.get(slug)
+        if key is None:
+            return None
+        return {"prompt": self.entries[key], "spec": self.specs.get(key)}
+
+    def facet_index(self) -> facets.FacetIndex:
+        """Facet bitsets over the current entries, rebuilt once per reload generation."""
+        if self._facets is None or self._facets[0] != self.generation:
+            docs = sorted(self.entries.values(), key=lambda e: e["path"] or e.get("spec_path") or "")
+            self._facets = (self.generation, facets.FacetIndex(docs))
+        return self._facets[1]
+
+    def fuzzy_index(self) -> fuzzy_index.FuzzyIndex:
+        """Trigram index over titles, slugs and tags, rebuilt once per reload generation."""
+        if self._fuzzy is None or self._fuzzy[0] != self.generation:
+            docs = sorted(self.entries.values(), key=lambda e: e["path"] or e.get("spec_path") or "")
+            self._fuzzy = (self.generation, fuzzy_index.FuzzyIndex(docs))
+        return self._fuzzy[1]
+
+    def search(self, text: str, tags: Optional[List[str]] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        terms = list(dict.fromkeys(build_search_index.tokenize(text)))
+        if not terms:
+            return []
+        n = len(self.entries)
+        scores = build_search_index.rank(
+            [self.postings.get(t, {}) for t in terms],
+            self.lens.__getitem__,
+            n,
+            self.total_len / n if n else 0.0,
+        )
+        results = []
+        for key, score in sorted(scores.items(), key=lambda kv: (-kv[1], kv[0])):
+            entry = self.entries[key]
+            if tags and not set(tags) <= set(entry["tags"]):
+                continue
+            results.append(dict(entry, score=round(score, 4)))
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+
+def _int_param(params: Dict[str, str], name: str) -> Optional[int]:
+    return int(params[name]) if name in params else None
+
+
+class CatalogServer:
+    """Minimal HTTP/1.1 (keep-alive) JSON server over TCP or a Unix socket."""
+
+    def __init__(self, state: CatalogState, poll: float):
+        self.state = state
+        self.poll = poll
+
+    def dispatch(self, method: str, target: str) -> Tuple[int, Any]:
+        if method not in ("GET", "HEAD"):
+            return 405, {"error": "method not allowed"}
+        url = urlsplit(target)
+        multi = parse_qs(url.query)
+        params = {k: v[-1] for k, v in multi.items()}
+        parts = [unquote(p) for p in url.path.strip("/").split("/") if p]
+        st = self.state
+        if parts == ["healthz"]:
+            return 200, {"status": "ok", "prompts": len(st.entries), "generation": st.generation}
+        if parts == ["prompts"]:
+            try:
+                limits = {
+                    "tokens": (_int_param(params, "min_tokens"), _int_param(params, "max_tokens")),
+                    "bytes": (None, _int_param(params, "max_bytes")),
+                }
+            except ValueError:
+                return 400, {"error": "min_tokens, max_tokens and max_bytes must be integers"}
+            sort = params.get("sort")
+            if sort and sort.lstrip("-") not in ("tokens", "bytes"):
+                return 400, {"error": "sort must be tokens, bytes, -tokens or -bytes"}
+            limits = {k: v for k, v in limits.items() if v != (None, None)}
+            items = st.list(params.get("tag"), params.get("category"), limits, sort)
+            return 200, {"count": len(items), "prompts": items}
+        if len(parts) >= 2 and parts[0] == "prompts":
+            found = st.get("/".join(parts[1:]))
+            return (200, found) if found else (404, {"error": f"unknown prompt: {'/'.join(parts[1:])}"})
+        if len(parts) == 2 and parts[0] == "tags":
+            items = st.list(tag=parts[1])
+            return 200, {"count": len(items), "prompts": items}
+        if parts == ["search"]:
+            try:
+                limit = int(params["limit"]) if "limit" in params else None
+            except ValueError:
+                return 400, {"error": "limit must be an integer"}
+            tags = [t for t in params.get("tags", "").split(",") if t]
+            results = st.search(params.get("q", ""), tags, limit)
+            return 200, {"count": len(results), "results": results}
+        if parts == ["facets"]:
+            try:
+                limit, offset = _int_param(params, "limit"), _int_param(params, "offset") or 0
+            except ValueError:
+                return 400, {"error": "limit and offset must be integers"}
+            try:
+                filters = facets.parse_filters(f"{k}={v}" for k, values in multi.items() if k in facets.FACETS for v in values)
+            except ValueError as e:
+                return 400, {"error": str(e)}
+            match_all = ("tag",) if params.get("all_tags") in ("1", "true") else ()
+            return 200, st.facet_index().query(filters, match_all, limit, offset)
+        if parts == ["suggest"]:
+            try:
+                limit = int(params.get("limit", 10))
+            except ValueError:
+                return 400, {"error": "limit must be an integer"}
+            results = st.fuzzy_index().search(params.get("q", ""), limit)
+            return 200, {"count": len(results), "results": results}
+        return 404, {"error": "not found"}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                method, target, version = line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = h.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                if length:
+                    await reader.readexactly(length)
+                try:
+                    status, payload = self.dispatch(method, target)
+                except Exception as e:  # keep the connection and answer in JSON
+                    print(f"Error: {method} {target}: {e!r}", file=sys.stderr)
+                    status, payload = 500, {"error": f"internal error: {type(e).__name__}: {e}"}
+                body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                head = (
+                    f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}\r\n"
+                    "Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                )
+                writer.write(head.encode("latin-1") + (body if method != "HEAD" else b""))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def watch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.poll)
+            try:
+                stamps, records = await loop.run_in_executor(None, self.state.poll_changes)
+            except Exception as e:  # keep serving the last good catalog
+                print(f"WARN: reload failed: {e}", file=sys.stderr)
+                continue
+            if records:
+                n = self.state.apply_changes(stamps, records)
+                print(f"Reloaded {n} changed entr{'y' if n == 1 else 'ies'} (generation {self.state.generation})", file=sys.stderr)
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+async def serve(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    state = CatalogState()
+    state.load()
+    server = CatalogServer(state, args.poll)
+    if args.unix:
+        srv = await asyncio.start_unix_server(server.handle, path=args.unix)
+        where = args.unix
+    else:
+        srv = await asyncio.start_server(server.handle, host=args.host, port=args.port)
+        where = f"http://{args.host}:{args.port}"
+    print(f"Serving {len(state.entries)} prompts on {where} "
+          f"(loaded in {(time.perf_counter() - started) * 1000:.1f} ms)", file=sys.stderr)
+    tasks = [asyncio.create_task(srv.serve_forever())]
+    if args.poll > 0:
+        tasks.append(asyncio.create_task(server.watch()))
+    await asyncio.gather(*tasks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the prompt catalog over HTTP/JSON with hot reload")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument("--unix", help="Serve on this Unix socket path instead of TCP")
+    parser.add_argument("--poll", type=float, default=1.0, help="Seconds between change polls; 0 disables hot reload")
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    if not catalog.PROMPTS_ROOT.exists():
+        print("Error: prompts directory not found.", file=sys.stderr)
+        sys.exit(1)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
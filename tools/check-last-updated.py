@@ -9,136 +9,88 @@ This script:
 2. Compares the content body (excluding frontmatter) with the previous version
 3. If body content has changed, ensures last_updated field reflects today's date
 4. Fails if last_updated is not current when body changes
+
+All staged and HEAD blobs are streamed through one `git cat-file --batch`
+process (scripts/gitobjects.py), and files whose bodies are identical are
+skipped before the date check, so hook time stays flat as the number of
+changed files grows. A renamed prompt is compared against the blob at its
+old path, so a pure `git mv` needs no date bump. --jobs parallelises the
+check step for very large change sets.
 """
 
 import argparse
+import hashlib
 import pathlib
-import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+
 
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "scripts"))
+from catalog import parse_frontmatter  # noqa: E402
+from gitobjects import GitObjectReader, run_git  # noqa: E402
+import instrument  # noqa: E402
 
-FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---\n(.*)", re.DOTALL)
+NULL_OID = "0" * 40
 
 
 def extract_frontmatter_and_body(text: str) -> Tuple[Dict[str, Any], str]:
     """Extract YAML frontmatter and body content from markdown text."""
-    match = FRONTMATTER_RE.match(text)
-    if not match:
-        return {}, text
-    
-    frontmatter_text, body = match.groups()
-    metadata = {}
-    
-    # Simple YAML parsing for basic key: value pairs and arrays
-    for line in frontmatter_text.strip().split('\n'):
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        
-        if ':' not in line:
-            continue
-            
-        key, value = line.split(':', 1)
-        key = key.strip()
-        value = value.strip()
-        
-        # Handle quoted strings
-        if value.startswith('"') and value.endswith('"'):
-            value = value[1:-1]
-        elif value.startswith("'") and value.endswith("'"):
-            value = value[1:-1]
-        # Handle arrays
-        elif value.startswith('[') and value.endswith(']'):
-            # Simple array parsing - split by comma and clean quotes
-            items = []
-            for item in value[1:-1].split(','):
-                item = item.strip()
-                if item.startswith('"') and item.endswith('"'):
-                    item = item[1:-1]
-                elif item.startswith("'") and item.endswith("'"):
-                    item = item[1:-1]
-                items.append(item)
-            value = items
-            
-        metadata[key] = value
-    
+    metadata, body = parse_frontmatter(text)
     return metadata, body.strip()
 
 
-def get_git_staged_content(file_path: str) -> Optional[str]:
-    """Get the staged content of a file from git."""
-    try:
-        result = subprocess.run(
-            ['git', 'show', f':{file_path}'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout
-    except subprocess.CalledProcessError:
-        # File might be newly added
-        return None
-
+def body_digest(blob: bytes) -> str:
+    """Hash of the body as extract_frontmatter_and_body() splits it."""
+    _metadata, body = extract_frontmatter_and_body(blob.decode('utf-8', 'surrogateescape'))
+    return hashlib.sha256(body.encode('utf-8', 'surrogateescape')).hexdigest()
 
-def get_git_head_content(file_path: str) -> Optional[str]:
-    """Get the HEAD content of a file from git."""
-    try:
-        result = subprocess.run(
-            ['git', 'show', f'HEAD:{file_path}'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout
-    except subprocess.CalledProcessError:
-        # File might be newly added
-        return None
 
+def get_modified_prompt_files() -> List[Tuple[str, Optional[str], str]]:
+    """Staged .md files under prompts/ as (path, head_oid or None, staged_oid).
 
-def get_modified_prompt_files() -> list[str]:
-    """Get list of modified .md files in prompts/ directory that are staged."""
+    For a rename, head_oid is the blob at the old path.
+    """
     try:
-        result = subprocess.run(
-            ['git', 'diff', '--cached', '--name-only', '--diff-filter=AM'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        files = []
-        for line in result.stdout.strip().split('\n'):
-            if line and line.endswith('.md') and line.startswith('prompts/'):
-                files.append(line)
-        return files
+        out = run_git(['diff', '--cached', '--raw', '-z', '--find-renames', '--no-abbrev', '--diff-filter=AMR'])
     except subprocess.CalledProcessError:
         return []
 
+    files = []
+    fields = iter(out.decode('utf-8', 'surrogateescape').split('\0'))
+    # Records are ":<old mode> <new mode> <old oid> <new oid> <status>" NUL "<path>" NUL,
+    # with a second path (old, then new) for renames (status R<score>).
+    for meta in fields:
+        if not meta.startswith(':'):
+            continue
+        _old_mode, _new_mode, old_oid, new_oid, status = meta[1:].split(' ')
+        path = next(fields)
+        if status.startswith('R'):
+            path = next(fields)
+        if path.endswith('.md') and path.startswith('prompts/'):
+            files.append((path, None if old_oid == NULL_OID else old_oid, new_oid))
+    return files
+
 
-def check_file_last_updated(file_path: str) -> Tuple[bool, str]:
+def check_file_last_updated(file_path: str, current_content: Optional[str], previous_content: Optional[str]) -> Tuple[bool, str]:
     """
     Check if a file's last_updated field is current when body content has changed.
     
     Returns:
         (passed, message) - passed is True if check passes, message explains result
     """
-    # Get current staged content
-    current_content = get_git_staged_content(file_path)
     if current_content is None:
         return False, f"Could not read staged content for {file_path}"
     
-    # Get previous content from HEAD
-    previous_content = get_git_head_content(file_path)
-    
     # Parse current content
     current_metadata, current_body = extract_frontmatter_and_body(current_content)
+    today = date.today().isoformat()
     
     # If this is a new file (no previous content), check that last_updated is today
     if previous_content is None:
         current_last_updated = current_metadata.get('last_updated', '')
-        today = date.today().isoformat()
         
         if current_last_updated != today:
             return False, (
@@ -156,7 +108,6 @@ def check_file_last_updated(file_path: str) -> Tuple[bool, str]:
     
     # Body has changed, check if last_updated is current
     current_last_updated = current_metadata.get('last_updated', '')
-    today = date.today().isoformat()
     
     if current_last_updated != today:
         return False, (
@@ -167,6 +118,43 @@ def check_file_last_updated(file_path: str) -> Tuple[bool, str]:
     return True, f"Body changed in {file_path} and last_updated is current ({today})"
 
 
+def _check_blobs(item: Tuple[str, Optional[bytes], Optional[bytes]]) -> Tuple[str, bool, str]:
+    file_path, staged, previous = item
+    with instrument.span("check last_updated"):
+        passed, message = check_file_last_updated(
+            file_path,
+            staged.decode('utf-8') if staged is not None else None,
+            previous.decode('utf-8') if previous is not None else None,
+        )
+    return file_path, passed, message
+
+
+def check_files(files: List[Tuple[str, Optional[str], str]], jobs: int = 1) -> List[Tuple[str, bool, str]]:
+    """Check every staged file, reading all blobs through one cat-file process."""
+    results = []
+    pending = []
+    with instrument.span("read blobs"), GitObjectReader() as reader:
+        blobs = reader.read_many(dict.fromkeys(oid for _path, head, staged in files for oid in (staged, head) if oid))
+    for path, head_oid, staged_oid in files:
+        staged = blobs.get(staged_oid)
+        previous = blobs.get(head_oid) if head_oid else None
+        with instrument.span("body digest"):
+            same_body = staged is not None and previous is not None and body_digest(staged) == body_digest(previous)
+        if same_body:
+            results.append((path, True, f"No body changes in {path}, last_updated check skipped"))
+            continue
+        pending.append((path, staged, previous))
+
+    if jobs > 1 and len(pending) > jobs:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results.extend(pool.map(_check_blobs, pending, chunksize=max(1, len(pending) // (jobs * 4))))
+    else:
+        results.extend(_check_blobs(item) for item in pending)
+    order = {path: i for i, (path, _h, _s) in enumerate(files)}
+    results.sort(key=lambda r: order[r[0]])
+    return results
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Check last_updated field when prompt body content changes"
@@ -176,7 +164,15 @@ def main():
         action="store_true", 
         help="Show detailed output for all files checked"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Worker processes for parsing changed files (default: 1)"
+    )
+    instrument.add_arguments(parser)
     args = parser.parse_args()
+    instrument.start(args, "check-last-updated")
     
     modified_files = get_modified_prompt_files()
     
@@ -187,9 +183,7 @@ def main():
     
     failed_files = []
     
-    for file_path in modified_files:
-        passed, message = check_file_last_updated(file_path)
-        
+    for file_path, passed, message in check_files(modified_files, args.jobs):
         if args.verbose or not passed:
             status = "✓" if passed else "✗"
             print(f"{status} {message}")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+convert.py
+
+Stream-convert every prompt into NDJSON (one JSON object per line, per prompt).
+
+Modes:
+  json      {"file", "metadata", "body"}              frontmatter parsed + markdown body
+  yaml      {"file", "frontmatter"}                   raw frontmatter YAML text
+  combined  {"file", "slug", "category", "metadata", "body", "spec"}
+            markdown doc merged with its sibling <slug>.json spec (null if absent)
+
+Files are parsed and serialized in a process pool (--jobs) behind a bounded
+in-flight window, and lines are written in catalog order as they complete,
+so memory stays flat regardless of catalog size.
+
+Usage:
+  python tools/convert.py json > prompts.ndjson
+  python tools/convert.py combined --jobs 8 -o catalog.ndjson
+"""
+import argparse
+import json
+import os
+import pathlib
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "scripts"))
+import catalog  # noqa: E402
+
+MODES = ("json", "yaml", "combined")
+
+
+def convert_file(path: str, mode: str) -> Optional[str]:
+    """Convert one markdown file to an NDJSON line (None if it has no frontmatter)."""
+    md = pathlib.Path(path)
+    text = md.read_text(encoding="utf-8")
+    m = catalog.FRONTMATTER_RE.match(text)
+    if not m:
+        return None
+    if mode == "yaml":
+        obj = {"file": path, "frontmatter": m.group(1)}
+    else:
+        meta, body = catalog.parse_frontmatter(text)
+        body = body.rstrip("\n")
+        if mode == "json":
+            obj = {"file": path, "metadata": meta, "body": body}
+        else:
+            spec_path = md.with_suffix(".json")
+            spec = None
+            if spec_path.is_file():
+                spec, error = catalog.load_spec(spec_path.read_bytes())
+                if error:
+                    print(f"Warning: invalid JSON spec {spec_path}: {error}", file=sys.stderr)
+            obj = {"file": path, "slug": md.stem, "category": catalog.category_of(str(md.parent)),
+                   "metadata": meta, "body": body, "spec": spec}
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _convert_chunk(paths, mode):
+    return [(p, convert_file(p, mode)) for p in paths]
+
+
+def _chunks(items: Iterable[str], size: int) -> Iterator[list]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def convert(paths: Iterable[str], mode: str, jobs: int = 1, chunk_size: int = 16) -> Iterator[str]:
+    """Yield NDJSON lines for paths in order, using up to ``jobs`` processes."""
+    if jobs <= 1:
+        results: Iterable = ((p, convert_file(p, mode)) for p in paths)
+        yield from _emit(results)
+        return
+    window = jobs * 2
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending: deque = deque()
+        for chunk in _chunks(paths, chunk_size):
+            pending.append(pool.submit(_convert_chunk, chunk, mode))
+            if len(pending) >= window:
+                yield from _emit(pending.popleft().result())
+        while pending:
+            yield from _emit(pending.popleft().result())
+
+
+def _emit(results) -> Iterator[str]:
+    for path, line in results:
+        if line is None:
+            print(f"Skipping (no frontmatter): {path}", file=sys.stderr)
+        else:
+            yield line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export prompt markdown/specs as NDJSON")
+    parser.add_argument("mode", nargs="?", default="json", choices=MODES, help="Export mode (default: json)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", "-o", help="Write to this file instead of stdout")
+    args = parser.parse_args()
+
+    root = pathlib.Path(__file__).resolve().parent.parent
+    os.chdir(root)
+    if not catalog.PROMPTS_ROOT.exists():
+        print(f"Prompts directory not found: {root / 'prompts'}", file=sys.stderr)
+        sys.exit(1)
+
+    paths = (str(p) for p in catalog.list_files(catalog.PROMPTS_ROOT, ".md"))
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for line in convert(paths, args.mode, args.jobs):
+            out.write(line + "\n")
+    except BrokenPipeError:
+        # Downstream consumer (e.g. head) closed the pipe early.
+        sys.stderr.close()
+    finally:
+        if args.output:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
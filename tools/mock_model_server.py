@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+mock_model_server.py
+
+Local stand-in for an OpenAI-compatible Chat Completions endpoint, for
+exercising tools/run_workflow.py (and anything else that posts rendered
+payloads) without network access or API keys.
+
+Every completion is deterministic: the reply names the model, the message
+count and a digest of the request, and echoes the first line of the last
+user message, so downstream steps visibly receive upstream output. Usage
+counts come from scripts/token_estimate.py. --latency/--jitter add an
+artificial per-request delay to make concurrency measurable.
+
+Endpoints:
+  POST /v1/chat/completions   (also /chat/completions)
+  GET  /v1/models
+  GET  /healthz
+
+Usage:
+  python tools/mock_model_server.py --port 8766 --latency 200
+  python tools/run_workflow.py docs/workflows/repo-audit-to-action-plan.json \
+      --endpoint http://127.0.0.1:8766/v1
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import pathlib
+import random
+import sys
+import time
+from typing import Any, Dict, Tuple
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "scripts"))
+import token_estimate  # noqa: E402
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+class MockModel:
+    """Request handling for the stub endpoint; counts requests served."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self._rng = random.Random(seed)
+
+    def complete(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        messages = [m for m in payload.get("messages") or [] if isinstance(m, dict)]
+        model = payload.get("model") or "mock"
+        last = next((str(m.get("content", "")) for m in reversed(messages) if m.get("role") == "user"), "")
+        digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+        first_line = next((line.strip() for line in last.splitlines() if line.strip()), "")
+        content = f"[mock {model}] {len(messages)} messages, request {digest}\n> {first_line[:200]}"
+        count = token_estimate.get_estimator()
+        prompt_tokens = sum(count(str(m.get("content", ""))) for m in messages)
+        completion_tokens = count(content)
+        self.requests += 1
+        return {
+            "id": f"chatcmpl-mock-{digest}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens},
+        }
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        path = path.split("?", 1)[0].rstrip("/")
+        if path == "/healthz":
+            return 200, {"status": "ok", "requests": self.requests}
+        if path in ("/v1/models", "/models"):
+            return 200, {"object": "list", "data": [{"id": "mock", "object": "model"}]}
+        if path not in ("/v1/chat/completions", "/chat/completions"):
+            return 404, {"error": {"message": f"unknown path {path}"}}
+        if method != "POST":
+            return 405, {"error": {"message": "method not allowed"}}
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError as e:
+            return 400, {"error": {"message": f"invalid JSON: {e}"}}
+        if not isinstance(payload, dict) or not isinstance(payload.get("messages"), list):
+            return 400, {"error": {"message": "'messages' must be a list"}}
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        return 200, self.complete(payload)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                method, target, version = line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = h.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                body = await reader.readexactly(length) if length else b""
+                status, payload = await self.dispatch(method, target, body)
+                data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                head = (
+                    f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}\r\n"
+                    "Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                )
+                writer.write(head.encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def start(host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                jitter: float = 0.0) -> Tuple[asyncio.AbstractServer, MockModel, str]:
+    """Start the stub on the running loop; returns (server, model, base URL). Port 0 picks a free port."""
+    model = MockModel(latency, jitter)
+    server = await asyncio.start_server(model.handle, host=host, port=port)
+    bound = server.sockets[0].getsockname()[1]
+    return server, model, f"http://{host}:{bound}/v1"
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server, _model, url = await start(args.host, args.port, args.latency, args.jitter)
+    print(f"Mock model endpoint on {url} (latency {args.latency:g} ms + up to {args.jitter:g} ms jitter)",
+          file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a deterministic OpenAI-compatible mock endpoint")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8766, help="TCP port (default: 8766)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay per completion in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay of up to N ms")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+run_workflow.py
+
+Run a multi-prompt workflow (a DAG of prompt steps) against an
+OpenAI-compatible Chat Completions endpoint.
+
+A workflow file (JSON, or TOML with the same keys) names prompt slugs and
+wires step outputs into downstream {{PLACEHOLDER}} slots:
+
+  {
+    "name": "repo-audit-to-action-plan",
+    "vars": {"GH_OWNER": "raddevops"},                 # shared by every step
+    "steps": [
+      {"id": "audit", "prompt": "repo-audit", "vars": {"REPO_URL_OR_PATH": "."}},
+      {"id": "plan", "prompt": "audit-action-plan",
+       "inputs": {"AUDIT_REPORT": "audit"},           # slot <- step output
+       "after": []}                                   # extra ordering-only deps
+    ]
+  }
+
+An input may name a list of steps; their outputs are joined with blank
+lines. Steps are rendered with scripts/render_prompt.py (required slots
+must be filled) and sent as soon as their dependencies finish, so
+independent branches run concurrently; --concurrency bounds the requests in
+flight. Requests share a keep-alive connection pool (one connection per
+concurrent request at most), so a workflow opens a handful of connections
+instead of one per step. A failed step skips everything downstream of it.
+
+Each step records queue time (waiting for a slot), request latency and
+token usage; the report is printed as a table or written as JSON.
+
+The endpoint is pluggable: --endpoint (or OPENAI_BASE_URL) and
+OPENAI_API_KEY select any OpenAI-compatible server. --mock starts
+tools/mock_model_server.py in-process instead, for offline runs.
+
+Usage:
+  python tools/run_workflow.py docs/workflows/repo-audit-to-action-plan.json --mock
+  python tools/run_workflow.py wf.json --endpoint http://127.0.0.1:8766/v1 --concurrency 4
+  python tools/run_workflow.py wf.json --model gpt-4o-mini --out .cache/runs/latest --json
+"""
+import argparse
+import asyncio
+import json
+import os
+import pathlib
+import ssl
+import sys
+import time
+import tomllib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+import render_prompt  # noqa: E402
+import mock_model_server  # noqa: E402
+
+DEFAULT_ENDPOINT = "https://api.openai.com/v1"
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 600.0
+
+
+class WorkflowError(ValueError):
+    """Invalid workflow definition."""
+
+
+@dataclass
+class Step:
+    id: str
+    prompt: str
+    vars: Dict[str, Any] = field(default_factory=dict)
+    inputs: Dict[str, List[str]] = field(default_factory=dict)
+    after: List[str] = field(default_factory=list)
+    model: Optional[str] = None
+
+    @property
+    def deps(self) -> List[str]:
+        return list(dict.fromkeys([s for sources in self.inputs.values() for s in sources] + self.after))
+
+
+@dataclass
+class Workflow:
+    name: str
+    steps: Dict[str, Step]
+    vars: Dict[str, Any]
+    order: List[str]
+
+
+def load_workflow(path: pathlib.Path) -> Workflow:
+    """Parse and check a workflow file; ``order`` is a topological order of step ids."""
+    try:
+        raw = path.read_bytes()
+        data = tomllib.loads(raw.decode("utf-8")) if path.suffix == ".toml" else json.loads(raw)
+    except (OSError, ValueError) as e:
+        raise WorkflowError(f"{path}: {e}") from e
+    if not isinstance(data, dict) or not isinstance(data.get("steps"), list) or not data["steps"]:
+        raise WorkflowError(f"{path}: 'steps' must be a non-empty list")
+    steps: Dict[str, Step] = {}
+    for i, s in enumerate(data["steps"]):
+        if not isinstance(s, dict) or not s.get("id") or not s.get("prompt"):
+            raise WorkflowError(f"{path}: steps[{i}] needs 'id' and 'prompt'")
+        if s["id"] in steps:
+            raise WorkflowError(f"{path}: duplicate step id {s['id']!r}")
+        inputs = {slot: [src] if isinstance(src, str) else list(src) for slot, src in (s.get("inputs") or {}).items()}
+        steps[s["id"]] = Step(s["id"], s["prompt"], dict(s.get("vars") or {}), inputs, list(s.get("after") or []),
+                              s.get("model"))
+    for step in steps.values():
+        unknown = [d for d in step.deps if d not in steps]
+        if unknown:
+            raise WorkflowError(f"{path}: step {step.id!r} depends on unknown step(s): {', '.join(unknown)}")
+    # Kahn's algorithm, keeping file order among ready steps.
+    pending = {sid: len(step.deps) for sid, step in steps.items()}
+    order = [sid for sid, n in pending.items() if n == 0]
+    for sid in order:
+        for other in steps.values():
+            if sid in other.deps:
+                pending[other.id] -= 1
+                if pending[other.id] == 0:
+                    order.append(other.id)
+    if len(order) != len(steps):
+        raise WorkflowError(f"{path}: dependency cycle among {', '.join(s for s in steps if s not in order)}")
+    return Workflow(str(data.get("name") or path.stem), steps, dict(data.get("vars") or {}), order)
+
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections to one origin, at most ``size`` open."""
+
+    def __init__(self, base_url: str, size: int, timeout: float = DEFAULT_TIMEOUT):
+        url = urlsplit(base_url)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported endpoint scheme: {base_url}")
+        self.host = url.hostname or "localhost"
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if url.scheme == "https" else None
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(size)
+        self.opened = 0
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        self.opened += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    async def request(self, method: str, path: str, body: bytes, headers: Dict[str, str]) -> Tuple[int, bytes]:
+        async with self._slots:
+            reused = bool(self._idle)
+            conn = self._idle.pop() if reused else await self._connect()
+            try:
+                status, data, keep = await asyncio.wait_for(self._exchange(conn, method, path, body, headers), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                conn[1].close()
+                if not reused:
+                    raise ConnectionError(f"{self.host}:{self.port}: {e}") from e
+                # The server closed an idle keep-alive connection; retry once on a fresh one.
+                conn = await self._connect()
+                status, data, keep = await asyncio.wait_for(self._exchange(conn, method, path, body, headers), self.timeout)
+            except BaseException:
+                conn[1].close()
+                raise
+            if keep:
+                self._idle.append(conn)
+            else:
+                conn[1].close()
+            return status, data
+
+    async def _exchange(self, conn, method: str, path: str, body: bytes,
+                        headers: Dict[str, str]) -> Tuple[int, bytes, bool]:
+        reader, writer = conn
+        lines = [f"{method} {self.prefix}{path} HTTP/1.1", f"Host: {self.host}", f"Content-Length: {len(body)}",
+                 "Connection: keep-alive"] + [f"{k}: {v}" for k, v in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed")
+        status = int(status_line.split()[1])
+        resp: Dict[str, str] = {}
+        while True:
+            h = await reader.readline()
+            if h in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = h.decode("latin-1").partition(":")
+            resp[name.strip().lower()] = value.strip()
+        if resp.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b"".join(chunks)
+        elif "content-length" in resp:
+            data = await reader.readexactly(int(resp["content-length"]))
+        else:
+            data = await reader.read()
+            return status, data, False
+        return status, data, resp.get("connection", "").lower() != "close"
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for _reader, writer in idle:
+            writer.close()
+        for _reader, writer in idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+
+class ChatBackend:
+    """OpenAI-compatible /chat/completions client over a ConnectionPool.
+
+    Subclass and override complete() to target a different API shape.
+    """
+
+    def __init__(self, base_url: str, api_key: Optional[str] = None, connections: int = DEFAULT_CONCURRENCY,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.pool = ConnectionPool(base_url, connections, timeout)
+        self.headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
+
+    async def complete(self, payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Return (assistant text, usage)."""
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        status, data = await self.pool.request("POST", "/chat/completions", body, self.headers)
+        try:
+            reply = json.loads(data)
+        except ValueError:
+            reply = None
+        if status != 200 or not isinstance(reply, dict):
+            detail = reply.get("error") if isinstance(reply, dict) else data[:200].decode("utf-8", "replace")
+            raise RuntimeError(f"HTTP {status}: {detail.get('message', detail) if isinstance(detail, dict) else detail}")
+        try:
+            text = reply["choices"][0]["message"]["content"] or ""
+        except (KeyError, IndexError, TypeError) as e:
+            raise RuntimeError(f"unexpected response shape: {str(reply)[:200]}") from e
+        return text, reply.get("usage") or {}
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+
+@dataclass
+class StepResult:
+    id: str
+    prompt: str
+    status: str = "pending"  # ok | failed | skipped
+    deps: List[str] = field(default_factory=list)
+    started_ms: Optional[float] = None
+    queued_ms: Optional[float] = None
+    latency_ms: Optional[float] = None
+    finished_ms: Optional[float] = None
+    usage: Dict[str, Any] = field(default_factory=dict)
+    output: Optional[str] = None
+    error: Optional[str] = None
+
+
+async def execute(workflow: Workflow, backend: ChatBackend, concurrency: int = DEFAULT_CONCURRENCY,
+                  model: Optional[str] = None, renderer: Optional[render_prompt.Renderer] = None) -> Dict[str, StepResult]:
+    """Run every step as soon as its dependencies succeed; returns results in topological order."""
+    renderer = renderer or render_prompt.Renderer()
+    limit = asyncio.Semaphore(concurrency)
+    results = {sid: StepResult(sid, workflow.steps[sid].prompt, deps=workflow.steps[sid].deps) for sid in workflow.order}
+    done = {sid: asyncio.Event() for sid in workflow.order}
+    t0 = time.perf_counter()
+
+    def since_start() -> float:
+        return round((time.perf_counter() - t0) * 1000, 1)
+
+    async def run(step: Step) -> None:
+        res = results[step.id]
+        try:
+            for dep in step.deps:
+                await done[dep].wait()
+            failed = [d for d in step.deps if results[d].status != "ok"]
+            if failed:
+                res.status, res.error = "skipped", f"upstream failed: {', '.join(failed)}"
+                return
+            variables = dict(workflow.vars, **step.vars)
+            for slot, sources in step.inputs.items():
+                variables[slot] = "\n\n".join(results[s].output or "" for s in sources)
+            try:
+                payload = renderer.render(step.prompt, variables)
+            except (KeyError, ValueError, OSError) as e:
+                res.status, res.error = "failed", e.args[0] if isinstance(e, KeyError) else str(e)
+                return
+            if step.model or model:
+                payload["model"] = step.model or model
+            res.started_ms = since_start()
+            async with limit:
+                res.queued_ms = round(since_start() - res.started_ms, 1)
+                sent = time.perf_counter()
+                try:
+                    res.output, res.usage = await backend.complete(payload)
+                    res.status = "ok"
+                except (OSError, RuntimeError, asyncio.TimeoutError, ValueError) as e:
+                    res.status, res.error = "failed", str(e) or e.__class__.__name__
+                res.latency_ms = round((time.perf_counter() - sent) * 1000, 1)
+            res.finished_ms = since_start()
+        finally:
+            done[step.id].set()
+
+    await asyncio.gather(*(run(workflow.steps[sid]) for sid in workflow.order))
+    return results
+
+
+def report(workflow: Workflow, results: Dict[str, StepResult], wall_ms: float, connections: int) -> Dict[str, Any]:
+    steps = [vars(r) for r in results.values()]
+    return {
+        "workflow": workflow.name,
+        "wall_ms": round(wall_ms, 1),
+        "sum_latency_ms": round(sum(r.latency_ms or 0 for r in results.values()), 1),
+        "connections_opened": connections,
+        "ok": all(r.status == "ok" for r in results.values()),
+        "steps": steps,
+    }
+
+
+def _print_table(rep: Dict[str, Any]) -> None:
+    width = max(4, *(len(s["id"]) for s in rep["steps"]))
+    print(f"{'Step'.ljust(width)}  Status   Start ms  Queue ms  Latency ms  Tokens  Prompt")
+    print("-" * (width + 62))
+    for s in rep["steps"]:
+        def num(v):
+            return "-" if v is None else f"{v:.1f}"
+        tokens = s["usage"].get("total_tokens", "-")
+        print(f"{s['id'].ljust(width)}  {s['status']:<7}  {num(s['started_ms']):>8}  {num(s['queued_ms']):>8}  "
+              f"{num(s['latency_ms']):>10}  {str(tokens):>6}  {s['prompt']}")
+        if s["error"]:
+            print(f"{' ' * width}  ↳ {s['error']}")
+    print(f"\nWall {rep['wall_ms']:.1f} ms, summed step latency {rep['sum_latency_ms']:.1f} ms, "
+          f"{rep['connections_opened']} connection(s) opened")
+
+
+async def _main(args: argparse.Namespace, workflow: Workflow) -> Dict[str, Any]:
+    server = None
+    endpoint = args.endpoint
+    if args.mock:
+        server, _model, endpoint = await mock_model_server.start(latency=args.mock_latency)
+    backend = ChatBackend(endpoint, None if args.mock else os.environ.get("OPENAI_API_KEY"), args.concurrency,
+                          args.timeout)
+    try:
+        started = time.perf_counter()
+        results = await execute(workflow, backend, args.concurrency, args.model)
+        return report(workflow, results, (time.perf_counter() - started) * 1000, backend.pool.opened)
+    finally:
+        await backend.close()
+        if server is not None:
+            # Let the stub's handlers see EOF before the loop shuts down.
+            await asyncio.sleep(0.01)
+            server.close()
+            await server.wait_closed()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run a DAG of prompts against an OpenAI-compatible endpoint")
+    parser.add_argument("workflow", type=pathlib.Path, help="Workflow definition (.json or .toml)")
+    parser.add_argument("--endpoint", default=os.environ.get("OPENAI_BASE_URL", DEFAULT_ENDPOINT),
+                        help="Base URL of the Chat Completions API (default: $OPENAI_BASE_URL or OpenAI)")
+    parser.add_argument("--mock", action="store_true", help="Serve the in-process mock endpoint instead")
+    parser.add_argument("--mock-latency", type=float, default=50.0, help="Mock delay per request in ms (default: 50)")
+    parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Maximum requests in flight and pooled connections (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--model", help="Override every step's target_model")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Per-request timeout in seconds")
+    parser.add_argument("--out", type=pathlib.Path, help="Write each step's output to DIR/<step>.md and report.json")
+    parser.add_argument("--json", action="store_true", help="Print the run report as JSON")
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    # The workflow path is relative to the caller's cwd; prompts resolve from the repo root.
+    path = args.workflow.resolve()
+    out = args.out.resolve() if args.out else None
+    os.chdir(REPO_ROOT)
+    try:
+        workflow = load_workflow(path)
+        renderer = render_prompt.Renderer()
+        for step in workflow.steps.values():
+            # Fail before any request is sent if a slot can never be filled.
+            provided = dict(workflow.vars, **step.vars, **dict.fromkeys(step.inputs, ""))
+            missing = renderer.template(step.prompt).missing(provided)
+            if missing:
+                raise WorkflowError(f"step {step.id!r} ({step.prompt}): missing required slots: {', '.join(missing)}")
+    except (WorkflowError, KeyError, OSError) as e:
+        print(f"Error: {e.args[0] if isinstance(e, KeyError) else e}", file=sys.stderr)
+        return 2
+    try:
+        rep = asyncio.run(_main(args, workflow))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if out:
+        out.mkdir(parents=True, exist_ok=True)
+        for s in rep["steps"]:
+            if s["output"] is not None:
+                (out / f"{s['id']}.md").write_text(s["output"], encoding="utf-8")
+        (out / "report.json").write_text(json.dumps(rep, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.json:
+        print(json.dumps(rep, ensure_ascii=False, indent=2))
+    else:
+        _print_table(rep)
+    return 0 if rep["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,56 +2,42 @@
 """
 search.py
 
-Simple tag / keyword search over prompt metadata.
+Tag / keyword search and ranked full-text queries over prompt metadata.
+
+Lookups are served from the persistent inverted index in
+.cache/search_index.json (see scripts/build_search_index.py), which is
+rebuilt automatically when tools/index.json or prompts/index.json change.
+The frontmatter scan below is only used when no index sources exist.
+
+--keyword is typo-tolerant: it ranks prompts whose title, slug or a tag
+approximately contains the text, via the trigram index in
+.cache/fuzzy_index.json (scripts/fuzzy_index.py).
+
+Token and payload-byte estimates come from prompts/index.json (see
+scripts/token_estimate.py); --min-tokens/--max-tokens/--max-bytes filter on
+them and --sort tokens|bytes orders by them.
 """
 import argparse
 import pathlib
-import re
 import sys
 import json
 from typing import List, Dict, Any
 
-FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---\n", re.DOTALL)
-
-def extract_frontmatter(text: str) -> Dict[str, Any]:
-    m = FRONTMATTER_RE.match(text)
-    if not m:
-        return {}
-    raw = m.group(1)
-    meta = {}
-    current_key = None
-    for line in raw.splitlines():
-        if not line.strip():
-            continue
-        if re.match(r"^[a-zA-Z0-9_]+:", line):
-            key, val = line.split(":", 1)
-            key = key.strip()
-            val = val.strip()
-            if val.startswith("[") and val.endswith("]"):
-                items = [x.strip().strip('"').strip("'") for x in val[1:-1].split(",") if x.strip()]
-                meta[key] = items
-            else:
-                meta[key] = val.strip('"').strip("'")
-            current_key = key
-        elif re.match(r"^\s*-\s", line) and current_key:
-            # Find the first dash and extract everything after it
-            dash_index = line.find("-")
-            meta.setdefault(current_key, []).append(line[dash_index + 1:].strip())
-    return meta
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "scripts"))
+import build_search_index  # noqa: E402
+import catalog  # noqa: E402
+import fuzzy_index  # noqa: E402
+import instrument  # noqa: E402
 
 def scan_prompts(root: pathlib.Path) -> List[Dict[str, Any]]:
     results = []
-    for path in root.rglob("*.md"):
-        if "templates" in path.parts:
-            continue
-        content = path.read_text(encoding="utf-8")
-        meta = extract_frontmatter(content)
-        if meta:
+    for rec in catalog.scan(root).docs():
+        if rec.meta:
             results.append({
-                "path": str(path),
-                "title": meta.get("title"),
-                "tags": meta.get("tags", []),
-                "last_updated": meta.get("last_updated"),
+                "path": str(rec.md_path),
+                "title": rec.meta.get("title"),
+                "tags": rec.meta.get("tags", []),
+                "last_updated": rec.meta.get("last_updated"),
             })
     return results
 
@@ -59,22 +45,70 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--tags", nargs="*", help="Filter by any of these tags")
     parser.add_argument("--all-tags", action="store_true", help="Require all provided tags to match")
-    parser.add_argument("--keyword", help="Filter by keyword in title")
+    parser.add_argument("--keyword", help="Fuzzy match on title, slug or tag (tolerates typos)")
+    parser.add_argument("--query", "-q", help="Ranked full-text query over title, tags, body and messages (BM25)")
+    parser.add_argument("--limit", type=int, help="Maximum number of results to return")
     parser.add_argument("--json", action="store_true", help="Output JSON")
     parser.add_argument("--all", action="store_true", help="Return all prompts (ignore other filters)")
+    parser.add_argument("--min-tokens", type=int, help="Only prompts estimated at >= N tokens")
+    parser.add_argument("--max-tokens", type=int, help="Only prompts estimated at <= N tokens")
+    parser.add_argument("--max-bytes", type=int, help="Only prompts whose request payload is <= N bytes")
+    parser.add_argument("--sort", choices=["tokens", "bytes"], help="Order by estimated size (ascending)")
+    parser.add_argument("--desc", action="store_true", help="With --sort, largest first")
+    instrument.add_arguments(parser)
     args = parser.parse_args()
+    instrument.start(args, "search")
 
-    base = pathlib.Path(__file__).parent.parent / "prompts"
+    root = pathlib.Path(__file__).parent.parent
+    base = root / "prompts"
     if not base.exists():
         print("Error: prompts directory not found.", file=sys.stderr)
         sys.exit(1)
 
-    prompts = scan_prompts(base)
+    with instrument.span("load search index"):
+        index = build_search_index.load_index(root)
+    if args.query:
+        if index is None:
+            print("Error: search index unavailable; run scripts/build_tools_index.py first.", file=sys.stderr)
+            sys.exit(1)
+        with instrument.span("query"):
+            prompts = [dict(doc, score=score) for score, doc in build_search_index.query(index, args.query)]
+    elif index is not None:
+        prompts = index["docs"]
+    else:
+        with instrument.span("scan prompts"):
+            prompts = scan_prompts(base)
+
+    # Fuzzy keyword hits, best first: {path: score}. None falls back to a title substring test.
+    keyword_hits = None
+    if args.keyword and not args.all:
+        with instrument.span("fuzzy keyword"):
+            fuzzy = fuzzy_index.load_index(root)
+            if fuzzy is not None:
+                keyword_hits = {r["path"]: r["score"] for r in fuzzy.search(args.keyword, limit=None)}
+        if keyword_hits is not None and not args.query:
+            by_path = {p["path"]: p for p in prompts}
+            prompts = [dict(by_path[path], score=score) for path, score in keyword_hits.items() if path in by_path]
+
+    def within_budget(p):
+        tokens, size = p.get("tokens"), p.get("bytes")
+        if args.min_tokens is not None and (tokens is None or tokens < args.min_tokens):
+            return False
+        if args.max_tokens is not None and (tokens is None or tokens > args.max_tokens):
+            return False
+        if args.max_bytes is not None and (size is None or size > args.max_bytes):
+            return False
+        return True
 
     def matches(p):
+        if not within_budget(p):
+            return False
         if args.all:
             return True
-        if args.keyword and args.keyword.lower() not in (p.get("title") or "").lower():
+        if keyword_hits is not None:
+            if p["path"] not in keyword_hits:
+                return False
+        elif args.keyword and args.keyword.lower() not in (p.get("title") or "").lower():
             return False
         if args.tags:
             p_tags = set(p.get("tags") or [])
@@ -85,7 +119,18 @@ def main():
                 return bool(p_tags & q_tags)
         return True
 
-    filtered = [p for p in prompts if matches(p)]
+    with instrument.span("filter"):
+        filtered = [
+            {k: p.get(k) for k in ("path", "title", "tags", "last_updated", "tokens", "bytes", "score") if k in p}
+            for p in prompts if matches(p)
+        ]
+    if args.sort:
+        # Prompts without estimates (no JSON spec) sort last either way.
+        sized = [p for p in filtered if p.get(args.sort) is not None]
+        sized.sort(key=lambda p: p[args.sort], reverse=args.desc)
+        filtered = sized + [p for p in filtered if p.get(args.sort) is None]
+    if args.limit is not None:
+        filtered = filtered[:args.limit]
 
     if args.json:
         print(json.dumps(filtered, indent=2))
@@ -97,10 +142,16 @@ def main():
 
     width_path = max(len(p["path"]) for p in filtered)
     width_title = max(len(str(p["title"] or "")) for p in filtered)
-    print(f"{'Path'.ljust(width_path)}  {'Title'.ljust(width_title)}  Tags")
-    print("-" * (width_path + width_title + 8))
+    scored = bool(args.query or keyword_hits)
+    score_col = "Score  " if scored else ""
+    show_size = bool(args.sort or args.min_tokens is not None or args.max_tokens is not None or args.max_bytes is not None)
+    size_col = "Tokens  " if show_size else ""
+    print(f"{score_col}{size_col}{'Path'.ljust(width_path)}  {'Title'.ljust(width_title)}  Tags")
+    print("-" * (len(score_col) + len(size_col) + width_path + width_title + 8))
     for p in filtered:
-        print(f"{p['path'].ljust(width_path)}  {str(p['title'] or '').ljust(width_title)}  {', '.join(p['tags'])}")
+        score = f"{p['score']:<5.2f}  " if scored else ""
+        size = f"{str(p.get('tokens') or '-'):<6}  " if show_size else ""
+        print(f"{score}{size}{p['path'].ljust(width_path)}  {str(p['title'] or '').ljust(width_title)}  {', '.join(p['tags'])}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file